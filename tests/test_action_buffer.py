@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from turtle_game.action_buffer import apply_actions, numpy, NO_ACTION, MOVE, TURN, SET_HEADING
+from turtle_game.state_store import StateStore
+
+
+def filled_store(seed: int) -> StateStore:
+    generator = random.Random(seed)
+    state_store = StateStore()
+    for _ in range(200):
+        slot = state_store.add(generator.uniform(-350, 350), generator.uniform(-350, 350), generator.uniform(0, 360), 100.0)
+        state_store.action[slot] = generator.choice((NO_ACTION, MOVE, TURN, SET_HEADING))
+        state_store.action_value[slot] = generator.uniform(-720, 720)
+    return state_store
+
+
+@pytest.mark.skipif(numpy is None, reason="NumPy is not installed")
+def test_scalar_and_vectorized_apply_the_same_actions():
+    scalar = filled_store(7)
+    vectorized = filled_store(7)
+    expected_applied = sum(1 for opcode in scalar.action if opcode != NO_ACTION)
+    assert apply_actions(scalar) == expected_applied
+    assert apply_actions(vectorized, vectorized=True) == expected_applied
+    for column in ("x", "y", "heading"):
+        assert getattr(vectorized, column).tolist() == pytest.approx(getattr(scalar, column).tolist(), abs=1e-9)
+    assert list(scalar.action) == list(vectorized.action) == [NO_ACTION] * scalar.size()
+    assert all(0 <= heading < 360 for heading in vectorized.heading)
+
+
+def test_actions_are_consumed_once():
+    state_store = filled_store(8)
+    apply_actions(state_store)
+    before = (state_store.x.tolist(), state_store.y.tolist(), state_store.heading.tolist())
+    assert apply_actions(state_store) == 0
+    assert (state_store.x.tolist(), state_store.y.tolist(), state_store.heading.tolist()) == before
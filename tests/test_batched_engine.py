@@ -0,0 +1,51 @@
+import os
+import random
+from contextlib import redirect_stdout
+
+import pytest
+
+from turtle_game.action_buffer import FORWARD, SETHEADING
+from turtle_game.batched_engine import BatchedEngine
+from turtle_game.engine import Engine
+from turtle_game.event_stream import EventStream
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_placement_function, default_movement_function
+from turtle_game.world import World
+
+numpy = pytest.importorskip("numpy")
+
+
+def team_movement_function(view, world):
+    is_prey = numpy.asarray(view.is_prey, dtype=bool)
+    threat_angles, threat_distances = (numpy.asarray(values) for values in view.nearest_threats())
+    prey_angles, prey_distances = (numpy.asarray(values) for values in view.nearest_enemy_prey())
+    energy = numpy.asarray(view.energy)
+    flee = is_prey & (threat_distances < 80) & (energy >= 20)
+    chase = ~is_prey & (energy < 30)
+    actions = numpy.where(flee | chase, SETHEADING, FORWARD)
+    values = numpy.where(flee, threat_angles + 180, numpy.where(chase, prey_angles, numpy.asarray(view.max_speed)))
+    return actions, values
+
+
+def players():
+    return [Player(name, "red", "blue", default_placement_function, default_placement_function, default_movement_function, default_movement_function,
+                   team_movement_function=team_movement_function, batched_team_movement_function=team_movement_function) for name in ("a", "b")]
+
+
+def test_batched_engine_matches_engine_for_each_seed():
+    seeds = [0, 1, 2]
+    # a batch of two leaves the last seed in a batch of its own
+    batched = {result.seed: result for result in BatchedEngine(World(300, 300, 30, False), players(), seeds, 2, 15, 3, max_ticks=400).run()}
+    assert sorted(batched) == seeds
+    for seed in seeds:
+        random.seed(seed)
+        events = EventStream([])
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            engine = Engine(World(300, 300, 30, False), players(), 15, 3, cooperative=True, max_ticks=400, events=events)
+            winner = engine.run()
+        events.close()
+        result = batched[seed]
+        assert result.ticks == engine.tick
+        assert result.winner == (winner.team_name if winner is not None else None)
+        assert result.survivors == engine.survivors
+        assert result.placement_relocations == engine.placement_relocations
@@ -0,0 +1,32 @@
+import pytest
+
+from turtle_game.elo_ratings import EloRatings
+
+
+def test_equal_ratings_expect_a_draw():
+    ratings = EloRatings(["a", "b"])
+    assert ratings.expected_score("a", "b") == pytest.approx(.5)
+
+
+def test_four_hundred_points_is_ten_to_one():
+    ratings = EloRatings(["a", "b"])
+    ratings.ratings["a"] = 1900
+    assert ratings.expected_score("a", "b") == pytest.approx(10 / 11)
+    assert ratings.expected_score("a", "b") + ratings.expected_score("b", "a") == pytest.approx(1)
+
+
+def test_update_moves_k_times_the_surprise_and_keeps_the_total():
+    ratings = EloRatings(["a", "b"], k_factor=32)
+    ratings.update("a", "b", 1.0)
+    assert ratings.ratings == pytest.approx({"a": 1516, "b": 1484})
+    expected = ratings.expected_score("b", "a")
+    ratings.update("b", "a", 0.5)
+    assert ratings.ratings["b"] == pytest.approx(1484 + 32 * (.5 - expected))
+    assert sum(ratings.ratings.values()) == pytest.approx(3000)
+
+
+def test_ranking_is_best_first():
+    ratings = EloRatings(["a", "b", "c"], initial_rating=1200)
+    ratings.update("c", "a", 1.0)
+    ratings.update("b", "a", 0.5)
+    assert [name for name, rating in ratings.ranking()] == ["c", "b", "a"]
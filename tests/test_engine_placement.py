@@ -0,0 +1,34 @@
+import os
+import random
+from contextlib import redirect_stdout
+
+from turtle_game.engine import Engine
+from turtle_game.event_stream import EventStream
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_movement_function
+from turtle_game.world import World
+
+
+def origin_placement_function(world, number):
+    return 0.0, 0.0
+
+
+def chasing_movement_function(turtle, world):
+    turtle.turn_to_closest_enemy_prey()
+    turtle.forward(turtle.max_speed())
+
+
+def test_first_tick_is_set_up_when_placement_gives_up():
+    for vectorized in (False, True):
+        random.seed(2)
+        players = [Player(name, "red", "blue", origin_placement_function, origin_placement_function, default_movement_function, chasing_movement_function) for name in ("a", "b")]
+        events = EventStream([])
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            engine = Engine(World(700, 700, 30, False), players, 5, 1, vectorized=vectorized, cooperative=True, max_ticks=1, max_placement_rounds=0, events=events)
+            assert engine.neighbors is not None
+            assert engine.placement_relocations == 0
+            engine.run()
+        events.close()
+        # every prey started inside the other team's kill radius, so none survive the first tick
+        assert engine.tick == 1
+        assert sum(turtle.is_prey() for turtle in engine.world.turtles) == 0
@@ -0,0 +1,89 @@
+import json
+
+from turtle_game.event_sinks import ConsoleEventSink, JsonLinesEventSink, AliveCountsSink, SurvivalCurves, read_alive_counts, survival_curves_from_file
+from turtle_game.event_stream import EventStream
+from turtle_game.match_events import TickEvent, KillEvent, FailsafeEvent, PlacementEvent, TeamEliminatedEvent, MatchEndEvent
+
+ALIVE = [{"a": 4, "b": 4}, {"a": 4, "b": 3}, {"a": 2, "b": 3}, {"a": 0, "b": 3}]
+
+
+def match_events() -> list:
+    events = [PlacementEvent(0, 2)]
+    for tick, prey_alive in enumerate(ALIVE, 1):
+        events.append(TickEvent(tick, prey_alive))
+    events.insert(3, KillEvent(2, 7, "a", 12, "b"))
+    events.insert(4, FailsafeEvent(2, "b", "Prey movement function failsafe 2 triggered"))
+    events.append(TeamEliminatedEvent(4, "a"))
+    events.append(MatchEndEvent(4, "b", ALIVE[-1]))
+    return events
+
+
+def test_console_sink_prints_changes_and_notices(capsys):
+    sink = ConsoleEventSink()
+    sink.write(match_events())
+    sink.close()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Placement relocations: 2"
+    assert "Prey movement function failsafe 2 triggered" in lines
+    assert [line.split()[:2] for line in lines if line.startswith(("a ", "b ")) and "eliminated" not in line] == [["a", "4"], ["b", "3"], ["a", "2"], ["b", "3"], ["a", "0"], ["b", "3"]]
+    assert "a eliminated at tick 4" in lines
+    assert lines[-1] == "Winner: b"
+
+
+def test_json_lines_sink_writes_one_object_per_event(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    sink = JsonLinesEventSink(path)
+    sink.write(match_events()[:3])
+    sink.write(match_events()[3:])
+    sink.close()
+    with open(path) as file:
+        written = [json.loads(line) for line in file]
+    assert written == [event.to_dict() for event in match_events()]
+    assert [entry["kind"] for entry in written].count("tick") == len(ALIVE)
+
+
+def test_alive_counts_round_trip(tmp_path):
+    path = str(tmp_path / "alive.tgac")
+    sink = AliveCountsSink(path)
+    sink.write(match_events())
+    sink.close()
+    ticks, columns = read_alive_counts(path)
+    assert list(ticks) == [1, 2, 3, 4]
+    assert {team_name: list(column) for team_name, column in columns.items()} == {"a": [4, 4, 2, 0], "b": [4, 3, 3, 3]}
+    curves = survival_curves_from_file(path)
+    assert curves.curve("a") == [(1, 4), (3, 2), (4, 0)]
+
+
+def test_survival_curves():
+    curves = SurvivalCurves()
+    curves.write(match_events())
+    assert curves.teams() == ["a", "b"]
+    assert curves.winner == "b"
+    assert curves.ticks == 4
+    assert curves.curve("b") == [(1, 4), (2, 3)]
+    assert curves.alive_at("a", 0) == 0
+    assert curves.alive_at("a", 2) == 4
+    assert curves.alive_at("a", 10) == 0
+    assert curves.half_life("a") == 3
+    assert curves.half_life("b") is None
+    assert curves.elimination_tick("a") == 4
+    assert curves.elimination_tick("b") is None
+
+
+class FailingSink:
+    def write(self, events: list):
+        raise ValueError("disk full")
+
+    def close(self):
+        pass
+
+
+def test_stream_delivers_in_order_past_a_failing_sink(capsys):
+    curves = SurvivalCurves()
+    events = EventStream([FailingSink(), curves])
+    for event in match_events():
+        events.emit(event)
+    events.close()
+    assert curves.curve("a") == [(1, 4), (3, 2), (4, 0)]
+    assert curves.winner == "b"
+    assert "Event sink failsafe triggered" in capsys.readouterr().out
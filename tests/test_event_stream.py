@@ -0,0 +1,34 @@
+import os
+import random
+from contextlib import redirect_stdout
+
+from turtle_game.event_stream import EventStream
+from turtle_game.match import run_match
+from turtle_game.match_events import MatchEndEvent
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_placement_function, default_movement_function
+
+
+class RecordingSink:
+    def __init__(self):
+        self.events: list = []
+        self.closed: bool = False
+
+    def write(self, events: list):
+        self.events.extend(events)
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_leaves_a_caller_stream_open():
+    sink = RecordingSink()
+    events = EventStream([sink])
+    players = [Player(name, "red", "blue", default_placement_function, default_placement_function, default_movement_function, default_movement_function) for name in ("a", "b")]
+    random.seed(4)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        run_match(players, headless=True, cooperative=True, max_ticks=5, events=events)
+    assert not sink.closed
+    events.close()
+    assert sink.closed
+    assert isinstance(sink.events[-1], MatchEndEvent)
@@ -0,0 +1,71 @@
+import random
+
+from turtle_game.live_state import LiveState
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_placement_function, default_movement_function
+
+
+class FakeTurtle:
+    def __init__(self, team_name: str, is_prey: bool):
+        self.__team_name: str = team_name
+        self.__is_prey: bool = is_prey
+        self.hidden: bool = False
+
+    def team_name(self) -> str:
+        return self.__team_name
+
+    def is_prey(self) -> bool:
+        return self.__is_prey
+
+    def hide(self):
+        self.hidden = True
+
+
+class FakeWorld:
+    def __init__(self, turtles):
+        self.turtles = list(turtles)
+        self.prey = [turtle for turtle in turtles if turtle.is_prey()]
+
+
+def live_state(prey_per_team: int, predators_per_team: int):
+    players = [Player(name, "red", "blue", default_placement_function, default_placement_function, default_movement_function, default_movement_function) for name in ("a", "b")]
+    turtles = [FakeTurtle(player.team_name, is_prey) for player in players for is_prey in [True] * prey_per_team + [False] * predators_per_team]
+    return LiveState(FakeWorld(turtles), players), turtles
+
+
+def test_compact_swap_removes_only_the_dead():
+    state, turtles = live_state(10, 3)
+    generator = random.Random(6)
+    alive = list(turtles)
+    for _ in range(4):
+        dead = generator.sample(alive, 5)
+        for turtle in dead:
+            state.kill(turtle)
+            alive.remove(turtle)
+        assert state.compact() == 5
+        assert set(state.world.turtles) == set(alive) and len(state.world.turtles) == len(alive)
+        assert set(state.world.prey) == {turtle for turtle in alive if turtle.is_prey()}
+        assert len(state.world.prey) == sum(turtle.is_prey() for turtle in alive)
+        assert all(turtle.hidden for turtle in turtles if turtle not in alive)
+    assert state.compact() == 0
+
+
+def test_counters_follow_kills():
+    state, turtles = live_state(2, 1)
+    assert state.prey_alive == {"a": 2, "b": 2}
+    assert state.predators_alive == {"a": 1, "b": 1}
+    assert state.teams_with_prey == 2
+    assert state.winning_player() is None
+    a_prey = [turtle for turtle in turtles if turtle.team_name() == "a" and turtle.is_prey()]
+    b_predator = [turtle for turtle in turtles if turtle.team_name() == "b" and not turtle.is_prey()]
+    state.kill(b_predator[0])
+    state.kill(a_prey[0])
+    state.compact()
+    assert state.prey_alive == {"a": 1, "b": 2}
+    assert state.predators_alive == {"a": 1, "b": 0}
+    assert state.teams_with_prey == 2
+    state.kill(a_prey[1])
+    state.compact()
+    assert state.prey_alive["a"] == 0
+    assert state.teams_with_prey == 1
+    assert state.winning_player().team_name == "b"
@@ -0,0 +1,53 @@
+import os
+import random
+from contextlib import redirect_stdout
+
+from turtle_game.event_stream import EventStream
+from turtle_game.match import create_match_engine
+from turtle_game.match_replay import MatchReplay
+from turtle_game.match_snapshot import read_snapshot
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_placement_function, default_movement_function
+
+
+def chasing_movement_function(turtle, world):
+    turtle.turn_to_closest_enemy_prey()
+    yield
+    turtle.forward(turtle.max_speed())
+    yield
+
+
+def players():
+    return [Player(name, "red", "blue", default_placement_function, default_placement_function, default_movement_function, chasing_movement_function) for name in ("a", "b")]
+
+
+def quiet_engine(**options):
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return create_match_engine(players(), world_width=300, world_height=300, headless=True, cooperative=True, events=EventStream([]), **options)
+
+
+def test_snapshot_resume_record_round_trip(tmp_path):
+    snapshot_path = str(tmp_path / "match.snap")
+    record_path = str(tmp_path / "match.tgr")
+    random.seed(3)
+    engine = quiet_engine(max_ticks=40, snapshot_path=snapshot_path, snapshot_every=40)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        engine.run()
+    assert engine.tick == 40
+    assert len(engine.world.turtles) < len(engine.turtles_by_slot)
+
+    resumed = quiet_engine(max_ticks=60, resume_path=snapshot_path, record_path=record_path)
+    assert resumed.tick == 40
+    assert resumed.live_state.prey_alive == engine.live_state.prey_alive
+    assert resumed.snapshot() == read_snapshot(snapshot_path)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        resumed.run()
+
+    replay = MatchReplay(record_path)
+    try:
+        assert replay.turtle_count() == len(resumed.turtles_by_slot)
+        assert replay.tick_count() == resumed.tick - 40 + 1
+        assert replay.alive_counts(0) == [engine.live_state.prey_alive[player.team_name] for player in resumed.players]
+        assert replay.alive_counts(-1) == [resumed.live_state.prey_alive[player.team_name] for player in resumed.players]
+    finally:
+        replay.close()
@@ -0,0 +1,56 @@
+import random
+from math import sqrt
+
+from turtle_game.spatial_index import SpatialIndex
+
+
+class Point:
+    def __init__(self, x: float, y: float, is_prey: bool):
+        self.x: float = x
+        self.y: float = y
+        self.prey: bool = is_prey
+
+    def position(self):
+        return self.x, self.y
+
+
+def random_points(count: int):
+    generator = random.Random(5)
+    return [Point(generator.uniform(-350, 350), generator.uniform(-350, 350), generator.random() < .8) for _ in range(count)]
+
+
+def brute_force(points, x: float, y: float, predicate=None):
+    return sorted((sqrt((point.x - x) ** 2 + (point.y - y) ** 2), point) for point in points if predicate is None or predicate(point))
+
+
+def test_within_matches_brute_force():
+    points = random_points(300)
+    index = SpatialIndex(30)
+    index.rebuild(points)
+    for point in points[:50]:
+        for radius in (0.5, 30, 75):
+            for predicate in (None, lambda other: other.prey):
+                expected = {id(other) for distance, other in brute_force(points, point.x, point.y, predicate) if distance < radius}
+                found = index.within(point.x, point.y, radius, predicate)
+                assert {id(other) for distance, other in found} == expected
+                assert all(distance < radius for distance, other in found)
+
+
+def test_k_nearest_matches_brute_force():
+    points = random_points(300)
+    index = SpatialIndex(30)
+    index.rebuild(points)
+    for x, y in [(point.x, point.y) for point in points[:50]] + [(1000.0, -1000.0), (0.0, 0.0)]:
+        for k in (1, 4, 20, 400):
+            for predicate in (None, lambda other: not other.prey):
+                expected = brute_force(points, x, y, predicate)[:k]
+                found = index.k_nearest(x, y, k, predicate)
+                assert [other for distance, other in found] == [other for distance, other in expected]
+                assert [distance for distance, other in found] == [distance for distance, other in expected]
+
+
+def test_empty_index_finds_nothing():
+    index = SpatialIndex(30)
+    index.rebuild([])
+    assert index.within(0, 0, 100) == []
+    assert index.k_nearest(0, 0, 3) == []
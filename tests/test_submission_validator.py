@@ -0,0 +1,87 @@
+from turtle_game.submission_validator import validate_submissions, PLACEMENT_FUNCTIONS, FUNCTIONS
+
+GOOD = """
+def prey_placement_function(world, number):
+    return world.random_location()
+
+def predator_placement_function(world, number):
+    return world.random_location()
+
+def prey_movement_function(turtle, world):
+    turtle.forward(1)
+
+def predator_movement_function(turtle, world):
+    turtle.forward(1)
+"""
+
+RAISING = """
+def prey_placement_function(world, number):
+    raise ValueError("no place")
+
+def predator_placement_function(world, number):
+    return world.random_location()
+
+def prey_movement_function(turtle, world):
+    raise ValueError("no neighbours")
+
+predator_movement_function = 5
+"""
+
+HANGING = """
+def prey_placement_function(world, number):
+    return world.random_location()
+
+def predator_placement_function(world, number):
+    return world.random_location()
+
+def prey_movement_function(turtle, world):
+    while True:
+        pass
+
+def predator_movement_function(turtle, world):
+    turtle.forward(1)
+"""
+
+BROKEN = """
+raise ImportError("broken on purpose")
+"""
+
+
+def validation_package(tmp_path, monkeypatch):
+    package = tmp_path / "validator_fixtures"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for name, source in (("good", GOOD), ("raising", RAISING), ("hanging", HANGING), ("broken", BROKEN)):
+        (package / (name + ".py")).write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return package.name
+
+
+def test_validation_rules(tmp_path, monkeypatch):
+    package_name = validation_package(tmp_path, monkeypatch)
+    reports = validate_submissions(["good", "raising", "hanging", "broken"], package_name, workers=2, time_limit=1, calls=5)
+
+    assert reports["good"].import_error is None
+    assert all(reports["good"].passed(name) for name in FUNCTIONS)
+    assert all(len(reports["good"].functions[name].latencies) == 5 for name in FUNCTIONS)
+
+    # a placement function that always raises fails, a movement function that always raises only reports it
+    raising = reports["raising"]
+    assert not raising.passed("prey_placement_function")
+    assert raising.functions["prey_placement_function"].exceptions == 5
+    assert raising.passed("predator_placement_function")
+    assert raising.passed("prey_movement_function")
+    assert raising.functions["prey_movement_function"].exceptions == 5
+    assert not raising.passed("predator_movement_function")
+    assert raising.functions["predator_movement_function"].error == "missing or not callable"
+
+    # the hanging function is killed and the functions after it are still validated
+    hanging = reports["hanging"]
+    assert all(hanging.passed(name) for name in PLACEMENT_FUNCTIONS)
+    assert not hanging.passed("prey_movement_function")
+    assert hanging.functions["prey_movement_function"].error == "timed out or exceeded the cpu limit"
+    assert hanging.passed("predator_movement_function")
+
+    broken = reports["broken"]
+    assert "broken on purpose" in broken.import_error
+    assert not any(broken.passed(name) for name in FUNCTIONS)
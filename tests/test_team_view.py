@@ -0,0 +1,29 @@
+from math import inf, nan
+
+from turtle_game.action_buffer import WAIT, FORWARD, BACKWARD, LEFT, RIGHT, SETHEADING
+from turtle_game.team_view import validated_team_actions
+
+
+def test_valid_actions_pass_through():
+    actions = [WAIT, FORWARD, BACKWARD, LEFT, RIGHT, SETHEADING]
+    values = [0, 3, 2.5, -45, 90, 400]
+    assert validated_team_actions((actions, values), 6) == [(WAIT, 0.0), (FORWARD, 3.0), (BACKWARD, 2.5), (LEFT, -45.0), (RIGHT, 90.0), (SETHEADING, 400.0)]
+
+
+def test_malformed_results_are_rejected():
+    assert validated_team_actions(None, 2) is None
+    assert validated_team_actions([FORWARD, FORWARD], 2) is None
+    assert validated_team_actions(([FORWARD], [1.0]), 2) is None
+    assert validated_team_actions(([FORWARD, FORWARD], [1.0]), 2) is None
+    assert validated_team_actions((FORWARD, 1.0), 1) is None
+    assert validated_team_actions(([FORWARD], [1.0], [2.0]), 1) is None
+
+
+def test_bad_entries_become_waits():
+    actions = [7, -1, "left", None, FORWARD, BACKWARD, RIGHT, LEFT, FORWARD, 1e400]
+    values = [1.0, 1.0, 1.0, 1.0, -2.0, -0.5, nan, inf, "fast", 1.0]
+    assert validated_team_actions((actions, values), len(actions)) == [(WAIT, 0.0)] * len(actions)
+
+
+def test_actions_are_truncated_to_integers():
+    assert validated_team_actions(([1.9, "2"], [4, "1.5"]), 2) == [(FORWARD, 4.0), (BACKWARD, 1.5)]
@@ -0,0 +1,48 @@
+import os
+import random
+from contextlib import redirect_stdout
+
+from turtle_game.benchmark import synthetic_players
+from turtle_game.engine import Engine
+from turtle_game.event_stream import EventStream
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_placement_function
+from turtle_game.world import World
+
+
+def forward_movement_function(turtle, world):
+    turtle.forward(turtle.max_speed())
+
+
+def busy_movement_function(turtle, world):
+    while True:
+        pass
+
+
+def run_engine(players, prey_per_team, predators_per_team, cooperative, max_ticks):
+    random.seed(1)
+    events = EventStream([])
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        engine = Engine(World(1400, 1400, 30, False), players, prey_per_team, predators_per_team, safe_mode=True, turn_budget_ms=50,
+                        cooperative=cooperative, max_ticks=max_ticks, events=events)
+        engine.run()
+    events.close()
+    return engine
+
+
+def test_many_trivial_threaded_turtles_are_never_skipped():
+    # 600 threads contend for the GIL, which used to eat the wall clock budget of cheap turtles
+    engine = run_engine(synthetic_players(4), 125, 25, False, 100)
+    assert engine.tick == 100
+    assert sum(engine.watchdog.skipped_turns.values()) == 0
+
+
+def test_busy_loop_is_skipped_and_fast_turtles_are_left_alone():
+    for cooperative in (True, False):
+        players = [Player("busy", "red", "blue", default_placement_function, default_placement_function, busy_movement_function, forward_movement_function),
+                   Player("fast", "red", "blue", default_placement_function, default_placement_function, forward_movement_function, forward_movement_function)]
+        engine = run_engine(players, 2, 1, cooperative, 8)
+        assert engine.tick == 8
+        skipped = {turtle: count for turtle, count in engine.watchdog.skipped_turns.items() if count}
+        assert {(turtle.team_name(), turtle.is_prey()) for turtle in skipped} == {("busy", True)}
+        assert all(count == engine.watchdog.max_skipped_turns for count in skipped.values())
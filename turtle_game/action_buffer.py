@@ -0,0 +1,63 @@
+from math import cos, sin, radians
+
+from turtle_game.state_store import StateStore
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NO_ACTION = 0
+MOVE = 1
+TURN = 2
+SET_HEADING = 3
+
+# what a team movement function returns for each of its turtles
+WAIT = 0
+FORWARD = 1
+BACKWARD = 2
+LEFT = 3
+RIGHT = 4
+SETHEADING = 5
+TEAM_ACTIONS = (WAIT, FORWARD, BACKWARD, LEFT, RIGHT, SETHEADING)
+
+
+def apply_actions(state_store: StateStore, vectorized: bool=False) -> int:
+    if vectorized and numpy is not None:
+        return apply_actions_vectorized(state_store)
+    action = state_store.action
+    value = state_store.action_value
+    heading = state_store.heading
+    applied = 0
+    for slot, opcode in enumerate(action):
+        if opcode == NO_ACTION:
+            continue
+        if opcode == MOVE:
+            angle = radians(heading[slot])
+            state_store.x[slot] += value[slot] * cos(angle)
+            state_store.y[slot] += value[slot] * sin(angle)
+        elif opcode == TURN:
+            heading[slot] = (heading[slot] + value[slot]) % 360
+        else:
+            heading[slot] = value[slot] % 360
+        action[slot] = NO_ACTION
+        applied += 1
+    return applied
+
+
+def apply_actions_vectorized(state_store: StateStore) -> int:
+    action = numpy.frombuffer(state_store.action, dtype=numpy.int8)
+    value = numpy.frombuffer(state_store.action_value)
+    heading = numpy.frombuffer(state_store.heading)
+    move = action == MOVE
+    if move.any():
+        angle = numpy.radians(heading[move])
+        numpy.frombuffer(state_store.x)[move] += value[move] * numpy.cos(angle)
+        numpy.frombuffer(state_store.y)[move] += value[move] * numpy.sin(angle)
+    turn = action == TURN
+    heading[turn] = (heading[turn] + value[turn]) % 360
+    set_heading = action == SET_HEADING
+    heading[set_heading] = value[set_heading] % 360
+    applied = int(numpy.count_nonzero(action))
+    action[:] = NO_ACTION
+    return applied
@@ -0,0 +1,61 @@
+from typing import Optional, Tuple
+
+from turtle_game.action_buffer import WAIT, FORWARD, BACKWARD, TEAM_ACTIONS
+from turtle_game.relative_location import ENEMY_PREY, ENEMY_PREDATOR
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def read_only(values):
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+class BatchTeamView:
+    def __init__(self, team_name: str, slots: slice, engine):
+        self.team_name: str = team_name
+        self.__slots: slice = slots
+        self.__engine = engine
+        self.__nearest = {}
+        self.is_prey = read_only(numpy.broadcast_to(engine.is_prey[slots], engine.alive[:, slots].shape))
+        self.alive = read_only(engine.alive[:, slots])
+        self.x = read_only(engine.x[:, slots])
+        self.y = read_only(engine.y[:, slots])
+        self.heading = read_only(engine.heading[:, slots])
+        self.energy = read_only(engine.energy[:, slots])
+        self.max_speed = read_only(numpy.broadcast_to(engine.max_speed[slots], engine.alive[:, slots].shape))
+
+    def __len__(self) -> int:
+        return self.alive.shape[1]
+
+    def __nearest_enemies(self, category: int) -> Tuple[object, object]:
+        if category not in self.__nearest:
+            angles, distances = self.__engine.closest(self.__slots, category)
+            self.__nearest[category] = (read_only(angles), read_only(distances))
+        return self.__nearest[category]
+
+    def nearest_threats(self) -> Tuple[object, object]:
+        return self.__nearest_enemies(ENEMY_PREDATOR)
+
+    def nearest_enemy_prey(self) -> Tuple[object, object]:
+        return self.__nearest_enemies(ENEMY_PREY)
+
+
+def validated_batch_actions(result, shape: Tuple[int, int]) -> Optional[Tuple[object, object]]:
+    try:
+        actions, values = result
+        actions = numpy.asarray(actions, dtype=numpy.float64)
+        values = numpy.asarray(values, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        return None
+    if actions.shape != shape or values.shape != shape:
+        return None
+    actions = numpy.trunc(actions)
+    invalid = ~numpy.isin(actions, TEAM_ACTIONS) | ~numpy.isfinite(values)
+    actions = numpy.where(invalid, WAIT, actions).astype(numpy.int8)
+    invalid |= ((actions == FORWARD) | (actions == BACKWARD)) & (values < 0)
+    return numpy.where(invalid, WAIT, actions).astype(numpy.int8), numpy.where(invalid, 0.0, values)
@@ -0,0 +1,305 @@
+from random import random, seed as seed_random
+from typing import Tuple, List, Callable, Dict, Optional
+
+from turtle_game.action_buffer import WAIT, FORWARD, BACKWARD, LEFT, RIGHT, SETHEADING
+from turtle_game.batch_team_view import BatchTeamView, validated_batch_actions, numpy
+from turtle_game.event_stream import EventStream, report_failsafe
+from turtle_game.match_result import MatchResult
+from turtle_game.player import Player
+from turtle_game.relative_location import ENEMY_PREY
+from turtle_game.world import World
+
+
+class BatchedEngine:
+    def __init__(self, world: World, players: List[Player], seeds: List[int], batch_size: int=64, prey_per_team: int=125, predators_per_team: int=25, max_ticks: Optional[int]=5000, max_placement_rounds: int=100, events: Optional[EventStream]=None, pairing: Optional[Tuple[str, ...]]=None):
+        if numpy is None:
+            raise ImportError("The batched engine needs NumPy")
+        self.events: Optional[EventStream] = events
+        self.world: World = world
+        self.players: List[Player] = players
+        self.pairing: Tuple[str, ...] = tuple(pairing) if pairing is not None else tuple(player.team_name for player in players)
+        self.prey_per_team: int = prey_per_team
+        self.predators_per_team: int = predators_per_team
+        self.max_ticks: Optional[int] = max_ticks
+        self.max_placement_rounds: int = max_placement_rounds
+        self.predator_kill_radius: int = world.predator_kill_radius()
+        self.results: List[MatchResult] = []
+        self.team_movement_functions: Dict[str, Callable[[BatchTeamView, World], object]] = {}
+        self.__seeds: List[int] = list(seeds)
+        self.__next_seed: int = 0
+        self.__enemy_columns: Dict[Tuple[int, int], object] = {}
+
+        # slots are laid out per player, prey first, exactly like the turtles Engine creates
+        team_size = prey_per_team + predators_per_team
+        count = len(players) * team_size
+        self.team_slots: Dict[str, slice] = {}
+        self.team_prey_slots: Dict[str, slice] = {}
+        self.is_prey = numpy.zeros(count, dtype=bool)
+        self.team = numpy.zeros(count, dtype=numpy.intp)
+        self.max_speed = numpy.zeros(count)
+        for index, player in enumerate(players):
+            if player.team_name in self.team_slots:
+                raise ValueError("team names must be unique, "+player.team_name+" appears twice")
+            start = index * team_size
+            self.team_slots[player.team_name] = slice(start, start + team_size)
+            self.team_prey_slots[player.team_name] = slice(start, start + prey_per_team)
+            self.is_prey[start:start + prey_per_team] = True
+            self.team[start:start + team_size] = index
+            self.max_speed[start:start + prey_per_team] = 9
+            self.max_speed[start + prey_per_team:start + team_size] = 12
+            if player.batched_team_movement_function is not None:
+                self.team_movement_functions[player.team_name] = player.batched_team_movement_function
+            else:
+                report_failsafe(events, player.team_name, "Batched engine failsafe triggered ("+player.team_name+" has no batched team movement function, its turtles will wait)")
+        self.prey_slots = numpy.flatnonzero(self.is_prey)
+        self.predator_slots = numpy.flatnonzero(~self.is_prey)
+        # enemy[i, j] is True when predator i and prey j belong to different teams
+        self.enemy = self.team[self.predator_slots][:, None] != self.team[self.prey_slots][None, :]
+
+        batch_size = max(0, min(batch_size, len(self.__seeds)))
+        shape = (batch_size, count)
+        self.x = numpy.zeros(shape)
+        self.y = numpy.zeros(shape)
+        self.heading = numpy.zeros(shape)
+        self.energy = numpy.zeros(shape)
+        self.alive = numpy.zeros(shape, dtype=bool)
+        self.just_ate = numpy.zeros(shape, dtype=bool)
+        self.active = numpy.zeros(batch_size, dtype=bool)
+        self.tick = numpy.zeros(batch_size, dtype=numpy.intp)
+        self.row_seeds: List[Optional[int]] = [None] * batch_size
+        self.survivors: List[List[Tuple[int, Dict[str, int]]]] = [[] for _ in range(batch_size)]
+        self.placement_relocations: List[int] = [0] * batch_size
+        for row in range(batch_size):
+            self.start_world(row)
+
+    def batch_size(self) -> int:
+        return len(self.active)
+
+    def start_world(self, row: int) -> bool:
+        if self.__next_seed >= len(self.__seeds):
+            self.active[row] = False
+            return False
+        seed = self.__seeds[self.__next_seed]
+        self.__next_seed += 1
+        seed_random(seed)
+        slot = 0
+        for player in self.players:
+            for is_prey, count in ((True, self.prey_per_team), (False, self.predators_per_team)):
+                for x, y in self.placement_locations(player, is_prey, count):
+                    self.x[row, slot] = x
+                    self.y[row, slot] = y
+                    self.heading[row, slot] = random() * 360
+                    slot += 1
+        self.energy[row] = 5
+        self.alive[row] = True
+        self.just_ate[row] = False
+        self.tick[row] = 0
+        self.placement_relocations[row] = self.resolve_placement(row, self.max_placement_rounds)
+        self.row_seeds[row] = seed
+        self.survivors[row] = [(0, self.prey_alive(row))]
+        self.active[row] = True
+        return True
+
+    def location_failsafe(self, location, is_prey, team_name: Optional[str]=None):
+        if not (isinstance(location, Tuple) and len(location) == 2 and isinstance(location[0], float) and isinstance(
+                location[1], float)):
+            report_failsafe(self.events, team_name, ("Prey" if is_prey else "Predator")+" placement function failsafe 2 triggered")
+            location = self.world.random_location()
+        return location
+
+    def placement_locations(self, player: Player, is_prey: bool, count: int) -> List[Tuple[float, float]]:
+        batch_placement_function = player.prey_batch_placement_function if is_prey else player.predator_batch_placement_function
+        if batch_placement_function is not None:
+            try:
+                locations = list(batch_placement_function(self.world, count))
+            except Exception as e:
+                report_failsafe(self.events, player.team_name, str(e))
+                locations = []
+            if len(locations) == count:
+                return [self.location_failsafe(location, is_prey, player.team_name) for location in locations]
+            report_failsafe(self.events, player.team_name, ("Prey" if is_prey else "Predator")+" batch placement function failsafe triggered (expected "+str(count)+" locations)")
+        placement_function = player.prey_placement_function if is_prey else player.predator_placement_function
+        return [self.location_failsafe(placement_function(self.world, i), is_prey, player.team_name) for i in range(count)]
+
+    def resolve_placement(self, row: int, max_rounds: int) -> int:
+        self.move_inbounds(row)
+        relocations = 0
+        conflicting = self.prey_in_kill_radius(row, self.prey_slots)
+        for _ in range(max_rounds):
+            if len(conflicting) == 0:
+                break
+            for slot in conflicting:
+                self.x[row, slot], self.y[row, slot] = self.world.random_location()
+            relocations += len(conflicting)
+            conflicting = self.prey_in_kill_radius(row, conflicting)
+        if len(conflicting) > 0:
+            report_failsafe(self.events, None, "Placement failsafe triggered ( "+str(len(conflicting))+" prey still start inside a predator's kill radius after "+str(max_rounds)+" rounds )")
+        return relocations
+
+    def prey_in_kill_radius(self, row: int, slots):
+        predators = self.predator_slots
+        dx = self.x[row, predators][None, :] - self.x[row, slots][:, None]
+        dy = self.y[row, predators][None, :] - self.y[row, slots][:, None]
+        enemy = self.team[predators][None, :] != self.team[slots][:, None]
+        return slots[(enemy & (numpy.sqrt(dx * dx + dy * dy) < self.predator_kill_radius)).any(axis=1)]
+
+    def move_inbounds(self, rows=slice(None)):
+        dimensions = self.world.world_dimensions
+        x = self.x[rows]
+        y = self.y[rows]
+        heading = self.heading[rows]
+        right = x > dimensions.max_x()
+        left = x < dimensions.min_x()
+        top = y > dimensions.max_y()
+        bottom = y < dimensions.min_y()
+        horizontal = right | left
+        vertical = top | bottom
+        heading[horizontal] = (360 - (heading[horizontal] + 180)) % 360
+        heading[vertical] = (360 - heading[vertical]) % 360
+        # Engine.move_inbounds goes back to the unclamped x when y is also out of bounds
+        clamped_x = numpy.where(right & ~vertical, dimensions.max_x(), numpy.where(left & ~vertical, dimensions.min_x(), x))
+        self.x[rows] = clamped_x
+        self.y[rows] = numpy.clip(y, dimensions.min_y(), dimensions.max_y())
+        self.heading[rows] = heading
+
+    def closest(self, slots: slice, category: int):
+        key = (slots.start, category)
+        if key not in self.__enemy_columns:
+            enemies = self.team != self.team[slots.start]
+            columns = numpy.flatnonzero(enemies & (self.is_prey if category == ENEMY_PREY else ~self.is_prey))
+            # with two teams the enemies are one contiguous run of slots, and slicing avoids copying them every tick
+            if len(columns) > 0 and columns[-1] - columns[0] == len(columns) - 1:
+                self.__enemy_columns[key] = (columns, slice(columns[0], columns[-1] + 1))
+            else:
+                self.__enemy_columns[key] = (columns, columns)
+        columns, selection = self.__enemy_columns[key]
+        x = self.x[:, slots]
+        y = self.y[:, slots]
+        if len(columns) == 0:
+            return numpy.zeros(x.shape), numpy.full(x.shape, numpy.inf)
+        # pick the nearest enemy on squared distances and only take the square root of the winners
+        squared = self.x[:, selection][:, None, :] - x[:, :, None]
+        squared *= squared
+        dy = self.y[:, selection][:, None, :] - y[:, :, None]
+        dy *= dy
+        squared += dy
+        squared += numpy.where(self.alive[:, selection], 0.0, numpy.inf)[:, None, :]
+        nearest = columns[squared.argmin(axis=2)]
+        rows = numpy.arange(len(x))[:, None]
+        dx = self.x[rows, nearest] - x
+        dy = self.y[rows, nearest] - y
+        distance = numpy.where(self.alive[rows, nearest], numpy.sqrt(dx * dx + dy * dy), numpy.inf)
+        angle = (numpy.degrees(numpy.arctan2(dy, dx)) + 360) % 360
+        return numpy.where(distance == numpy.inf, 0.0, angle), distance
+
+    def run_team_turns(self):
+        actions = numpy.full(self.x.shape, WAIT, dtype=numpy.int8)
+        values = numpy.zeros(self.x.shape)
+        for team_name, function in self.team_movement_functions.items():
+            slots = self.team_slots[team_name]
+            view = BatchTeamView(team_name, slots, self)
+            result = None
+            try:
+                result = function(view, self.world)
+            except Exception as e:
+                report_failsafe(self.events, team_name, str(e))
+            validated = validated_batch_actions(result, view.alive.shape)
+            if validated is None:
+                if result is not None:
+                    report_failsafe(self.events, team_name, "Team movement function failsafe 2 triggered (expected actions and values of shape "+str(view.alive.shape)+")")
+                continue
+            actions[:, slots], values[:, slots] = validated
+        return actions, values
+
+    def apply_team_actions(self, actions, values):
+        controlled = self.alive & self.active[:, None]
+        energy = self.energy
+        moving = controlled & ((actions == FORWARD) | (actions == BACKWARD))
+        speed = numpy.where(moving, numpy.minimum(numpy.minimum(values, energy), self.max_speed), 0.0)
+        energy -= speed
+        turning = controlled & ((actions == LEFT) | (actions == RIGHT) | (actions == SETHEADING)) & (energy >= 1)
+        energy[turning] -= 1
+        energy += numpy.where(controlled, numpy.where(actions == WAIT, 10.0, 5.0), 0.0)
+        self.just_ate[controlled] = False
+        # every turtle takes a single action, so moves use the heading from before this tick's turns
+        distance = numpy.where(actions == BACKWARD, -speed, speed)
+        angle = numpy.radians(self.heading)
+        self.x += distance * numpy.cos(angle)
+        self.y += distance * numpy.sin(angle)
+        heading = self.heading
+        left = turning & (actions == LEFT)
+        heading[left] = (heading[left] + values[left]) % 360
+        right = turning & (actions == RIGHT)
+        heading[right] = (heading[right] - values[right]) % 360
+        set_heading = turning & (actions == SETHEADING)
+        heading[set_heading] = values[set_heading] % 360
+
+    def resolve_kills(self):
+        predators = self.predator_slots
+        prey = self.prey_slots
+        dx = self.x[:, None, prey] - self.x[:, predators, None]
+        dy = self.y[:, None, prey] - self.y[:, predators, None]
+        distance = dx * dx
+        distance += dy * dy
+        numpy.sqrt(distance, out=distance)
+        # kills[b, i, j] is True when predator i can eat prey j in world b
+        kills = distance < self.predator_kill_radius
+        kills &= self.enemy[None, :, :]
+        kills &= self.alive[:, predators, None] & self.alive[:, None, prey] & self.active[:, None, None]
+        eaten = kills.any(axis=1)
+        if not eaten.any():
+            return eaten
+        # each prey goes to the first predator that reaches it, as in Engine.resolve_kills
+        rows, columns = numpy.nonzero(eaten)
+        eaters = predators[kills.argmax(axis=1)[rows, columns]]
+        numpy.add.at(self.energy, (rows, eaters), 10)
+        self.just_ate[rows, eaters] = True
+        self.alive[rows, prey[columns]] = False
+        return eaten
+
+    def prey_alive(self, row: int) -> Dict[str, int]:
+        return {team_name: int(numpy.count_nonzero(self.alive[row, slots])) for team_name, slots in self.team_prey_slots.items()}
+
+    def teams_alive(self):
+        return sum(self.alive[:, slots].any(axis=1).astype(numpy.intp) for slots in self.team_prey_slots.values())
+
+    def finished(self):
+        finished = self.active & (self.teams_alive() <= 1)
+        if self.max_ticks is not None:
+            finished |= self.active & (self.tick >= self.max_ticks)
+        return finished
+
+    def finish_world(self, row: int) -> MatchResult:
+        prey_alive = self.prey_alive(row)
+        surviving = [name for name, player in zip(self.pairing, self.players) if prey_alive[player.team_name] > 0]
+        winner = surviving[0] if len(surviving) == 1 else None
+        team_names = {name: player.team_name for name, player in zip(self.pairing, self.players)}
+        result = MatchResult(self.pairing, self.row_seeds[row], winner, int(self.tick[row]), self.survivors[row], team_names, self.placement_relocations[row])
+        self.results.append(result)
+        self.active[row] = False
+        return result
+
+    def step(self):
+        actions, values = self.run_team_turns()
+        self.apply_team_actions(actions, values)
+        self.move_inbounds()
+        eaten = self.resolve_kills()
+        self.tick += self.active
+        for row in numpy.flatnonzero(eaten.any(axis=1)):
+            self.survivors[row].append((int(self.tick[row]), self.prey_alive(row)))
+
+    def run(self, on_result: Optional[Callable[[MatchResult], None]]=None) -> List[MatchResult]:
+        while True:
+            # finished worlds are recycled with the next seed until none are left, then stay masked out
+            finished = self.finished()
+            while finished.any():
+                for row in numpy.flatnonzero(finished):
+                    result = self.finish_world(row)
+                    if on_result is not None:
+                        on_result(result)
+                    self.start_world(row)
+                finished = self.finished()
+            if not self.active.any():
+                break
+            self.step()
+        return self.results
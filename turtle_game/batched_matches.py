@@ -0,0 +1,55 @@
+import argparse
+import json
+import sys
+from typing import List, Tuple, Optional, Callable
+
+from turtle_game.batched_engine import BatchedEngine
+from turtle_game.match_result import MatchResult
+from turtle_game.player import Player
+from turtle_game.submission_loader import load_submissions
+from turtle_game.world import World
+
+
+def batched_players(people: List[Player]) -> List[Player]:
+    players: List[Player] = []
+    team_names: List[str] = []
+    for index, person in enumerate(people):
+        # the same submission may play itself, and the batched engine needs one name per team
+        team_name = (person.team_name + " " + str(index + 1)) if person.team_name in team_names else person.team_name
+        players.append(Player(team_name, person.prey_color, person.predator_color, person.prey_placement_function, person.predator_placement_function, person.prey_movement_function, person.predator_movement_function, person.prey_batch_placement_function, person.predator_batch_placement_function, person.team_movement_function, person.batched_team_movement_function))
+        team_names.append(team_name)
+    return players
+
+
+def run_batched_matches(pairing: Tuple[str, ...], people: List[Player], seeds: List[int], batch_size: int=256, world_width: int=700, world_height: int=700, predator_kill_radius: int=30, prey_per_team: int=45, predators_per_team: int=5, max_ticks: Optional[int]=5000, on_result: Optional[Callable[[MatchResult], None]]=None) -> List[MatchResult]:
+    world = World(world_width, world_height, predator_kill_radius, False)
+    engine = BatchedEngine(world, batched_players(people), seeds, batch_size, prey_per_team, predators_per_team, max_ticks, pairing=pairing)
+    return engine.run(on_result)
+
+
+def main(arguments: List[str]=None):
+    parser = argparse.ArgumentParser(description="Play many seeds of one pairing in lockstep with the batched engine. Only batched team movement functions are supported.")
+    parser.add_argument("--pairing", required=True, help="comma separated submission names")
+    parser.add_argument("--seeds", type=int, default=256, help="number of seeds to play")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=256, help="worlds stepped together")
+    parser.add_argument("--max-ticks", type=int, default=5000)
+    parser.add_argument("--output", default=None, help="JSON lines file for the results (default: stdout)")
+    options = parser.parse_args(arguments)
+
+    pairing = tuple(options.pairing.split(","))
+    submissions = load_submissions()
+    seeds = list(range(options.first_seed, options.first_seed + options.seeds))
+    output = open(options.output, "w") if options.output else sys.stdout
+    try:
+        def write_result(result: MatchResult):
+            output.write(json.dumps(result.to_dict()) + "\n")
+            output.flush()
+        run_batched_matches(pairing, [submissions[name] for name in pairing], seeds, options.batch_size, max_ticks=options.max_ticks, on_result=write_result)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
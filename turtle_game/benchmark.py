@@ -0,0 +1,167 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import product
+from multiprocessing import get_context
+from time import perf_counter
+from typing import List, Dict, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.engine import Engine
+from turtle_game.instrumentation import Instrumentation
+from turtle_game.metrics_sinks import HistogramSink
+from turtle_game.player import Player
+from turtle_game.submission_loader import default_movement_function, default_placement_function
+from turtle_game.submission_validator import percentile
+from turtle_game.world import World
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+COLORS = ["blue", "red", "green", "orange", "purple", "brown", "pink", "gray"]
+
+
+def chasing_movement_function(turtle: CompetitionTurtle, world: World):
+    while True:
+        turtle.turn_to_closest_enemy_prey()
+        yield
+        turtle.forward(turtle.max_speed())
+        yield
+
+
+def synthetic_players(teams: int) -> List[Player]:
+    players: List[Player] = []
+    for team in range(teams):
+        color = COLORS[team % len(COLORS)]
+        players.append(Player("Bench "+str(team), color, color, default_placement_function, default_placement_function, default_movement_function, chasing_movement_function))
+    return players
+
+
+class BenchmarkCase:
+    def __init__(self, teams: int, prey_per_team: int, predators_per_team: int, world_size: int):
+        self.teams: int = teams
+        self.prey_per_team: int = prey_per_team
+        self.predators_per_team: int = predators_per_team
+        self.world_size: int = world_size
+
+    def name(self) -> str:
+        return "teams="+str(self.teams)+" prey="+str(self.prey_per_team)+" predators="+str(self.predators_per_team)+" world="+str(self.world_size)
+
+    def turtles(self) -> int:
+        return self.teams * (self.prey_per_team + self.predators_per_team)
+
+
+def peak_rss_kb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, everything else kilobytes
+    return peak / 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(case: BenchmarkCase, ticks: int, seed: int, engine_options: dict) -> Dict[str, object]:
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        started = perf_counter()
+        world = World(case.world_size, case.world_size, 30, False)
+        metrics = HistogramSink()
+        engine = Engine(world, synthetic_players(case.teams), case.prey_per_team, case.predators_per_team, max_ticks=ticks, instrumentation=Instrumentation([metrics]), **engine_options)
+        setup_seconds = perf_counter() - started
+        started = perf_counter()
+        engine.run()
+        run_seconds = perf_counter() - started
+    durations = engine.tick_durations
+    return {
+        "name": case.name(),
+        "teams": case.teams,
+        "prey_per_team": case.prey_per_team,
+        "predators_per_team": case.predators_per_team,
+        "world_size": case.world_size,
+        "turtles": case.turtles(),
+        "ticks": engine.tick,
+        "setup_seconds": setup_seconds,
+        "ticks_per_second": engine.tick / run_seconds if run_seconds > 0 else 0.0,
+        "p50_ms": percentile(durations, .5) * 1000,
+        "p99_ms": percentile(durations, .99) * 1000,
+        "max_ms": percentile(durations, 1) * 1000,
+        "peak_rss_kb": peak_rss_kb(),
+        "phases_ms": {phase: histogram.sum / histogram.count * 1000 for phase, histogram in metrics.phases.items() if histogram.count},
+        "team_cpu_seconds": metrics.team_cpu,
+    }
+
+
+def run_benchmarks(cases: List[BenchmarkCase], ticks: int=200, seed: int=0, **engine_options) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for case in cases:
+        # a fresh process per case keeps peak RSS and allocator state from leaking between cases
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            result = executor.submit(run_case, case, ticks, seed, engine_options).result()
+        print(result["name"].ljust(52), "%9.1f ticks/s  p50 %7.2fms  p99 %7.2fms  rss %s" % (result["ticks_per_second"], result["p50_ms"], result["p99_ms"], result["peak_rss_kb"]), file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def compare_to_baseline(results: List[Dict[str, object]], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    baseline_cases = {case["name"]: case for case in baseline["cases"]}
+    regressions: List[str] = []
+    for result in results:
+        old = baseline_cases.get(result["name"])
+        if old is None:
+            continue
+        if result["ticks_per_second"] < old["ticks_per_second"] * (1 - tolerance):
+            regressions.append(result["name"]+": ticks/s %.1f vs baseline %.1f" % (result["ticks_per_second"], old["ticks_per_second"]))
+        if result["p99_ms"] > old["p99_ms"] * (1 + tolerance):
+            regressions.append(result["name"]+": p99 %.2fms vs baseline %.2fms" % (result["p99_ms"], old["p99_ms"]))
+    return regressions
+
+
+def main(arguments: List[str]=None):
+    parser = argparse.ArgumentParser(description="Benchmark the engine headlessly over a sweep of match sizes.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--prey", type=int, nargs="+", default=[45, 125], help="prey per team")
+    parser.add_argument("--predators", type=int, nargs="+", default=[5, 25], help="predators per team")
+    parser.add_argument("--world", type=int, nargs="+", default=[700], help="world width and height")
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threads", action="store_true", help="use one thread per turtle instead of the cooperative scheduler")
+    parser.add_argument("--vectorized", action="store_true")
+    parser.add_argument("--safe", action="store_true", help="enforce per-turn time budgets")
+    parser.add_argument("--output", default=None, help="JSON file for the results (default: stdout)")
+    parser.add_argument("--baseline", default=None, help="JSON file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=.15, help="allowed slowdown against the baseline")
+    options = parser.parse_args(arguments)
+
+    engine_options = {"cooperative": not options.threads, "vectorized": options.vectorized, "safe_mode": options.safe}
+    cases = [BenchmarkCase(*sizes) for sizes in product(options.teams, options.prey, options.predators, options.world)]
+    cases.sort(key=lambda case: case.turtles())
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ticks": options.ticks,
+        "seed": options.seed,
+        "engine": engine_options,
+        "cases": run_benchmarks(cases, options.ticks, options.seed, **engine_options),
+    }
+    if options.output is not None:
+        with open(options.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if options.baseline is not None:
+        with open(options.baseline) as baseline_file:
+            regressions = compare_to_baseline(report["cases"], json.load(baseline_file), options.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
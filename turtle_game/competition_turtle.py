@@ -1,59 +1,51 @@
 from __future__ import annotations
 from math import sqrt, atan2, degrees
-from queue import Queue
 from random import random
-from threading import Lock, Barrier
-from turtle import Turtle
+from threading import BrokenBarrierError
 
-from typing import Union, Callable, List, Tuple
+from typing import Union, Tuple, Dict, Sequence, Optional
 
 
-from turtle_game.command import Command
-from turtle_game.relative_location import RelativeLocation
+from turtle_game.action_buffer import MOVE, TURN, SET_HEADING, WAIT, FORWARD, BACKWARD, LEFT, RIGHT, SETHEADING
+from turtle_game.event_stream import report_failsafe
+from turtle_game.relative_location import RelativeLocation, ALLY_PREY, ALLY_PREDATOR, ENEMY_PREY, ENEMY_PREDATOR
+from turtle_game.state_store import StateStore
 
 
+class TurnAwaitable:
+    __slots__ = ("__suspends",)
+
+    def __init__(self, suspends: bool):
+        self.__suspends: bool = suspends
+
+    def __await__(self):
+        if self.__suspends:
+            yield
+
+
+NEXT_TURN = TurnAwaitable(True)
+NOT_WAITING = TurnAwaitable(False)
+
 
 class CompetitionTurtle:
-    def __init__(self, team_name: str, is_prey: bool, color: Union[str,Tuple[float,float,float]], x: float, y: float, move_barrier: Barrier, check_barrier: Barrier, process_queue: Queue, lock: Lock, can_move_without_wait: Callable[[CompetitionTurtle], bool], can_eat: Callable[[CompetitionTurtle, CompetitionTurtle], bool], is_game_over: Callable[[], bool], is_turtle_on_left_edge: Callable[[CompetitionTurtle], bool], is_turtle_on_top_edge: Callable[[CompetitionTurtle], bool], is_turtle_on_right_edge: Callable[[CompetitionTurtle], bool], is_turtle_on_bottom_edge: Callable[[CompetitionTurtle], bool], is_turtle_in_top_left_corner: Callable[[CompetitionTurtle], bool], is_turtle_in_top_right_corner: Callable[[CompetitionTurtle], bool], is_turtle_in_bottom_right_corner: Callable[[CompetitionTurtle], bool], is_turtle_in_bottom_left_corner: Callable[[CompetitionTurtle], bool], max_speed: float):
-        self.__turtle: Turtle = Turtle()
-        self.__turtle.shape('turtle')
+    __slots__ = ("__state", "__slot", "__team_name", "__color", "__is_prey", "__engine", "__neighbors", "__relative_locations",
+                 "__started", "__waited", "__just_ate", "__turn_driver", "__watchdog", "__max_speed")
+
+    def __init__(self, team_name: str, is_prey: bool, color: Union[str,Tuple[float,float,float]], x: float, y: float, engine, max_speed: float, state_store: StateStore=None):
+        self.__state: StateStore = state_store if state_store is not None else StateStore()
+        self.__slot: int = self.__state.add(x, y, random() * 360, 5)
         self.__team_name: str = team_name
-        self.__turtle.speed("fastest")
-        try:
-            self.__turtle.color(color)
-        except:
-            self.__turtle.color("blue")
-            print("Color fail safe activated")
+        self.__color: Union[str,Tuple[float,float,float]] = color
         self.__is_prey: bool = is_prey
-        self.__turtle.shapesize(1 if self.__is_prey else 2)
-        self.__turtle.penup()
-        self.__turtle.setheading(random() * 360)
-        self.__move_barrier: Barrier = move_barrier
-        self.__check_barrier: Barrier = check_barrier
-        self.__process_queue: Queue = process_queue
-        self.__lock: Lock = lock
-        self.enemy_predators_relative_locations: List[RelativeLocation] = []
-        self.enemy_prey_relative_locations: List[RelativeLocation] = []
-        self.ally_predators_relative_locations: List[RelativeLocation] = []
-        self.ally_prey_relative_locations: List[RelativeLocation] = []
-        self.__energy: int = 5
+        self.__engine = engine
+        self.__neighbors = None
+        self.__relative_locations: Dict[int, Sequence[RelativeLocation]] = {}
         self.__started: bool = False
-        self.__can_move_without_wait: Callable[[CompetitionTurtle], bool] = can_move_without_wait
-        self.__can_eat: Callable[[CompetitionTurtle, CompetitionTurtle], bool] = can_eat
         self.__waited = False
         self.__just_ate = False
-        self.__is_alive = True
-        self.goto(x, y)
+        self.__turn_driver = None
+        self.__watchdog = None
         self.__max_speed: float = max_speed
-        self.__is_game_over: Callable[[],bool] = is_game_over
-        self.__is_turtle_on_left_edge: Callable[[CompetitionTurtle],bool] = is_turtle_on_left_edge
-        self.__is_turtle_on_top_edge: Callable[[CompetitionTurtle],bool] = is_turtle_on_top_edge
-        self.__is_turtle_on_right_edge: Callable[[CompetitionTurtle],bool] = is_turtle_on_right_edge
-        self.__is_turtle_on_bottom_edge: Callable[[CompetitionTurtle],bool] = is_turtle_on_bottom_edge
-        self.__is_turtle_in_top_left_corner: Callable[[CompetitionTurtle],bool] = is_turtle_in_top_left_corner
-        self.__is_turtle_in_top_right_corner: Callable[[CompetitionTurtle],bool] = is_turtle_in_top_right_corner
-        self.__is_turtle_in_bottom_right_corner: Callable[[CompetitionTurtle],bool] = is_turtle_in_bottom_right_corner
-        self.__is_turtle_in_bottom_left_corner: Callable[[CompetitionTurtle],bool] = is_turtle_in_bottom_left_corner
 
     def start(self):
         self.__started = True
@@ -63,122 +55,212 @@ class CompetitionTurtle:
     def team_name(self) -> str:
         return self.__team_name
 
+    def color(self) -> Union[str,Tuple[float,float,float]]:
+        return self.__color
+
+    def slot(self) -> int:
+        return self.__slot
+
+    def is_alive(self) -> bool:
+        return self.__state.alive[self.__slot] == 1
+
+    def set_neighbors(self, neighbors):
+        self.__neighbors = neighbors
+        if self.__relative_locations:
+            self.__relative_locations.clear()
+
+    def __sorted_relative_locations(self, category: int) -> Sequence[RelativeLocation]:
+        if self.__neighbors is None:
+            return []
+        locations = self.__relative_locations.get(category)
+        if locations is None:
+            locations = self.__neighbors.relative_locations(self, category)
+            self.__relative_locations[category] = locations
+        return locations
+
+    def __closest(self, category: int) -> RelativeLocation:
+        closest: Optional[RelativeLocation] = None
+        if category in self.__relative_locations:
+            if len(self.__relative_locations[category]) > 0:
+                closest = self.__relative_locations[category][0]
+        elif self.__neighbors is not None:
+            closest = self.__neighbors.closest(self, category)
+        return closest if closest is not None else RelativeLocation(1, 1)
+
+    @property
+    def ally_prey_relative_locations(self) -> Sequence[RelativeLocation]:
+        return self.__sorted_relative_locations(ALLY_PREY)
+
+    @property
+    def ally_predators_relative_locations(self) -> Sequence[RelativeLocation]:
+        return self.__sorted_relative_locations(ALLY_PREDATOR)
+
+    @property
+    def enemy_prey_relative_locations(self) -> Sequence[RelativeLocation]:
+        return self.__sorted_relative_locations(ENEMY_PREY)
+
+    @property
+    def enemy_predators_relative_locations(self) -> Sequence[RelativeLocation]:
+        return self.__sorted_relative_locations(ENEMY_PREDATOR)
+
+    def set_turn_driver(self, turn_driver):
+        self.__turn_driver = turn_driver
+
+    def set_watchdog(self, watchdog):
+        self.__watchdog = watchdog
+
+    def __begin_action(self):
+        if self.__turn_driver is not None:
+            self.__turn_driver.begin_action()
+
     def reset_wait(self):
         self.__waited = False
 
 
-    def __add_to_queue(self, function: Callable[[float],None], value: float):
-        if self.__is_alive:
-            self.__lock.acquire()
-            self.__process_queue.put(Command(function, value))
-            self.__lock.release()
+    def __set_action(self, opcode: int, value: float):
+        if self.is_alive():
+            self.__state.action[self.__slot] = opcode
+            self.__state.action_value[self.__slot] = value
 
-    def wait(self, bonus=True):
+    def __rest(self, bonus: bool):
         if bonus:
-            self.__energy += 10
+            self.__state.energy[self.__slot] += 10
         else:
-            self.__energy += 5
+            self.__state.energy[self.__slot] += 5
         self.__just_ate = False
-        try:
-            self.__move_barrier.wait()
-        except Exception as e:
-            print(e)
-        try:
-            self.__check_barrier.wait()
-        except Exception as e:
-            print(e)
+
+    def wait(self, bonus=True):
+        self.__rest(bonus)
+        if self.__turn_driver is not None:
+            self.__turn_driver.end_turn()
+        else:
+            if self.__watchdog is not None:
+                self.__watchdog.end_turn(self)
+            try:
+                self.__engine.move_barrier.wait()
+            except BrokenBarrierError:
+                raise SystemExit()
+            except Exception as e:
+                report_failsafe(self.__engine.events, self.__team_name, str(e))
+            try:
+                self.__engine.check_barrier.wait()
+            except BrokenBarrierError:
+                raise SystemExit()
+            except Exception as e:
+                report_failsafe(self.__engine.events, self.__team_name, str(e))
+            if self.__watchdog is not None:
+                self.__watchdog.begin_turn(self)
         self.__waited = True
+        return NEXT_TURN
 
     def did_wait(self):
         return self.__waited
     def forward(self, speed: float):
-        if self.__is_alive:
-            speed = min(speed, self.__energy, self.__max_speed)
-            self.__energy -= speed
-            self.__add_to_queue(self.__turtle.forward,speed)
-        self.wait(False)
+        self.__begin_action()
+        self.__move(speed, 1)
+        return self.wait(False)
 
     def backward(self, speed: float):
-        if self.__is_alive:
-            speed = min(speed, self.__energy, self.__max_speed)
-            self.__energy -= speed
-            self.__add_to_queue(self.__turtle.backward,speed)
-        self.wait(False)
+        self.__begin_action()
+        self.__move(speed, -1)
+        return self.wait(False)
 
     def right(self, value: float):
-        if self.__is_alive:
-            if self.__energy >= 1:
-                self.__energy -= 1
-                self.__add_to_queue(self.__turtle.right,value)
-        self.wait(False)
+        self.__begin_action()
+        self.__spend_turn(TURN, -value)
+        return self.wait(False)
 
     def left(self, value: float):
-        if self.__is_alive:
-            if self.__energy >= 1:
-                self.__energy -= 1
-                self.__add_to_queue(self.__turtle.left,value)
-        self.wait(False)
+        self.__begin_action()
+        self.__spend_turn(TURN, value)
+        return self.wait(False)
 
     def setheading(self, value: float):
-        if self.__is_alive:
-            if self.__energy >= 1:
-                self.__energy -= 1
-                self.__add_to_queue(self.__turtle.setheading,value%360)
-        self.wait(False)
+        self.__begin_action()
+        self.__spend_turn(SET_HEADING, value%360)
+        return self.wait(False)
+
+    def __move(self, speed: float, direction: int):
+        if self.is_alive():
+            speed = min(speed, self.energy_level(), self.__max_speed)
+            self.__state.energy[self.__slot] -= speed
+            self.__set_action(MOVE, direction * speed)
+
+    def __spend_turn(self, opcode: int, value: float):
+        if self.is_alive():
+            if self.energy_level() >= 1:
+                self.__state.energy[self.__slot] -= 1
+                self.__set_action(opcode, value)
+
+    def take_team_action(self, action: int, value: float):
+        if action == FORWARD:
+            self.__move(value, 1)
+        elif action == BACKWARD:
+            self.__move(value, -1)
+        elif action == LEFT:
+            self.__spend_turn(TURN, value)
+        elif action == RIGHT:
+            self.__spend_turn(TURN, -value)
+        elif action == SETHEADING:
+            self.__spend_turn(SET_HEADING, value%360)
+        self.__rest(action == WAIT)
+
+    def __set_heading(self, angle: float):
+        self.__state.heading[self.__slot] = angle % 360
 
     def position(self)->(float,float):
-        return self.__turtle.position()
+        return (self.__state.x[self.__slot], self.__state.y[self.__slot])
 
     def goto(self, x: float, y: float, ):
-        if self.__can_move_without_wait(self):
+        if self.__engine.can_move_without_wait(self):
             try:
-                self.__turtle.goto(x,y)
+                self.__state.x[self.__slot] = x
+                self.__state.y[self.__slot] = y
             except:
                 pass
+            return NOT_WAITING
         else:
-            self.wait()
+            self.__begin_action()
+            return self.wait()
 
     def force_heading(self, angle: float):
-        if self.__can_move_without_wait(self):
+        if self.__engine.can_move_without_wait(self):
             try:
-                self.__turtle.setheading(angle)
+                self.__set_heading(angle)
             except:
                 pass
+            return NOT_WAITING
         else:
-            self.wait()
+            self.__begin_action()
+            return self.wait()
     def hide(self):
-        self.__turtle.hideturtle()
-        self.__is_alive = False
+        self.__state.alive[self.__slot] = 0
 
     def eat(self, prey: CompetitionTurtle):
-        if self.__can_eat(self,prey):
-            self.__energy+=10
+        if self.__engine.can_eat(self,prey):
+            self.__state.energy[self.__slot]+=10
             self.__just_ate = True
     def did_just_eat(self):
         return self.__just_ate
 
+    def set_just_ate(self, just_ate: bool):
+        self.__just_ate = just_ate
+
     def distance(self, turtle2: CompetitionTurtle)->float:
-        x1 = self.position()[0]
-        y1 = self.position()[1]
-        x2 = turtle2.position()[0]
-        y2 = turtle2.position()[1]
+        x1, y1 = self.position()
+        x2, y2 = turtle2.position()
         return sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
 
     def angle(self, turtle2: CompetitionTurtle) -> float:
-        x1 = self.position()[0]
-        y1 = self.position()[1]
-        x2 = turtle2.position()[0]
-        y2 = turtle2.position()[1]
+        x1, y1 = self.position()
+        x2, y2 = turtle2.position()
         return (degrees(atan2((y2 - y1), (x2 - x1))) + 360) % 360
 
     def energy_level(self):
-        return self.__energy
+        return self.__state.energy[self.__slot]
 
     def closest_enemy_prey(self) -> RelativeLocation:
-        if len(self.enemy_prey_relative_locations) > 0:
-            return self.enemy_prey_relative_locations[0]
-        else:
-            return RelativeLocation(1,1)
+        return self.__closest(ENEMY_PREY)
 
     def angle_to_closest_enemy_prey(self) -> float:
         return self.closest_enemy_prey().angle()
@@ -187,10 +269,7 @@ class CompetitionTurtle:
         return self.closest_enemy_prey().distance()
 
     def closest_enemy_predator(self) -> RelativeLocation:
-        if len(self.enemy_predators_relative_locations) > 0:
-            return self.enemy_predators_relative_locations[0]
-        else:
-            return RelativeLocation(1, 1)
+        return self.__closest(ENEMY_PREDATOR)
 
     def angle_to_closest_enemy_predator(self) -> float:
         return self.closest_enemy_predator().angle()
@@ -199,10 +278,7 @@ class CompetitionTurtle:
         return self.closest_enemy_predator().distance()
 
     def closest_ally_prey(self) -> RelativeLocation:
-        if len(self.ally_prey_relative_locations) > 0:
-            return self.ally_prey_relative_locations[0]
-        else:
-            return RelativeLocation(1, 1)
+        return self.__closest(ALLY_PREY)
 
     def angle_to_closest_ally_prey(self) -> float:
         return self.closest_ally_prey().angle()
@@ -211,10 +287,7 @@ class CompetitionTurtle:
         return self.closest_ally_prey().distance()
 
     def closest_ally_predator(self) -> RelativeLocation:
-        if len(self.ally_predators_relative_locations) > 0:
-            return self.ally_predators_relative_locations[0]
-        else:
-            return RelativeLocation(1, 1)
+        return self.__closest(ALLY_PREDATOR)
 
     def angle_to_closest_ally_predator(self) -> float:
         return self.closest_ally_predator().angle()
@@ -223,47 +296,47 @@ class CompetitionTurtle:
         return self.closest_ally_predator().distance()
 
     def turn_to_closest_enemy_prey(self):
-        self.setheading(self.angle_to_closest_enemy_prey())
+        return self.setheading(self.angle_to_closest_enemy_prey())
 
     def turn_to_closest_enemy_predator(self):
-        self.setheading(self.angle_to_closest_enemy_predator())
+        return self.setheading(self.angle_to_closest_enemy_predator())
 
     def turn_to_closest_ally_prey(self):
-        self.setheading(self.angle_to_closest_ally_prey())
+        return self.setheading(self.angle_to_closest_ally_prey())
 
     def turn_to_closest_ally_predator(self):
-        self.setheading(self.angle_to_closest_ally_predator())
+        return self.setheading(self.angle_to_closest_ally_predator())
 
     def turn_away_from_closest_enemy_prey(self):
-        self.setheading(self.angle_to_closest_enemy_prey()+180)
+        return self.setheading(self.angle_to_closest_enemy_prey()+180)
 
     def turn_away_from_enemy_predator(self):
-        self.setheading(self.angle_to_closest_enemy_predator()+180)
+        return self.setheading(self.angle_to_closest_enemy_predator()+180)
 
     def turn_away_from_closest_ally_prey(self):
-        self.setheading(self.angle_to_closest_ally_prey()+180)
+        return self.setheading(self.angle_to_closest_ally_prey()+180)
 
     def turn_away_from_closest_ally_predator(self):
-        self.setheading(self.angle_to_closest_ally_predator()+180)
+        return self.setheading(self.angle_to_closest_ally_predator()+180)
 
     def max_speed(self) -> float:
         return self.__max_speed
 
     def is_turtle_on_left_edge(self) -> bool:
-        return self.__is_turtle_on_left_edge(self)
+        return self.__engine.is_turtle_on_left_edge(self)
     def is_turtle_on_top_edge(self) -> bool:
-        return self.__is_turtle_on_top_edge(self)
+        return self.__engine.is_turtle_on_top_edge(self)
     def is_turtle_on_right_edge(self) -> bool:
-        return self.__is_turtle_on_right_edge(self)
+        return self.__engine.is_turtle_on_right_edge(self)
     def is_turtle_on_bottom_edge(self) -> bool:
-        return self.__is_turtle_on_bottom_edge(self)
+        return self.__engine.is_turtle_on_bottom_edge(self)
     def is_turtle_in_top_left_corner(self) -> bool:
-        return self.__is_turtle_in_top_left_corner(self)
+        return self.__engine.is_turtle_in_top_left_corner(self)
     def is_turtle_in_top_right_corner(self) -> bool:
-        return self.__is_turtle_in_top_right_corner(self)
+        return self.__engine.is_turtle_in_top_right_corner(self)
     def is_turtle_in_bottom_right_corner(self) -> bool:
-        return self.__is_turtle_in_bottom_right_corner(self)
+        return self.__engine.is_turtle_in_bottom_right_corner(self)
     def is_turtle_in_bottom_left_corner(self) -> bool:
-        return self.__is_turtle_in_bottom_left_corner(self)
+        return self.__engine.is_turtle_in_bottom_left_corner(self)
     def heading(self) -> float:
-        return self.__turtle.heading()
+        return self.__state.heading[self.__slot]
@@ -0,0 +1,235 @@
+from __future__ import annotations
+from threading import Thread, Event
+from types import GeneratorType, CoroutineType
+from time import thread_time
+from typing import Callable, Dict, List, Union, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.event_stream import EventStream, report_failsafe
+from turtle_game.watchdog import Watchdog, TurnBudgetExceeded
+from turtle_game.world import World
+
+
+class TurnOverrun(BaseException):
+    pass
+
+
+def print_skipped_turn(turtle: CompetitionTurtle, watchdog: Watchdog, events: Optional[EventStream]=None):
+    if watchdog.exhausted(turtle):
+        report_failsafe(events, turtle.team_name(), ("Prey" if turtle.is_prey() else "Predator")+" movement function failsafe 3 triggered (turtle took too long to decide turn) shutting down turtle behavior")
+    else:
+        report_failsafe(events, turtle.team_name(), ("Prey" if turtle.is_prey() else "Predator")+" movement function failsafe 3 triggered (turtle took too long to decide turn) skipping turn")
+
+
+def print_skipped_team_turn(team_name: str, watchdog: Watchdog, events: Optional[EventStream]=None):
+    if watchdog.exhausted(team_name):
+        report_failsafe(events, team_name, "Team movement function failsafe 3 triggered (team took too long to decide turn) shutting down team behavior")
+    else:
+        report_failsafe(events, team_name, "Team movement function failsafe 3 triggered (team took too long to decide turn) skipping turn")
+
+
+def wait_after_skipped_turn(turtle: CompetitionTurtle, watchdog: Watchdog, events: Optional[EventStream]=None):
+    # an interrupt the watchdog sent just before the turn ended may still land here, so keep going until the turn is over
+    reported = False
+    while True:
+        try:
+            if not reported:
+                reported = True
+                print_skipped_turn(turtle, watchdog, events)
+            turtle.wait()
+            return
+        except TurnBudgetExceeded:
+            pass
+
+
+def run_to_completion(coroutine: CoroutineType):
+    # on a thread of its own every action already blocks until the next turn, so each await resumes straight away
+    try:
+        while True:
+            coroutine.send(None)
+    except StopIteration:
+        pass
+
+
+class InlineDriver:
+    def __init__(self, function: Callable[[CompetitionTurtle, World], None], turtle: CompetitionTurtle, world: World, watchdog: Optional[Watchdog]=None, events: Optional[EventStream]=None):
+        self.function: Callable[[CompetitionTurtle, World], None] = function
+        self.turtle: CompetitionTurtle = turtle
+        self.world: World = world
+        self.watchdog: Optional[Watchdog] = watchdog
+        self.events: Optional[EventStream] = events
+        self.__generator = None
+        self.__acted: bool = False
+        self.__overran: bool = False
+
+    def begin_action(self):
+        if self.__acted:
+            self.__overran = True
+            raise TurnOverrun()
+
+    def end_turn(self):
+        self.begin_action()
+        self.__acted = True
+
+    def needs_thread(self) -> bool:
+        return self.__overran and self.__generator is None
+
+    def stop(self):
+        pass
+
+    def step(self):
+        self.__acted = False
+        self.turtle.reset_wait()
+        if self.watchdog is None:
+            self.__take_turn()
+        elif not self.watchdog.exhausted(self.turtle):
+            self.watchdog.begin_turn(self.turtle)
+            try:
+                self.__take_turn()
+                if not self.watchdog.end_turn(self.turtle):
+                    print_skipped_turn(self.turtle, self.watchdog, self.events)
+            except TurnBudgetExceeded:
+                self.watchdog.end_turn(self.turtle)
+                self.__generator = None
+                print_skipped_turn(self.turtle, self.watchdog, self.events)
+        if not self.turtle.did_wait():
+            if self.__generator is None and (self.watchdog is None or not self.watchdog.exhausted(self.turtle)):
+                report_failsafe(self.events, self.turtle.team_name(), ("Prey" if self.turtle.is_prey() else "Predator")+" movement function failsafe 2 triggered (turtle did not wait)")
+            self.turtle.wait()
+
+    def __take_turn(self):
+        try:
+            if self.__generator is not None:
+                try:
+                    self.__generator.send(None)
+                    return
+                except StopIteration:
+                    # a coroutine that returns after its last await has not acted yet, so it is called again this turn
+                    restart = isinstance(self.__generator, CoroutineType) and not self.turtle.did_wait()
+                    self.__generator = None
+                    if not restart:
+                        return
+            result = self.function(self.turtle, self.world)
+            if isinstance(result, (GeneratorType, CoroutineType)):
+                self.__generator = result
+                result.send(None)
+        except StopIteration:
+            self.__generator = None
+        except TurnOverrun:
+            if self.__generator is not None:
+                report_failsafe(self.events, self.turtle.team_name(), ("Prey" if self.turtle.is_prey() else "Predator")+" movement function failsafe 4 triggered (generator acted more than once before yielding)")
+                self.__generator = None
+                self.__overran = False
+        except Exception as e:
+            report_failsafe(self.events, self.turtle.team_name(), str(e))
+
+
+class ThreadedDriver:
+    def __init__(self, function: Callable[[CompetitionTurtle, World], None], turtle: CompetitionTurtle, world: World, is_game_over: Callable[[], bool], watchdog: Optional[Watchdog]=None, events: Optional[EventStream]=None):
+        self.function: Callable[[CompetitionTurtle, World], None] = function
+        self.turtle: CompetitionTurtle = turtle
+        self.world: World = world
+        self.watchdog: Optional[Watchdog] = watchdog
+        self.events: Optional[EventStream] = events
+        self.__is_game_over: Callable[[], bool] = is_game_over
+        self.__go: Event = Event()
+        self.__done: Event = Event()
+        self.__stopped: bool = False
+        self.__thread: Thread = Thread(target=self.__run)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def begin_action(self):
+        pass
+
+    def end_turn(self):
+        if self.__stopped:
+            raise SystemExit()
+        if self.watchdog is not None:
+            self.watchdog.end_turn(self.turtle)
+        self.__go.clear()
+        self.__done.set()
+        self.__go.wait()
+        if self.__stopped:
+            raise SystemExit()
+        if self.watchdog is not None:
+            self.watchdog.begin_turn(self.turtle)
+
+    def stop(self):
+        self.__stopped = True
+        self.__go.set()
+
+    def needs_thread(self) -> bool:
+        return False
+
+    def thread_ident(self) -> int:
+        return self.__thread.ident
+
+    def step(self):
+        self.__done.clear()
+        self.__go.set()
+        self.__done.wait()
+
+    def __run(self):
+        self.__go.wait()
+        if self.watchdog is not None:
+            self.watchdog.begin_turn(self.turtle)
+        while not self.__is_game_over():
+            self.turtle.reset_wait()
+            if self.watchdog is not None and self.watchdog.exhausted(self.turtle):
+                self.turtle.wait()
+                continue
+            try:
+                try:
+                    result = self.function(self.turtle, self.world)
+                    if isinstance(result, CoroutineType):
+                        run_to_completion(result)
+                except Exception as e:
+                    report_failsafe(self.events, self.turtle.team_name(), str(e))
+                if not self.turtle.did_wait():
+                    report_failsafe(self.events, self.turtle.team_name(), ("Prey" if self.turtle.is_prey() else "Predator")+" movement function failsafe 2 triggered (turtle did not wait)")
+                    self.turtle.wait()
+            except TurnBudgetExceeded:
+                wait_after_skipped_turn(self.turtle, self.watchdog, self.events)
+        if self.watchdog is not None:
+            self.watchdog.end_turn(self.turtle)
+
+
+class CooperativeScheduler:
+    def __init__(self, world: World, movement_functions_dict: Dict[str, Dict[bool, Callable[[CompetitionTurtle, World], None]]], is_game_over: Callable[[], bool], watchdog: Optional[Watchdog]=None, instrumentation=None, events: Optional[EventStream]=None):
+        self.world: World = world
+        self.watchdog: Optional[Watchdog] = watchdog
+        self.instrumentation = instrumentation
+        self.events: Optional[EventStream] = events
+        self.movement_functions_dict: Dict[str, Dict[bool, Callable[[CompetitionTurtle, World], None]]] = movement_functions_dict
+        self.__is_game_over: Callable[[], bool] = is_game_over
+        self.drivers: Dict[CompetitionTurtle, Union[InlineDriver, ThreadedDriver]] = {}
+
+    def start(self, turtles: List[CompetitionTurtle]):
+        for turtle in turtles:
+            turtle.start()
+            driver = InlineDriver(self.movement_functions_dict[turtle.team_name()][turtle.is_prey()], turtle, self.world, self.watchdog, self.events)
+            self.drivers[turtle] = driver
+            turtle.set_turn_driver(driver)
+
+    def stop(self):
+        for driver in self.drivers.values():
+            driver.stop()
+
+    def run_turns(self):
+        for turtle in list(self.world.turtles):
+            driver = self.drivers.get(turtle)
+            if driver is None:
+                continue
+            if self.instrumentation is not None and isinstance(driver, InlineDriver):
+                started = thread_time()
+                driver.step()
+                self.instrumentation.charge_team(turtle.team_name(), thread_time() - started)
+            else:
+                driver.step()
+            if driver.needs_thread():
+                threaded_driver = ThreadedDriver(driver.function, turtle, self.world, self.__is_game_over, self.watchdog, self.events)
+                self.drivers[turtle] = threaded_driver
+                turtle.set_turn_driver(threaded_driver)
+                if self.instrumentation is not None:
+                    self.instrumentation.watch_thread(turtle.team_name(), threaded_driver.thread_ident())
@@ -0,0 +1,19 @@
+from typing import Dict, List, Tuple
+
+
+class EloRatings:
+    def __init__(self, names: List[str], initial_rating: float=1500, k_factor: float=32):
+        self.__k_factor: float = k_factor
+        self.ratings: Dict[str, float] = {name: initial_rating for name in names}
+
+    def expected_score(self, name: str, opponent: str) -> float:
+        return 1 / (1 + 10 ** ((self.ratings[opponent] - self.ratings[name]) / 400))
+
+    def update(self, name: str, opponent: str, score: float):
+        expected = self.expected_score(name, opponent)
+        change = self.__k_factor * (score - expected)
+        self.ratings[name] += change
+        self.ratings[opponent] -= change
+
+    def ranking(self) -> List[Tuple[str, float]]:
+        return sorted(self.ratings.items(), key=lambda entry: entry[1], reverse=True)
@@ -1,18 +1,28 @@
 from math import sqrt, degrees, atan2
-from queue import Queue
-from random import random
-from threading import Barrier, Lock, Thread, Event
-from typing import Tuple, List, Callable, Dict
-from turtle import tracer, update
+from random import random, setstate
+from time import perf_counter, thread_time
+from threading import Barrier, Thread
+from types import GeneratorType, CoroutineType
+from typing import Tuple, List, Callable, Dict, Optional
 
 
 
+from turtle_game.action_buffer import apply_actions, WAIT
 from turtle_game.competition_turtle import CompetitionTurtle
-from turtle_game.relative_location import RelativeLocation
-from turtle_game.game_data_entry import GameDataEntry
+from turtle_game.event_sinks import ConsoleEventSink
+from turtle_game.event_stream import EventStream
+from turtle_game.match_events import TickEvent, KillEvent, PlacementEvent, TeamEliminatedEvent, MatchEndEvent
 
 from turtle_game.player import Player
-from turtle_game.stoppable_thread import StoppableThread
+from turtle_game.cooperative_scheduler import CooperativeScheduler, print_skipped_team_turn, run_to_completion, wait_after_skipped_turn
+from turtle_game.live_state import LiveState
+from turtle_game.match_snapshot import snapshot_engine, restore_engine, write_snapshot
+from turtle_game.neighbor_lists import NeighborLists
+from turtle_game.pairwise_frame import PairwiseFrame, numpy
+from turtle_game.spatial_index import SpatialIndex
+from turtle_game.state_store import StateStore
+from turtle_game.team_view import TeamView, validated_team_actions
+from turtle_game.watchdog import Watchdog, TurnBudgetExceeded
 from turtle_game.world import World
 
 
@@ -20,54 +30,127 @@ from turtle_game.world import World
 
 
 class Engine:
-    def __init__(self, world: World, players: List[Player], prey_per_team:int=125, predators_per_team:int=25, border_proximity:float=10, safe_mode: bool=False):
+    def __init__(self, world: World, players: List[Player], prey_per_team:int=125, predators_per_team:int=25, border_proximity:float=10, safe_mode: bool=False, renderer=None, vectorized: bool=False, cooperative: bool=False, max_ticks: Optional[int]=None, recorder=None, turn_budget_ms: float=50, max_skipped_turns: int=3, instrumentation=None, max_placement_rounds: int=100, events: Optional[EventStream]=None, snapshot_path: Optional[str]=None, snapshot_every: int=0):
+        # a stream passed in by the caller stays open after the match so the caller can keep using its sinks
+        self.__owns_events: bool = events is None
+        self.events: EventStream = events if events is not None else EventStream([ConsoleEventSink()])
         self.safe_mode = safe_mode
+        self.watchdog: Optional[Watchdog] = Watchdog(turn_budget_ms, max_skipped_turns) if safe_mode else None
+        self.recorder = recorder
+        self.instrumentation = instrumentation
+        self.max_ticks: Optional[int] = max_ticks
+        self.snapshot_path: Optional[str] = snapshot_path
+        self.snapshot_every: int = snapshot_every
+        self.random_state: Optional[tuple] = None
+        self.tick: int = 0
+        self.tick_durations: List[float] = []
+        self.survivors: List[Tuple[int, Dict[str, int]]] = []
+        self.cooperative: bool = cooperative
+        if vectorized and numpy is None:
+            self.events.failsafe(None, "NumPy is not installed, vectorized failsafe triggered")
+            vectorized = False
+        self.vectorized: bool = vectorized
         self.world: World = world
+        self.renderer = renderer
+        self.state_store: StateStore = StateStore()
         self.predator_kill_radius: int = world.predator_kill_radius()
+        self.spatial_index: SpatialIndex = SpatialIndex(self.predator_kill_radius)
         self.players: List[Player] = players
-        parties = len(players) * (prey_per_team + predators_per_team) + 1
+        self.team_movement_functions: Dict[str, Callable[[TeamView, World], object]] = {player.team_name: player.team_movement_function for player in players if player.team_movement_function is not None}
+        parties = (len(players) - len(self.team_movement_functions)) * (prey_per_team + predators_per_team) + 1
         self.move_barrier: Barrier = Barrier(parties)
         self.check_barrier: Barrier = Barrier(parties)
-        self.process_queue: Queue = Queue()
-        self.game_lock: Lock = Lock()
-        self.write_lock: Lock = Lock()
         self.movement_functions_dict: Dict[str, Dict[bool, Callable[[CompetitionTurtle], None]]] = {}
         self.__border_proximity = border_proximity
         self.__start: bool = False
+        self.__stopped: bool = False
+        self.neighbors = None
+        self.scheduler: CooperativeScheduler = CooperativeScheduler(self.world, self.movement_functions_dict, self.game_over, self.watchdog, self.instrumentation, self.events)
 
 
         for player in players:
-            tracer(0, 0)
             self.movement_functions_dict[player.team_name] = {True: player.prey_movement_function, False: player.predator_movement_function}
-            for i in range(prey_per_team):
-                location = player.prey_placement_function(self.world, i)
-                location = self.location_failsafe(location, True)
+            for location in self.placement_locations(player, True, prey_per_team):
                 turtle = CompetitionTurtle(player.team_name, True, player.prey_color, location[0], location[1],
-                                           self.move_barrier, self.check_barrier, self.process_queue, self.game_lock, self.can_move_without_wait, self.can_eat, self.game_over, self.is_turtle_on_left_edge, self.is_turtle_on_top_edge, self.is_turtle_on_right_edge, self.is_turtle_on_bottom_edge, self.is_turtle_in_top_left_corner, self.is_turtle_in_top_right_corner, self.is_turtle_in_bottom_right_corner, self.is_turtle_in_bottom_left_corner, 9)
+                                           self, 9, self.state_store)
                 self.world.turtles.append(turtle)
                 self.world.prey.append(turtle)
 
-            for i in range(predators_per_team):
-                location = player.predator_placement_function(self.world, i)
-                location = self.location_failsafe(location, False)
+            for location in self.placement_locations(player, False, predators_per_team):
                 turtle = CompetitionTurtle(player.team_name, False, player.predator_color, location[0], location[1],
-                                           self.move_barrier, self.check_barrier, self.process_queue, self.game_lock, self.can_move_without_wait, self.can_eat, self.game_over, self.is_turtle_on_left_edge, self.is_turtle_on_top_edge, self.is_turtle_on_right_edge, self.is_turtle_on_bottom_edge, self.is_turtle_in_top_left_corner, self.is_turtle_in_top_right_corner, self.is_turtle_in_bottom_right_corner, self.is_turtle_in_bottom_left_corner, 12)
+                                           self, 12, self.state_store)
                 self.world.turtles.append(turtle)
                 self.world.predators.append(turtle)
 
-        tracer(0, 0)
-        while(not self.check_turtles(False)):
-            pass
-        update()
+        self.turtles_by_slot: List[CompetitionTurtle] = list(self.world.turtles)
+        self.live_state: LiveState = LiveState(self.world, self.players)
+        self.placement_relocations: int = self.resolve_placement(max_placement_rounds)
+        self.events.emit(PlacementEvent(self.tick, self.placement_relocations))
+        # placement may give up with prey still inside a kill radius, so the first tick is set up without checking kills
+        self.index_turtles()
+        self.render()
 
-    def location_failsafe(self, location, is_prey):
+    def snapshot(self) -> bytes:
+        return snapshot_engine(self)
+
+    def restore(self, blob: bytes):
+        restore_engine(self, blob)
+        self.render()
+
+    def render(self, final: bool=False):
+        if self.renderer is not None and (final or self.tick % self.renderer.every_nth_tick == 0):
+            self.renderer.frames.push(self.tick, self.state_store)
+
+    def location_failsafe(self, location, is_prey, team_name: Optional[str]=None):
         if not (isinstance(location, Tuple) and len(location) == 2 and isinstance(location[0], float) and isinstance(
                 location[1], float)):
-            print(("Prey" if is_prey else "Predator"),"placement function failsafe 2 triggered")
+            self.events.failsafe(team_name, ("Prey" if is_prey else "Predator")+" placement function failsafe 2 triggered")
             location = self.world.random_location()
         return location
 
 
+    def placement_locations(self, player: Player, is_prey: bool, count: int) -> List[Tuple[float, float]]:
+        batch_placement_function = player.prey_batch_placement_function if is_prey else player.predator_batch_placement_function
+        if batch_placement_function is not None:
+            try:
+                locations = list(batch_placement_function(self.world, count))
+            except Exception as e:
+                self.events.failsafe(player.team_name, str(e))
+                locations = []
+            if len(locations) == count:
+                return [self.location_failsafe(location, is_prey, player.team_name) for location in locations]
+            self.events.failsafe(player.team_name, ("Prey" if is_prey else "Predator")+" batch placement function failsafe triggered (expected "+str(count)+" locations)")
+        placement_function = player.prey_placement_function if is_prey else player.predator_placement_function
+        return [self.location_failsafe(placement_function(self.world, i), is_prey, player.team_name) for i in range(count)]
+
+    def resolve_placement(self, max_rounds: int) -> int:
+        for turtle in self.world.turtles:
+            self.move_inbounds(turtle)
+        # predators never move during placement so they are indexed once and only relocated prey are checked again
+        predator_index = SpatialIndex(self.predator_kill_radius)
+        predator_index.rebuild(self.world.predators)
+        relocations = 0
+        conflicting = self.prey_in_kill_radius(predator_index, self.world.prey)
+        for _ in range(max_rounds):
+            if not conflicting:
+                break
+            for prey in conflicting:
+                location = self.world.random_location()
+                prey.goto(location[0], location[1])
+            relocations += len(conflicting)
+            conflicting = self.prey_in_kill_radius(predator_index, conflicting)
+        if conflicting:
+            self.events.failsafe(None, "Placement failsafe triggered ( "+str(len(conflicting))+" prey still start inside a predator's kill radius after "+str(max_rounds)+" rounds )")
+        return relocations
+
+    def prey_in_kill_radius(self, predator_index: SpatialIndex, prey: List[CompetitionTurtle]) -> List[CompetitionTurtle]:
+        conflicting: List[CompetitionTurtle] = []
+        for turtle in prey:
+            x, y = turtle.position()
+            if predator_index.within(x, y, self.predator_kill_radius, lambda predator: predator.team_name() != turtle.team_name()):
+                conflicting.append(turtle)
+        return conflicting
+
     def can_move_without_wait(self, turtle: CompetitionTurtle):
         return not self.__start or not self.world.is_in_bounds(turtle)
     def can_eat(self, predator: CompetitionTurtle, prey: CompetitionTurtle):
@@ -80,47 +163,68 @@ class Engine:
         for turtle in self.world.turtles:
             if not self.move_inbounds(turtle) and not can_die:
                 return False
-            if not self.update_engine_lists(can_die, turtle) and not can_die:
-                return False
-            turtle.ally_predators_relative_locations.sort(key=lambda x: x.distance())
-            turtle.ally_prey_relative_locations.sort(key=lambda x: x.distance())
-            turtle.enemy_predators_relative_locations.sort(key=lambda x: x.distance())
-            turtle.enemy_prey_relative_locations.sort(key=lambda x: x.distance())
+        if self.vectorized:
+            return self.check_turtles_vectorized(can_die)
+        self.spatial_index.rebuild(self.world.turtles)
+        if not self.resolve_kills(can_die) and not can_die:
+            return False
+        self.share_neighbors(NeighborLists(self.world.turtles, self.spatial_index), self.spatial_index)
         return True
 
+    def index_turtles(self):
+        if self.vectorized:
+            self.share_neighbors(PairwiseFrame(self.world.turtles, self.state_store))
+            return
+        self.spatial_index.rebuild(self.world.turtles)
+        self.share_neighbors(NeighborLists(self.world.turtles, self.spatial_index), self.spatial_index)
 
-
-    def update_engine_lists(self, can_die: bool, turtle: CompetitionTurtle)-> bool:
-        turtle.ally_predators_relative_locations = []
-        turtle.ally_prey_relative_locations = []
-        turtle.enemy_predators_relative_locations = []
-        turtle.enemy_prey_relative_locations = []
-        for other_turtle in self.world.turtles:
-            if turtle != other_turtle:
-                distance = turtle.distance(other_turtle)
-                angle = turtle.angle(other_turtle)
-                if turtle.team_name() == other_turtle.team_name():
-                    if other_turtle.is_prey():
-                        turtle.ally_prey_relative_locations.append(RelativeLocation(angle, distance))
-                    else:
-                        turtle.ally_predators_relative_locations.append(RelativeLocation(angle, distance))
+    def share_neighbors(self, neighbors, spatial_index: Optional[SpatialIndex]=None):
+        self.neighbors = neighbors
+        for turtle in self.world.turtles:
+            turtle.set_neighbors(neighbors)
+        self.world.begin_tick(spatial_index)
+
+    def resolve_kills(self, can_die: bool) -> bool:
+        for predator in self.world.predators:
+            if not predator.is_alive():
+                continue
+            x, y = predator.position()
+            for distance, prey in self.spatial_index.within(x, y, self.predator_kill_radius, lambda other: other.is_prey() and other.is_alive() and other.team_name() != predator.team_name()):
+                if can_die:
+                    predator.eat(prey)
+                    self.live_state.kill(prey)
+                    self.events.emit(KillEvent(self.events.tick, predator.slot(), predator.team_name(), prey.slot(), prey.team_name()))
                 else:
-                    if other_turtle.is_prey():
-                        if self.can_eat(turtle, other_turtle):
-                            if can_die:
-                                turtle.eat(other_turtle)
-                                other_turtle.hide()
-                                self.world.prey[:] = [x for x in self.world.prey if not x == other_turtle]
-                                self.world.turtles[:] = [x for x in self.world.turtles if not x == other_turtle]
-                            else:
-                                location = self.world.random_location()
-                                other_turtle.goto(location[0],location[1])
-                                return False
-                        turtle.enemy_prey_relative_locations.append(RelativeLocation(angle, distance))
-                    else:
-                        turtle.enemy_predators_relative_locations.append(RelativeLocation(angle, distance))
+                    location = self.world.random_location()
+                    prey.goto(location[0],location[1])
+                    return False
+        self.live_state.compact()
         return True
 
+    def check_turtles_vectorized(self, can_die: bool) -> bool:
+        frame = PairwiseFrame(self.world.turtles, self.state_store)
+        kills = frame.kills(self.predator_kill_radius)
+        eaten_columns = numpy.flatnonzero(kills.any(axis=0))
+        if len(eaten_columns) > 0:
+            if not can_die:
+                for column in eaten_columns:
+                    location = self.world.random_location()
+                    self.world.turtles[column].goto(location[0], location[1])
+                return False
+            # each prey goes to the first predator in world.predators that reaches it
+            predator_order = {predator: order for order, predator in enumerate(self.world.predators)}
+            ranks = numpy.fromiter((predator_order.get(turtle, len(predator_order)) for turtle in self.world.turtles), dtype=numpy.intp, count=len(self.world.turtles))
+            eaters = numpy.where(kills, ranks[:, None], len(predator_order)).argmin(axis=0)
+            for column in eaten_columns:
+                predator = self.world.turtles[eaters[column]]
+                prey = self.world.turtles[column]
+                predator.eat(prey)
+                self.live_state.kill(prey)
+                self.events.emit(KillEvent(self.events.tick, predator.slot(), predator.team_name(), prey.slot(), prey.team_name()))
+            self.live_state.compact()
+            frame = PairwiseFrame(self.world.turtles, self.state_store)
+        self.share_neighbors(frame)
+        return True
 
     def move_inbounds(self, turtle):
         x = turtle.position()[0]
@@ -145,13 +249,24 @@ class Engine:
         return stayed
 
     def number_prey_alive(self, player: Player) -> int:
-        return len(list(filter(lambda x: x.team_name() == player.team_name, self.world.prey)))
+        return self.live_state.prey_alive[player.team_name]
+
+    def teams_alive(self) -> int:
+        return self.live_state.teams_with_prey
 
     def game_over(self) -> bool:
-        count = 0
-        for player in self.players:
-            count += 1 if (self.number_prey_alive(player) > 0) else 0
-        return count <= 1
+        return self.__stopped or self.teams_alive() <= 1
+
+    def stop(self):
+        self.__stopped = True
+        self.scheduler.stop()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        self.move_barrier.abort()
+        self.check_barrier.abort()
+
+    def record_survivors(self):
+        self.survivors.append((self.tick, {player.team_name: self.number_prey_alive(player) for player in self.players}))
 
     def is_turtle_on_left_edge(self, turtle: CompetitionTurtle) -> bool:
         return abs(turtle.position()[0]-self.world.world_dimensions.min_x()) < self.__border_proximity
@@ -170,72 +285,171 @@ class Engine:
     def is_turtle_in_bottom_left_corner(self, turtle: CompetitionTurtle) -> bool:
         return self.is_turtle_on_left_edge(turtle) and self.is_turtle_on_bottom_edge(turtle)
     def winning_player(self) -> Player:
-        for player in self.players:
-            if (self.number_prey_alive(player) > 0):
-                return player
+        return self.live_state.winning_player()
 
     def turtle_thread_function(self, function: Callable[[CompetitionTurtle, World], None], turtle: CompetitionTurtle):
-
-        invalid_function: bool = False
+        if self.watchdog is not None:
+            turtle.set_watchdog(self.watchdog)
+            self.watchdog.begin_turn(turtle)
         while not self.game_over():
-            if not invalid_function:
+            if self.watchdog is None or not self.watchdog.exhausted(turtle):
                 turtle.reset_wait()
                 try:
-                    if self.safe_mode:
-                        test_thred = StoppableThread(target=function,args=(turtle, self.world,))
-                        test_thred.start()
-
-                        while test_thred.is_alive():
-                            Event().wait(timeout=.25)
-                            if not turtle.did_wait():
-                                turtle.wait()
-                                test_thred.stop()
-                                invalid_function = True
-                    else:
-                        function(turtle, self.world)
-                except Exception as e:
-                    print(e)
-                    turtle.wait()
-                if not turtle.did_wait():
-                    print(("Prey" if turtle.is_prey() else "Predator"),"movement function failsafe 2 triggered (turtle did not wait)")
-                    turtle.wait()
+                    try:
+                        result = function(turtle, self.world)
+                        if isinstance(result, CoroutineType):
+                            run_to_completion(result)
+                        elif isinstance(result, GeneratorType):
+                            for _ in result:
+                                if not turtle.did_wait():
+                                    turtle.wait()
+                                turtle.reset_wait()
+                    except Exception as e:
+                        self.events.failsafe(turtle.team_name(), str(e))
+                        turtle.wait()
+                    if not turtle.did_wait():
+                        self.events.failsafe(turtle.team_name(), ("Prey" if turtle.is_prey() else "Predator")+" movement function failsafe 2 triggered (turtle did not wait)")
+                        turtle.wait()
+                except TurnBudgetExceeded:
+                    wait_after_skipped_turn(turtle, self.watchdog, self.events)
             else:
-                print(("Prey" if turtle.is_prey() else "Predator"), "movement function failsafe 3 triggered (turtle took too long to decide turn) shutting down turtle behavior")
                 turtle.wait()
+        if self.watchdog is not None:
+            self.watchdog.end_turn(turtle)
+
+    def run_team_turns(self):
+        for team_name, function in self.team_movement_functions.items():
+            turtles = [turtle for turtle in self.world.turtles if turtle.team_name() == team_name]
+            if not turtles:
+                continue
+            result = None
+            if self.watchdog is None or not self.watchdog.exhausted(team_name):
+                view = TeamView(team_name, turtles, self.neighbors)
+                started = thread_time()
+                try:
+                    if self.watchdog is not None:
+                        self.watchdog.begin_turn(team_name)
+                    try:
+                        result = function(view, self.world)
+                    except Exception as e:
+                        self.events.failsafe(team_name, str(e))
+                    if self.watchdog is not None and not self.watchdog.end_turn(team_name):
+                        print_skipped_team_turn(team_name, self.watchdog, self.events)
+                        result = None
+                except TurnBudgetExceeded:
+                    self.watchdog.end_turn(team_name)
+                    print_skipped_team_turn(team_name, self.watchdog, self.events)
+                    result = None
+                if self.instrumentation is not None:
+                    self.instrumentation.charge_team(team_name, thread_time() - started)
+            actions = validated_team_actions(result, len(turtles))
+            if actions is None:
+                if result is not None:
+                    self.events.failsafe(team_name, "Team movement function failsafe 2 triggered (expected actions and values for "+str(len(turtles))+" turtles)")
+                actions = [(WAIT, 0.0)] * len(turtles)
+            for turtle, (action, value) in zip(turtles, actions):
+                turtle.take_team_action(action, value)
+
+    def per_turtle_controlled(self) -> List[CompetitionTurtle]:
+        return [turtle for turtle in self.world.turtles if turtle.team_name() not in self.team_movement_functions]
 
     def start_threads(self):
-        for turtle in self.world.turtles:
+        for turtle in self.per_turtle_controlled():
             turtle.start()
             thread = Thread(target=(self.turtle_thread_function), args=(self.movement_functions_dict[turtle.team_name()][turtle.is_prey()], turtle))
             thread.setDaemon(True)
             thread.start()
+            if self.instrumentation is not None:
+                self.instrumentation.watch_thread(turtle.team_name(), thread.ident)
 
     def run(self):
         self.__start = True
-        self.start_threads()
+        if self.random_state is not None:
+            setstate(self.random_state)
+        if self.watchdog is not None:
+            self.watchdog.start()
+        for turtle in self.world.turtles:
+            if turtle.team_name() in self.team_movement_functions:
+                turtle.start()
+        if self.cooperative:
+            self.scheduler.start(self.per_turtle_controlled())
+        else:
+            self.start_threads()
         old_count = len(self.world.turtles)
+        eliminated = set()
+        self.record_survivors()
+        self.events.emit(TickEvent(self.tick, dict(self.live_state.prey_alive)))
+        if self.recorder is not None:
+            self.recorder.start(self.world, self.players, self.turtles_by_slot, self.state_store)
         while not self.game_over():
-            try:
-                self.move_barrier.wait()
-            except:
-                pass
-            tracer(0, 0)
-            while not self.process_queue.empty():
-                command = self.process_queue.get()
-                command.function(command.value)
-
+            if self.max_ticks is not None and self.tick >= self.max_ticks:
+                self.stop()
+                break
+            tick_started = perf_counter()
+            self.events.tick = self.tick + 1
+            instrumentation = self.instrumentation
+            if instrumentation is not None:
+                instrumentation.start_tick(self.tick)
+            self.run_team_turns()
+            if self.cooperative:
+                self.scheduler.run_turns()
+            else:
+                try:
+                    self.move_barrier.wait()
+                except:
+                    pass
+            if instrumentation is not None:
+                instrumentation.phase("turns")
+            commands = apply_actions(self.state_store, self.vectorized)
+            if instrumentation is not None:
+                instrumentation.phase("commands")
+                instrumentation.count_commands(commands)
+
+            alive = len(self.world.turtles)
             self.check_turtles(True)
-            update()
+            self.tick += 1
+            self.events.emit(TickEvent(self.tick, dict(self.live_state.prey_alive)))
+            if instrumentation is not None:
+                instrumentation.phase("check")
+                instrumentation.count_kills(alive - len(self.world.turtles))
+            self.render()
+            if instrumentation is not None:
+                instrumentation.phase("render")
+            if self.recorder is not None:
+                self.recorder.record()
             if(old_count != len(self.world.turtles)):
-                for player in self.players:
-                    print(GameDataEntry(player.team_name, self.number_prey_alive(player)))
+                for team_name, count in self.live_state.prey_alive.items():
+                    if count == 0 and team_name not in eliminated:
+                        eliminated.add(team_name)
+                        self.events.emit(TeamEliminatedEvent(self.tick, team_name))
                 old_count = len(self.world.turtles)
-            try:
-                self.check_barrier.wait()
-            except:
-                pass
-        print("Winner:",self.winning_player().team_name)
-        return self.winning_player()
+                self.record_survivors()
+            if self.snapshot_path is not None and self.snapshot_every > 0 and self.tick % self.snapshot_every == 0:
+                write_snapshot(self.snapshot_path, self.snapshot())
+            if instrumentation is not None:
+                instrumentation.phase("record")
+            self.tick_durations.append(perf_counter() - tick_started)
+            if not self.cooperative:
+                try:
+                    self.check_barrier.wait()
+                except:
+                    pass
+                if instrumentation is not None:
+                    instrumentation.phase("check_barrier")
+            if instrumentation is not None:
+                instrumentation.end_tick(len(self.world.turtles))
+        self.render(True)
+        # releases the turtles that were moved to threads of their own and the barriers the threaded turtles wait on
+        self.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.instrumentation is not None:
+            self.instrumentation.close()
+        winner: Optional[Player] = self.winning_player() if self.teams_alive() <= 1 else None
+        self.events.emit(MatchEndEvent(self.tick, winner.team_name if winner is not None else None, dict(self.live_state.prey_alive)))
+        if self.__owns_events:
+            self.events.close()
+        return winner
 
 
 
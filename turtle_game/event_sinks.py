@@ -0,0 +1,150 @@
+import json
+import struct
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from turtle_game.game_data_entry import GameDataEntry
+from turtle_game.match_events import TickEvent, FailsafeEvent, PlacementEvent, TeamEliminatedEvent, MatchEndEvent
+
+ALIVE_COUNTS_MAGIC = b"TGAC"
+
+
+class ConsoleEventSink:
+    def __init__(self):
+        self.__last: Dict[str, int] = {}
+
+    def write(self, events: list):
+        lines: List[str] = []
+        for event in events:
+            if isinstance(event, TickEvent):
+                if event.prey_alive != self.__last:
+                    if self.__last:
+                        lines.extend(str(GameDataEntry(team_name, count)) for team_name, count in event.prey_alive.items())
+                    self.__last = event.prey_alive
+            elif isinstance(event, (FailsafeEvent, PlacementEvent, TeamEliminatedEvent, MatchEndEvent)):
+                lines.append(str(event))
+        if lines:
+            print("\n".join(lines))
+
+    def close(self):
+        pass
+
+
+class JsonLinesEventSink:
+    def __init__(self, path: str):
+        self.__file = open(path, "w")
+
+    def write(self, events: list):
+        self.__file.write("".join(json.dumps(event.to_dict()) + "\n" for event in events))
+
+    def close(self):
+        self.__file.close()
+
+
+class AliveCountsSink:
+    def __init__(self, path: str):
+        self.path: str = path
+        self.ticks: array = array('i')
+        self.columns: Dict[str, array] = {}
+
+    def write(self, events: list):
+        for event in events:
+            if isinstance(event, TickEvent):
+                if not self.columns:
+                    self.columns = {team_name: array('i') for team_name in event.prey_alive}
+                self.ticks.append(event.tick)
+                for team_name, column in self.columns.items():
+                    column.append(event.prey_alive.get(team_name, 0))
+
+    def close(self):
+        header = json.dumps({"teams": list(self.columns), "ticks": len(self.ticks)}).encode("utf-8")
+        with open(self.path, "wb") as file:
+            file.write(ALIVE_COUNTS_MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            # one int32 column for the ticks, then one per team
+            file.write(self.ticks.tobytes())
+            for column in self.columns.values():
+                file.write(column.tobytes())
+
+
+def read_alive_counts(path: str) -> Tuple[array, Dict[str, array]]:
+    with open(path, "rb") as file:
+        if file.read(len(ALIVE_COUNTS_MAGIC)) != ALIVE_COUNTS_MAGIC:
+            raise ValueError(path+" is not an alive counts file")
+        header = json.loads(file.read(struct.unpack("<I", file.read(4))[0]).decode("utf-8"))
+        ticks = array('i')
+        ticks.frombytes(file.read(header["ticks"] * ticks.itemsize))
+        columns: Dict[str, array] = {}
+        for team_name in header["teams"]:
+            column = array('i')
+            column.frombytes(file.read(header["ticks"] * column.itemsize))
+            columns[team_name] = column
+    return ticks, columns
+
+
+class SurvivalCurves:
+    def __init__(self):
+        self.__curves: Dict[str, List[Tuple[int, int]]] = {}
+        self.winner: Optional[str] = None
+        self.ticks: int = 0
+
+    def record(self, tick: int, prey_alive: Dict[str, int]):
+        for team_name, count in prey_alive.items():
+            curve = self.__curves.setdefault(team_name, [])
+            if not curve or curve[-1][1] != count:
+                curve.append((tick, count))
+        self.ticks = tick
+
+    def write(self, events: list):
+        for event in events:
+            if isinstance(event, TickEvent):
+                self.record(event.tick, event.prey_alive)
+            elif isinstance(event, MatchEndEvent):
+                self.winner = event.winner
+                self.ticks = event.tick
+
+    def close(self):
+        pass
+
+    def teams(self) -> List[str]:
+        return list(self.__curves)
+
+    def curve(self, team_name: str) -> List[Tuple[int, int]]:
+        return list(self.__curves.get(team_name, []))
+
+    def alive_at(self, team_name: str, tick: int) -> int:
+        curve = self.__curves.get(team_name, [])
+        index = bisect_right(curve, (tick, float("inf"))) - 1
+        return curve[index][1] if index >= 0 else 0
+
+    def first_tick_at_or_below(self, team_name: str, count: float) -> Optional[int]:
+        for tick, alive in self.__curves.get(team_name, []):
+            if alive <= count:
+                return tick
+        return None
+
+    def half_life(self, team_name: str) -> Optional[int]:
+        curve = self.__curves.get(team_name)
+        if not curve:
+            return None
+        return self.first_tick_at_or_below(team_name, curve[0][1] / 2)
+
+    def elimination_tick(self, team_name: str) -> Optional[int]:
+        return self.first_tick_at_or_below(team_name, 0)
+
+    def __str__(self):
+        lines = []
+        for team_name in self.__curves:
+            lines.append(team_name+" start "+str(self.__curves[team_name][0][1])+" end "+str(self.__curves[team_name][-1][1])
+                         +" half life "+str(self.half_life(team_name))+" eliminated "+str(self.elimination_tick(team_name)))
+        return "\n".join(lines)
+
+
+def survival_curves_from_file(path: str) -> SurvivalCurves:
+    ticks, columns = read_alive_counts(path)
+    curves = SurvivalCurves()
+    for index, tick in enumerate(ticks):
+        curves.record(tick, {team_name: column[index] for team_name, column in columns.items()})
+    return curves
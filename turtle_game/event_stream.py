@@ -0,0 +1,58 @@
+from collections import deque
+from threading import Thread, Event
+from typing import Deque, List, Optional
+
+from turtle_game.match_events import FailsafeEvent
+
+
+class EventStream:
+    def __init__(self, sinks: Optional[list]=None, flush_interval: float=.1):
+        self.sinks: list = sinks if sinks is not None else []
+        self.tick: int = 0
+        self.flush_interval: float = flush_interval
+        self.__buffer: Deque[object] = deque()
+        self.__stop_event: Event = Event()
+        self.__closed: bool = False
+        self.__thread: Thread = Thread(target=self.__run)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def emit(self, event):
+        self.__buffer.append(event)
+
+    def failsafe(self, team_name: Optional[str], message: str):
+        self.__buffer.append(FailsafeEvent(self.tick, team_name, message))
+
+    def __drain(self):
+        events: List[object] = []
+        buffer = self.__buffer
+        while buffer:
+            events.append(buffer.popleft())
+        if not events:
+            return
+        for sink in self.sinks:
+            try:
+                sink.write(events)
+            except Exception as e:
+                print("Event sink failsafe triggered (", e, ")")
+
+    def __run(self):
+        while not self.__stop_event.wait(self.flush_interval):
+            self.__drain()
+
+    def close(self):
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__stop_event.set()
+        self.__thread.join()
+        self.__drain()
+        for sink in self.sinks:
+            sink.close()
+
+
+def report_failsafe(events: Optional[EventStream], team_name: Optional[str], message: str):
+    if events is None:
+        print(message)
+    else:
+        events.failsafe(team_name, message)
@@ -0,0 +1,38 @@
+from array import array
+from collections import deque
+from typing import Optional, Deque
+
+from turtle_game.state_store import StateStore
+
+
+class Snapshot:
+    def __init__(self, sequence: int, tick: int, state_store: StateStore):
+        self.sequence: int = sequence
+        self.tick: int = tick
+        self.x: array = state_store.x[:]
+        self.y: array = state_store.y[:]
+        self.heading: array = state_store.heading[:]
+        self.alive: array = state_store.alive[:]
+
+
+class FrameBuffer:
+    def __init__(self, capacity: int=4):
+        self.__frames: Deque[Snapshot] = deque(maxlen=capacity)
+        self.__pushed: int = 0
+        self.__last_sequence: int = 0
+        self.dropped: int = 0
+
+    def push(self, tick: int, state_store: StateStore):
+        self.__pushed += 1
+        self.__frames.append(Snapshot(self.__pushed, tick, state_store))
+
+    def latest(self) -> Optional[Snapshot]:
+        try:
+            snapshot = self.__frames[-1]
+        except IndexError:
+            return None
+        if snapshot.sequence == self.__last_sequence:
+            return None
+        self.dropped += snapshot.sequence - self.__last_sequence - 1
+        self.__last_sequence = snapshot.sequence
+        return snapshot
@@ -0,0 +1,88 @@
+import cProfile
+import time
+from threading import Lock
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from turtle_game.tick_metrics import TickMetrics
+
+
+class Instrumentation:
+    def __init__(self, sinks: Optional[list]=None, profile_ticks: Optional[Tuple[int, int]]=None, profile_path: str="engine.prof"):
+        self.sinks: list = sinks if sinks is not None else []
+        self.profile_ticks: Optional[Tuple[int, int]] = profile_ticks
+        self.profile_path: str = profile_path
+        self.__metrics: TickMetrics = TickMetrics(0)
+        self.__last: float = 0.0
+        self.__draw_seconds: float = 0.0
+        self.__draw_lock: Lock = Lock()
+        self.__threads: List[list] = []
+        self.__profiler: Optional[cProfile.Profile] = None
+        self.__warned: bool = False
+
+    def start_tick(self, tick: int):
+        if self.profile_ticks is not None and tick == self.profile_ticks[0]:
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+        self.__metrics = TickMetrics(tick)
+        self.__last = perf_counter()
+
+    def phase(self, name: str):
+        now = perf_counter()
+        self.__metrics.phases[name] = self.__metrics.phases.get(name, 0.0) + now - self.__last
+        self.__last = now
+
+    def count_commands(self, commands: int):
+        self.__metrics.commands += commands
+
+    def count_kills(self, kills: int):
+        self.__metrics.kills += kills
+
+    def charge_team(self, team_name: str, seconds: float):
+        self.__metrics.team_cpu[team_name] = self.__metrics.team_cpu.get(team_name, 0.0) + seconds
+
+    def record_draw(self, seconds: float):
+        with self.__draw_lock:
+            self.__draw_seconds += seconds
+
+    def watch_thread(self, team_name: str, thread_ident: int):
+        try:
+            clock = time.pthread_getcpuclockid(thread_ident)
+            self.__threads.append([team_name, clock, time.clock_gettime(clock)])
+        except (AttributeError, OSError):
+            if not self.__warned:
+                print("Per thread cpu clocks are not available, team cpu failsafe triggered (threaded turtles are not charged)")
+                self.__warned = True
+
+    def __charge_threads(self):
+        for watched in self.__threads:
+            try:
+                now = time.clock_gettime(watched[1])
+            except OSError:
+                continue
+            self.charge_team(watched[0], now - watched[2])
+            watched[2] = now
+
+    def end_tick(self, turtles: int):
+        metrics = self.__metrics
+        self.__charge_threads()
+        with self.__draw_lock:
+            metrics.phases["draw"] = self.__draw_seconds
+            self.__draw_seconds = 0.0
+        metrics.turtles = turtles
+        for sink in self.sinks:
+            sink.record(metrics)
+        if self.__profiler is not None and metrics.tick >= self.profile_ticks[1] - 1:
+            self.__dump_profile()
+
+    def __dump_profile(self):
+        self.__profiler.disable()
+        self.__profiler.dump_stats(self.profile_path)
+        self.__profiler = None
+        print("Profile of ticks", self.profile_ticks[0], "to", self.profile_ticks[1], "written to", self.profile_path)
+
+    def close(self):
+        if self.__profiler is not None:
+            self.__dump_profile()
+        for sink in self.sinks:
+            sink.close()
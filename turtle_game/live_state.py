@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.player import Player
+from turtle_game.world import World
+
+
+class LiveState:
+    def __init__(self, world: World, players: List[Player]):
+        self.world: World = world
+        self.players: Dict[str, Player] = {player.team_name: player for player in players}
+        self.prey_alive: Dict[str, int] = {player.team_name: 0 for player in players}
+        self.predators_alive: Dict[str, int] = {player.team_name: 0 for player in players}
+        self.__turtle_positions: Dict[CompetitionTurtle, int] = {}
+        self.__prey_positions: Dict[CompetitionTurtle, int] = {}
+        self.__dead: List[CompetitionTurtle] = []
+        for position, turtle in enumerate(world.turtles):
+            self.__turtle_positions[turtle] = position
+            if turtle.is_prey():
+                self.prey_alive[turtle.team_name()] += 1
+            else:
+                self.predators_alive[turtle.team_name()] += 1
+        for position, turtle in enumerate(world.prey):
+            self.__prey_positions[turtle] = position
+        self.teams_with_prey: int = sum(1 for count in self.prey_alive.values() if count > 0)
+
+    def kill(self, turtle: CompetitionTurtle):
+        turtle.hide()
+        self.__dead.append(turtle)
+        counts = self.prey_alive if turtle.is_prey() else self.predators_alive
+        counts[turtle.team_name()] -= 1
+        if turtle.is_prey() and counts[turtle.team_name()] == 0:
+            self.teams_with_prey -= 1
+
+    def compact(self) -> int:
+        dead = len(self.__dead)
+        for turtle in self.__dead:
+            self.__swap_remove(self.world.turtles, self.__turtle_positions, turtle)
+            if turtle in self.__prey_positions:
+                self.__swap_remove(self.world.prey, self.__prey_positions, turtle)
+        self.__dead = []
+        return dead
+
+    def __swap_remove(self, turtles: List[CompetitionTurtle], positions: Dict[CompetitionTurtle, int], turtle: CompetitionTurtle):
+        position = positions.pop(turtle)
+        last = turtles.pop()
+        if last is not turtle:
+            turtles[position] = last
+            positions[last] = position
+
+    def winning_player(self) -> Optional[Player]:
+        if self.teams_with_prey != 1:
+            return None
+        for team_name, count in self.prey_alive.items():
+            if count > 0:
+                return self.players[team_name]
@@ -1,8 +1,9 @@
 from random import randint
-from turtle import Screen
-from typing import List
+from typing import List, Optional
 
 from turtle_game.engine import Engine
+from turtle_game.match_recorder import MatchRecorder
+from turtle_game.match_snapshot import read_snapshot
 from turtle_game.player import Player
 from turtle_game.world import World
 
@@ -40,13 +41,28 @@ def randPass(minLen):
             toReturn += scs[randint(0,len(scs)-1)]
     return toReturn
 
-def run_match(people, world_width: int=700, world_height: int=700, predator_kill_radius=30, prey_per_team:int=45, predators_per_team:int=5, background=True) -> Player:
+def create_match_engine(people, world_width: int=700, world_height: int=700, predator_kill_radius=30, prey_per_team:int=45, predators_per_team:int=5, background=True, headless: bool=False, vectorized: bool=False, cooperative: bool=False, max_ticks: Optional[int]=None, record_path: Optional[str]=None, seed: Optional[int]=None, fps: float=30, every_nth_tick: int=1, safe_mode: bool=False, turn_budget_ms: float=50, instrumentation=None, events=None, snapshot_path: Optional[str]=None, snapshot_every: int=0, resume_path: Optional[str]=None) -> Engine:
     players: List[Player] = []
     team_names: List[str] = []
     for person in people:
-        players.append(Player((person.team_name + randPass(5)) if person.team_name in team_names else person.team_name, person.prey_color, person.predator_color, person.prey_placement_function, person.predator_placement_function, person.prey_movement_function, person.predator_movement_function))
+        players.append(Player((person.team_name + randPass(5)) if person.team_name in team_names else person.team_name, person.prey_color, person.predator_color, person.prey_placement_function, person.predator_placement_function, person.prey_movement_function, person.predator_movement_function, person.prey_batch_placement_function, person.predator_batch_placement_function, person.team_movement_function, person.batched_team_movement_function))
         team_names.append(person.team_name)
     world: World = World(world_width,world_height, predator_kill_radius,background)
-    engine: Engine = Engine(world, players, prey_per_team, predators_per_team)
+    renderer = None
+    if not headless:
+        from turtle_game.renderer import Renderer
+        renderer = Renderer(world, fps, every_nth_tick)
+    recorder = None
+    if record_path is not None:
+        recorder = MatchRecorder(record_path, seed)
+    engine = Engine(world, players, prey_per_team, predators_per_team, renderer=renderer, vectorized=vectorized, cooperative=cooperative, max_ticks=max_ticks, recorder=recorder, safe_mode=safe_mode, turn_budget_ms=turn_budget_ms, instrumentation=instrumentation, events=events, snapshot_path=snapshot_path, snapshot_every=snapshot_every)
+    if resume_path is not None:
+        engine.restore(read_snapshot(resume_path))
+    return engine
+
+def run_match(people, world_width: int=700, world_height: int=700, predator_kill_radius=30, prey_per_team:int=45, predators_per_team:int=5, background=True, headless: bool=False, vectorized: bool=False, cooperative: bool=False, max_ticks: Optional[int]=None, fps: float=30, every_nth_tick: int=1, safe_mode: bool=False, turn_budget_ms: float=50, instrumentation=None, events=None, snapshot_path: Optional[str]=None, snapshot_every: int=0, resume_path: Optional[str]=None) -> Player:
+    engine: Engine = create_match_engine(people, world_width, world_height, predator_kill_radius, prey_per_team, predators_per_team, background, headless, vectorized, cooperative, max_ticks, fps=fps, every_nth_tick=every_nth_tick, safe_mode=safe_mode, turn_budget_ms=turn_budget_ms, instrumentation=instrumentation, events=events, snapshot_path=snapshot_path, snapshot_every=snapshot_every, resume_path=resume_path)
+    if engine.renderer is not None:
+        return engine.renderer.run(engine)
     winner: Player = engine.run()
-    return winner
\ No newline at end of file
+    return winner
@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+
+
+class TickEvent:
+    kind = "tick"
+
+    def __init__(self, tick: int, prey_alive: Dict[str, int]):
+        self.tick: int = tick
+        self.prey_alive: Dict[str, int] = prey_alive
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "prey_alive": self.prey_alive}
+
+
+class KillEvent:
+    kind = "kill"
+
+    def __init__(self, tick: int, predator_slot: int, predator_team: str, prey_slot: int, prey_team: str):
+        self.tick: int = tick
+        self.predator_slot: int = predator_slot
+        self.predator_team: str = predator_team
+        self.prey_slot: int = prey_slot
+        self.prey_team: str = prey_team
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "predator_slot": self.predator_slot, "predator_team": self.predator_team,
+                "prey_slot": self.prey_slot, "prey_team": self.prey_team}
+
+
+class FailsafeEvent:
+    kind = "failsafe"
+
+    def __init__(self, tick: int, team_name: Optional[str], message: str):
+        self.tick: int = tick
+        self.team_name: Optional[str] = team_name
+        self.message: str = message
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "team": self.team_name, "message": self.message}
+
+    def __str__(self):
+        return self.message
+
+
+class PlacementEvent:
+    kind = "placement"
+
+    def __init__(self, tick: int, relocations: int):
+        self.tick: int = tick
+        self.relocations: int = relocations
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "relocations": self.relocations}
+
+    def __str__(self):
+        return "Placement relocations: "+str(self.relocations)
+
+
+class TeamEliminatedEvent:
+    kind = "team_eliminated"
+
+    def __init__(self, tick: int, team_name: str):
+        self.tick: int = tick
+        self.team_name: str = team_name
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "team": self.team_name}
+
+    def __str__(self):
+        return self.team_name+" eliminated at tick "+str(self.tick)
+
+
+class MatchEndEvent:
+    kind = "match_end"
+
+    def __init__(self, tick: int, winner: Optional[str], prey_alive: Dict[str, int]):
+        self.tick: int = tick
+        self.winner: Optional[str] = winner
+        self.prey_alive: Dict[str, int] = prey_alive
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "tick": self.tick, "winner": self.winner, "prey_alive": self.prey_alive}
+
+    def __str__(self):
+        return "Winner: "+str(self.winner)
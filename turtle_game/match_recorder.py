@@ -0,0 +1,83 @@
+import hashlib
+import inspect
+import json
+import struct
+from array import array
+from typing import List, Optional, BinaryIO
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.player import Player
+from turtle_game.state_store import StateStore
+from turtle_game.world import World
+
+MAGIC = b"TGRP"
+VERSION = 1
+# per tick: x, y, heading and energy as float32 columns, then alive as uint8
+BYTES_PER_TURTLE = 4 * 4 + 1
+
+
+def tick_size(turtle_count: int) -> int:
+    return turtle_count * BYTES_PER_TURTLE + (-(turtle_count * BYTES_PER_TURTLE)) % 8
+
+
+def program_hash(player: Player) -> str:
+    digest = hashlib.sha256()
+    files = set()
+    for function in (player.prey_placement_function, player.predator_placement_function, player.prey_movement_function, player.predator_movement_function):
+        try:
+            files.add(inspect.getsourcefile(function))
+        except TypeError:
+            pass
+    for file in sorted(file for file in files if file is not None):
+        with open(file, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+class MatchRecorder:
+    def __init__(self, path: str, seed: Optional[int]=None, flush_every: int=100):
+        self.path: str = path
+        self.seed: Optional[int] = seed
+        self.__flush_every: int = flush_every
+        self.__file: Optional[BinaryIO] = None
+        self.__state_store: Optional[StateStore] = None
+        self.__ticks: int = 0
+        self.__padding: bytes = b""
+
+    def start(self, world: World, players: List[Player], turtles: List[CompetitionTurtle], state_store: StateStore):
+        team_index = {player.team_name: index for index, player in enumerate(players)}
+        by_slot = sorted(turtles, key=lambda turtle: turtle.slot())
+        header = {
+            "version": VERSION,
+            "seed": self.seed,
+            "width": world.world_dimensions.width(),
+            "height": world.world_dimensions.height(),
+            "predator_kill_radius": world.predator_kill_radius(),
+            "teams": [{"name": player.team_name, "hash": program_hash(player), "prey_color": player.prey_color, "predator_color": player.predator_color} for player in players],
+            "turtles": [[team_index[turtle.team_name()], 1 if turtle.is_prey() else 0] for turtle in by_slot],
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        # pad so that tick blocks start on an 8 byte boundary
+        padding = (-(len(MAGIC) + 4 + len(encoded))) % 8
+        self.__file = open(self.path, "wb")
+        self.__file.write(MAGIC + struct.pack("<I", len(encoded) + padding) + encoded + b" " * padding)
+        self.__state_store = state_store
+        self.__padding = b"\0" * (tick_size(len(by_slot)) - len(by_slot) * BYTES_PER_TURTLE)
+        self.record()
+
+    def record(self):
+        store = self.__state_store
+        self.__file.write(array('f', store.x).tobytes())
+        self.__file.write(array('f', store.y).tobytes())
+        self.__file.write(array('f', store.heading).tobytes())
+        self.__file.write(array('f', store.energy).tobytes())
+        self.__file.write(store.alive.tobytes())
+        self.__file.write(self.__padding)
+        self.__ticks += 1
+        if self.__ticks % self.__flush_every == 0:
+            self.__file.flush()
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
@@ -0,0 +1,116 @@
+import argparse
+import json
+import mmap
+import struct
+from typing import List, Tuple, Optional
+
+from turtle_game.match_recorder import MAGIC, BYTES_PER_TURTLE, tick_size
+
+
+class ReplayFrame:
+    def __init__(self, tick: int, block: memoryview, turtle_count: int):
+        self.tick: int = tick
+        column = 4 * turtle_count
+        self.x: memoryview = block[0:column].cast('f')
+        self.y: memoryview = block[column:2 * column].cast('f')
+        self.heading: memoryview = block[2 * column:3 * column].cast('f')
+        self.energy: memoryview = block[3 * column:4 * column].cast('f')
+        self.alive: memoryview = block[4 * column:4 * column + turtle_count]
+
+    def turtle(self, index: int) -> Tuple[float, float, float, float, bool]:
+        return (self.x[index], self.y[index], self.heading[index], self.energy[index], self.alive[index] == 1)
+
+    def release(self):
+        for view in (self.x, self.y, self.heading, self.energy, self.alive):
+            view.release()
+
+
+class MatchReplay:
+    def __init__(self, path: str):
+        self.path: str = path
+        self.__file = open(path, "rb")
+        self.__map: mmap.mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.__map[0:len(MAGIC)] != MAGIC:
+            raise ValueError(path + " is not a match recording")
+        header_length = struct.unpack_from("<I", self.__map, len(MAGIC))[0]
+        self.__data_start: int = len(MAGIC) + 4 + header_length
+        self.header: dict = json.loads(bytes(self.__map[len(MAGIC) + 4:self.__data_start]).decode("utf-8"))
+        self.seed: Optional[int] = self.header["seed"]
+        self.teams: List[dict] = self.header["teams"]
+        self.turtles: List[List[int]] = self.header["turtles"]
+        self.__tick_size: int = tick_size(len(self.turtles))
+
+    def turtle_count(self) -> int:
+        return len(self.turtles)
+
+    def tick_count(self) -> int:
+        return (len(self.__map) - self.__data_start) // self.__tick_size
+
+    def frame(self, tick: int) -> ReplayFrame:
+        if tick < 0:
+            tick += self.tick_count()
+        if not 0 <= tick < self.tick_count():
+            raise IndexError("tick " + str(tick) + " is not in the recording")
+        start = self.__data_start + tick * self.__tick_size
+        return ReplayFrame(tick, memoryview(self.__map)[start:start + self.turtle_count() * BYTES_PER_TURTLE], self.turtle_count())
+
+    def alive_counts(self, tick: int) -> List[int]:
+        frame = self.frame(tick)
+        counts = [0] * len(self.teams)
+        for index, (team, is_prey) in enumerate(self.turtles):
+            if is_prey and frame.alive[index] == 1:
+                counts[team] += 1
+        frame.release()
+        return counts
+
+    def close(self):
+        self.__map.close()
+        self.__file.close()
+
+    def play(self, fps: float=30, start: int=0, step: int=1):
+        from turtle import Screen, screensize, tracer, update
+        from turtle_game.turtle_sprites import TurtleSprites
+
+        screensize(int(self.header["width"]), int(self.header["height"]))
+        Screen().clear()
+        tracer(0, 0)
+        sprites = TurtleSprites(Screen().getcanvas())
+        for index, (team, is_prey) in enumerate(self.turtles):
+            color = self.teams[team]["prey_color" if is_prey else "predator_color"]
+            sprites.add(index, tuple(color) if isinstance(color, list) else color, is_prey == 1)
+
+        def show(tick: int):
+            frame = self.frame(tick)
+            sprites.draw(frame)
+            frame.release()
+            update()
+            if tick + step < self.tick_count():
+                Screen().ontimer(lambda: show(tick + step), int(1000 / fps))
+
+        show(start)
+        Screen().mainloop()
+
+
+def main(arguments: List[str]=None):
+    parser = argparse.ArgumentParser(description="Inspect or play a match recording.")
+    parser.add_argument("path")
+    parser.add_argument("--tick", type=int, default=None, help="print the alive prey per team at this tick instead of playing")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--step", type=int, default=1, help="show every Nth tick")
+    options = parser.parse_args(arguments)
+
+    replay = MatchReplay(options.path)
+    print("seed", replay.seed, "ticks", replay.tick_count())
+    for team in replay.teams:
+        print(team["name"], team["hash"])
+    if options.tick is not None:
+        for team, count in zip(replay.teams, replay.alive_counts(options.tick)):
+            print(team["name"], count)
+    else:
+        replay.play(options.fps, options.start, options.step)
+    replay.close()
+
+
+if __name__ == "__main__":
+    main()
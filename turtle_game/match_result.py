@@ -0,0 +1,20 @@
+from typing import List, Tuple, Dict, Optional
+
+
+class MatchResult:
+    def __init__(self, pairing: Tuple[str, ...], seed: int, winner: Optional[str], ticks: int, survivors: List[Tuple[int, Dict[str, int]]], team_names: Dict[str, str], placement_relocations: int=0):
+        self.pairing: Tuple[str, ...] = pairing
+        self.seed: int = seed
+        self.winner: Optional[str] = winner
+        self.ticks: int = ticks
+        self.survivors: List[Tuple[int, Dict[str, int]]] = survivors
+        self.team_names: Dict[str, str] = team_names
+        self.placement_relocations: int = placement_relocations
+
+    def to_dict(self) -> dict:
+        return {"pairing": list(self.pairing), "seed": self.seed, "winner": self.winner, "ticks": self.ticks,
+                "survivors": [[tick, counts] for tick, counts in self.survivors], "team_names": self.team_names,
+                "placement_relocations": self.placement_relocations}
+
+    def __str__(self):
+        return " vs ".join(self.pairing)+" seed "+str(self.seed)+" winner "+str(self.winner)+" after "+str(self.ticks)+" ticks"
@@ -0,0 +1,115 @@
+import json
+import os
+import random
+import struct
+import zlib
+from array import array
+from typing import Callable, List
+
+from turtle_game.live_state import LiveState
+
+MAGIC = b"TGSN"
+VERSION = 1
+RNG_WORDS = 625
+
+
+def snapshot_engine(engine) -> bytes:
+    store = engine.state_store
+    turtles = engine.turtles_by_slot
+    team_names: List[str] = []
+    team_indexes = array('i')
+    for turtle in turtles:
+        if turtle.team_name() not in team_names:
+            team_names.append(turtle.team_name())
+        team_indexes.append(team_names.index(turtle.team_name()))
+    rng_version, rng_words, gauss_next = random.getstate()
+    header = json.dumps({"tick": engine.tick, "teams": team_names, "rng_version": rng_version, "gauss_next": gauss_next,
+                         "turtles": len(engine.world.turtles), "prey": len(engine.world.prey), "predators": len(engine.world.predators)}).encode("utf-8")
+    body = b"".join([
+        store.x.tobytes(), store.y.tobytes(), store.heading.tobytes(), store.energy.tobytes(), store.alive.tobytes(),
+        bytes(turtle.did_just_eat() for turtle in turtles),
+        bytes(turtle.is_prey() for turtle in turtles),
+        team_indexes.tobytes(),
+        # the order of the world lists decides who eats first, so a resumed match plays out exactly like the original
+        array('i', [turtle.slot() for turtle in engine.world.turtles]).tobytes(),
+        array('i', [turtle.slot() for turtle in engine.world.prey]).tobytes(),
+        array('i', [turtle.slot() for turtle in engine.world.predators]).tobytes(),
+        struct.pack("<%dI" % RNG_WORDS, *rng_words),
+    ])
+    return MAGIC + struct.pack("<III", VERSION, len(turtles), len(header)) + header + zlib.compress(body)
+
+
+def restore_engine(engine, blob: bytes):
+    if blob[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a match snapshot")
+    version, count, header_length = struct.unpack_from("<III", blob, len(MAGIC))
+    if version != VERSION:
+        raise ValueError("unsupported snapshot version "+str(version))
+    start = len(MAGIC) + struct.calcsize("<III")
+    header = json.loads(blob[start:start + header_length].decode("utf-8"))
+    body = memoryview(zlib.decompress(blob[start + header_length:]))
+    turtles = engine.turtles_by_slot
+    if count != len(turtles):
+        raise ValueError("snapshot has "+str(count)+" turtles but the engine has "+str(len(turtles)))
+
+    offset = 0
+
+    def column(typecode: str, length: int) -> array:
+        nonlocal offset
+        values = array(typecode)
+        values.frombytes(body[offset:offset + length * values.itemsize])
+        offset += length * values.itemsize
+        return values
+
+    columns = [column('d', count), column('d', count), column('d', count), column('d', count), column('b', count)]
+    just_ate = column('b', count)
+    is_prey = column('b', count)
+    team_indexes = column('i', count)
+    for turtle, team_index, prey in zip(turtles, team_indexes, is_prey):
+        if turtle.team_name() != header["teams"][team_index] or turtle.is_prey() != bool(prey):
+            raise ValueError("snapshot teams do not match the engine's players")
+    world_turtles = column('i', header["turtles"])
+    world_prey = column('i', header["prey"])
+    world_predators = column('i', header["predators"])
+
+    store = engine.state_store
+    for values, restored in zip([store.x, store.y, store.heading, store.energy, store.alive], columns):
+        values[:] = restored
+    world = engine.world
+    world.turtles[:] = [turtles[slot] for slot in world_turtles]
+    world.prey[:] = [turtles[slot] for slot in world_prey]
+    world.predators[:] = [turtles[slot] for slot in world_predators]
+    for turtle, ate in zip(turtles, just_ate):
+        turtle.set_just_ate(bool(ate))
+    for slot in range(count):
+        store.action[slot] = 0
+    rng_words = struct.unpack_from("<%dI" % RNG_WORDS, body, offset)
+    # the random module is shared, so each fork sets the state again when it starts running
+    engine.random_state = (header["rng_version"], rng_words, header["gauss_next"])
+    random.setstate(engine.random_state)
+
+    engine.tick = header["tick"]
+    engine.survivors = []
+    engine.live_state = LiveState(world, engine.players)
+    engine.check_turtles(True)
+
+
+def write_snapshot(path: str, blob: bytes):
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(blob)
+    os.replace(temporary, path)
+
+
+def read_snapshot(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def fork_engines(blob: bytes, create_engine: Callable[[int], object], count: int) -> list:
+    engines = []
+    for index in range(count):
+        engine = create_engine(index)
+        engine.restore(blob)
+        engines.append(engine)
+    return engines
@@ -0,0 +1,122 @@
+import json
+import os
+from bisect import bisect_left
+from typing import Dict, List
+
+from turtle_game.tick_metrics import TickMetrics
+
+# 10us doubling up to about a third of a second, anything slower lands in the last bucket
+BUCKETS: List[float] = [.00001 * 2 ** i for i in range(16)]
+
+
+class Histogram:
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(BUCKETS) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count > 0 and seen >= target:
+                return BUCKETS[bucket] if bucket < len(BUCKETS) else self.max
+        return self.max
+
+    def __str__(self):
+        mean = self.sum / self.count if self.count else 0.0
+        return "mean %.3fms p50 <%.3fms p99 <%.3fms max %.3fms" % (mean * 1000, self.percentile(.5) * 1000, self.percentile(.99) * 1000, self.max * 1000)
+
+
+class HistogramSink:
+    def __init__(self):
+        self.phases: Dict[str, Histogram] = {}
+        self.ticks: Histogram = Histogram()
+        self.team_cpu: Dict[str, float] = {}
+        self.commands: int = 0
+        self.kills: int = 0
+
+    def record(self, metrics: TickMetrics):
+        for phase, seconds in metrics.phases.items():
+            if phase not in self.phases:
+                self.phases[phase] = Histogram()
+            self.phases[phase].record(seconds)
+        self.ticks.record(metrics.total())
+        for team_name, seconds in metrics.team_cpu.items():
+            self.team_cpu[team_name] = self.team_cpu.get(team_name, 0.0) + seconds
+        self.commands += metrics.commands
+        self.kills += metrics.kills
+
+    def close(self):
+        pass
+
+    def __str__(self):
+        lines = ["ticks "+str(self.ticks.count)+" "+str(self.ticks)]
+        for phase, histogram in self.phases.items():
+            lines.append("    "+phase.ljust(14)+" "+str(histogram))
+        for team_name, seconds in sorted(self.team_cpu.items(), key=lambda item: -item[1]):
+            lines.append("    team "+team_name+" cpu %.3fs" % seconds)
+        lines.append("    commands "+str(self.commands)+" kills "+str(self.kills))
+        return "\n".join(lines)
+
+
+class JsonLinesSink:
+    def __init__(self, path: str):
+        self.__file = open(path, "w")
+
+    def record(self, metrics: TickMetrics):
+        self.__file.write(json.dumps(metrics.to_dict()) + "\n")
+
+    def close(self):
+        self.__file.close()
+
+
+class PrometheusSink:
+    def __init__(self, path: str, write_every: int=100):
+        self.path: str = path
+        self.write_every: int = write_every
+        self.histogram_sink: HistogramSink = HistogramSink()
+
+    def record(self, metrics: TickMetrics):
+        self.histogram_sink.record(metrics)
+        if self.histogram_sink.ticks.count % self.write_every == 0:
+            self.write()
+
+    def exposition(self) -> str:
+        sink = self.histogram_sink
+        lines = ["# TYPE turtle_game_phase_seconds histogram"]
+        for phase, histogram in sink.phases.items():
+            cumulative = 0
+            for bound, count in zip(BUCKETS + [float("inf")], histogram.counts):
+                cumulative += count
+                lines.append('turtle_game_phase_seconds_bucket{phase="%s",le="%s"} %d' % (phase, "+Inf" if bound == float("inf") else repr(bound), cumulative))
+            lines.append('turtle_game_phase_seconds_sum{phase="%s"} %r' % (phase, histogram.sum))
+            lines.append('turtle_game_phase_seconds_count{phase="%s"} %d' % (phase, histogram.count))
+        lines.append("# TYPE turtle_game_team_cpu_seconds_total counter")
+        for team_name, seconds in sink.team_cpu.items():
+            lines.append('turtle_game_team_cpu_seconds_total{team="%s"} %r' % (team_name.replace("\\", "\\\\").replace('"', '\\"'), seconds))
+        lines.append("# TYPE turtle_game_ticks_total counter")
+        lines.append("turtle_game_ticks_total %d" % sink.ticks.count)
+        lines.append("# TYPE turtle_game_commands_total counter")
+        lines.append("turtle_game_commands_total %d" % sink.commands)
+        lines.append("# TYPE turtle_game_kills_total counter")
+        lines.append("turtle_game_kills_total %d" % sink.kills)
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as file:
+            file.write(self.exposition())
+        os.replace(temporary, self.path)
+
+    def close(self):
+        self.write()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from array import array
+from math import sqrt, degrees, atan2
+from typing import List, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.relative_location import RelativeLocation, RelativeLocations, ALLY_PREY, ENEMY_PREY
+from turtle_game.spatial_index import SpatialIndex
+
+
+def category_of(turtle: CompetitionTurtle, other: CompetitionTurtle) -> int:
+    return (ALLY_PREY if turtle.team_name() == other.team_name() else ENEMY_PREY) + (0 if other.is_prey() else 1)
+
+
+class NeighborLists:
+    def __init__(self, turtles: List[CompetitionTurtle], spatial_index: SpatialIndex):
+        self.__turtles: List[CompetitionTurtle] = turtles
+        self.__spatial_index: SpatialIndex = spatial_index
+
+    def relative_locations(self, turtle: CompetitionTurtle, category: int) -> RelativeLocations:
+        x, y = turtle.position()
+        angles = array('d')
+        distances = array('d')
+        for other_turtle in self.__turtles:
+            if turtle is not other_turtle and category_of(turtle, other_turtle) == category:
+                other_x, other_y = other_turtle.position()
+                angles.append((degrees(atan2(other_y - y, other_x - x)) + 360) % 360)
+                distances.append(sqrt((x - other_x) ** 2 + (y - other_y) ** 2))
+        order = sorted(range(len(distances)), key=distances.__getitem__)
+        return RelativeLocations(array('d', [angles[i] for i in order]), array('d', [distances[i] for i in order]))
+
+    def closest(self, turtle: CompetitionTurtle, category: int) -> Optional[RelativeLocation]:
+        x, y = turtle.position()
+        nearest = self.__spatial_index.k_nearest(x, y, 1, lambda other: other != turtle and other.is_alive() and category_of(turtle, other) == category)
+        if not nearest:
+            return None
+        return RelativeLocation(turtle.angle(nearest[0][1]), nearest[0][0])
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import List, Dict
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.relative_location import RelativeLocation, ALLY_PREY, ENEMY_PREY
+from turtle_game.state_store import StateStore
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RelativeLocationView(Sequence):
+    def __init__(self, frame: PairwiseFrame, row: int, category: int):
+        self.__frame: PairwiseFrame = frame
+        self.__row: int = row
+        self.__category: int = category
+        self.__columns = None
+
+    def __columns_in_order(self):
+        if self.__columns is None:
+            self.__columns = self.__frame.sorted_columns(self.__row, self.__category)
+        return self.__columns
+
+    def __len__(self) -> int:
+        if self.__columns is None:
+            return self.__frame.count(self.__row, self.__category)
+        return len(self.__columns)
+
+    def __getitem__(self, index):
+        if index == 0 and self.__columns is None:
+            closest = self.__frame.closest_in_row(self.__row, self.__category)
+            if closest is not None:
+                return closest
+        columns = self.__columns_in_order()
+        if isinstance(index, slice):
+            return [self.__frame.relative_location(self.__row, column) for column in columns[index]]
+        return self.__frame.relative_location(self.__row, columns[index])
+
+
+class PairwiseFrame:
+    def __init__(self, turtles: List[CompetitionTurtle], state_store: StateStore):
+        self.turtles: List[CompetitionTurtle] = turtles
+        self.rows: Dict[CompetitionTurtle, int] = {turtle: row for row, turtle in enumerate(turtles)}
+        slots = numpy.fromiter((turtle.slot() for turtle in turtles), dtype=numpy.intp, count=len(turtles))
+        x = numpy.frombuffer(state_store.x, dtype=numpy.float64).take(slots)
+        y = numpy.frombuffer(state_store.y, dtype=numpy.float64).take(slots)
+        team_ids: Dict[str, int] = {}
+        teams = numpy.fromiter((team_ids.setdefault(turtle.team_name(), len(team_ids)) for turtle in turtles), dtype=numpy.intp, count=len(turtles))
+        self.is_prey = numpy.fromiter((turtle.is_prey() for turtle in turtles), dtype=bool, count=len(turtles))
+        dx = x[None, :] - x[:, None]
+        dy = y[None, :] - y[:, None]
+        self.distance = numpy.hypot(dx, dy)
+        self.angle = (numpy.degrees(numpy.arctan2(dy, dx)) + 360) % 360
+        self.same_team = teams[:, None] == teams[None, :]
+        self.category = numpy.where(self.same_team, ALLY_PREY, ENEMY_PREY) + numpy.where(self.is_prey[None, :], 0, 1)
+        numpy.fill_diagonal(self.category, -1)
+        self.__order = None
+
+    def kills(self, kill_radius: float):
+        # kills[i, j] is True when predator row i can eat prey column j
+        return (~self.is_prey)[:, None] & self.is_prey[None, :] & ~self.same_team & (self.distance < kill_radius)
+
+    def sorted_columns(self, row: int, category: int):
+        if self.__order is None:
+            self.__order = numpy.argsort(self.distance, axis=1, kind="stable")
+        order = self.__order[row]
+        return order[self.category[row].take(order) == category]
+
+    def count(self, row: int, category: int) -> int:
+        return int(numpy.count_nonzero(self.category[row] == category))
+
+    def closest_in_row(self, row: int, category: int):
+        distances = numpy.where(self.category[row] == category, self.distance[row], numpy.inf)
+        column = int(numpy.argmin(distances))
+        if distances[column] == numpy.inf:
+            return None
+        return self.relative_location(row, column)
+
+    def relative_location(self, row: int, column: int) -> RelativeLocation:
+        return RelativeLocation(float(self.angle[row, column]), float(self.distance[row, column]))
+
+    def relative_locations(self, turtle: CompetitionTurtle, category: int) -> RelativeLocationView:
+        return RelativeLocationView(self, self.rows[turtle], category)
+
+    def closest(self, turtle: CompetitionTurtle, category: int):
+        return self.closest_in_row(self.rows[turtle], category)
@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from itertools import combinations
+from typing import List, Tuple, Dict, Optional, Callable
+
+from turtle_game.match import create_match_engine
+from turtle_game.match_result import MatchResult
+from turtle_game.player import Player
+from turtle_game.submission_loader import load_submissions, loadable_submission_names, submission_names
+from turtle_game.submission_validator import ValidationReport
+from turtle_game.validation_cache import cached_validate_submissions
+
+worker_submissions: Dict[str, Player] = {}
+
+
+def load_worker_submissions(reports: Optional[Dict[str, ValidationReport]]=None):
+    global worker_submissions
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        worker_submissions = load_submissions(reports=reports)
+
+
+def recording_path(record_dir: str, pairing: Tuple[str, ...], seed: int) -> str:
+    return os.path.join(record_dir, "_vs_".join(pairing) + "_" + str(seed) + ".tgr")
+
+
+def play_match(pairing: Tuple[str, ...], seed: int, match_options: dict) -> MatchResult:
+    if not worker_submissions:
+        load_worker_submissions()
+    match_options = dict(match_options)
+    record_dir = match_options.pop("record_dir", None)
+    if record_dir is not None:
+        match_options["record_path"] = recording_path(record_dir, pairing, seed)
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        engine = create_match_engine([worker_submissions[name] for name in pairing], headless=True, seed=seed, **match_options)
+        winner = engine.run()
+    team_names = {name: player.team_name for name, player in zip(pairing, engine.players)}
+    winner_name = None
+    if winner is not None:
+        winner_name = pairing[engine.players.index(winner)]
+    return MatchResult(tuple(pairing), seed, winner_name, engine.tick, engine.survivors, team_names, engine.placement_relocations)
+
+
+def run_matches(pairings: List[Tuple[str, ...]], seeds: List[int], workers: Optional[int]=None, on_result: Optional[Callable[[MatchResult], None]]=None, **match_options) -> List[MatchResult]:
+    results: List[MatchResult] = []
+    reports = cached_validate_submissions(submission_names(), workers=workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_worker_submissions, initargs=(reports,)) as executor:
+        futures = [executor.submit(play_match, tuple(pairing), seed, match_options) for pairing in pairings for seed in seeds]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def main(arguments: List[str]=None):
+    parser = argparse.ArgumentParser(description="Run many headless matches in parallel.")
+    parser.add_argument("--pairing", action="append", default=[], help="comma separated submission names, may be repeated (default: every pair of submissions)")
+    parser.add_argument("--seeds", type=int, default=1, help="number of seeds per pairing")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--max-ticks", type=int, default=5000)
+    parser.add_argument("--threads", action="store_true", help="use one thread per turtle instead of the cooperative scheduler")
+    parser.add_argument("--output", default=None, help="JSON lines file for the results (default: stdout)")
+    parser.add_argument("--unsafe", action="store_true", help="turn off the per-turn time budget")
+    parser.add_argument("--turn-budget-ms", type=float, default=50, help="time a turtle may spend on one turn before it is skipped")
+    parser.add_argument("--record-dir", default=None, help="write a replay of every match into this directory")
+    options = parser.parse_args(arguments)
+
+    if options.pairing:
+        pairings = [tuple(pairing.split(",")) for pairing in options.pairing]
+    else:
+        # submissions that fail to import are left out of the worker roster, so they cannot be paired
+        pairings = list(combinations(loadable_submission_names(cached_validate_submissions(submission_names(), workers=options.workers)), 2))
+    seeds = list(range(options.first_seed, options.first_seed + options.seeds))
+    output = open(options.output, "w") if options.output else sys.stdout
+    try:
+        def write_result(result: MatchResult):
+            output.write(json.dumps(result.to_dict()) + "\n")
+            output.flush()
+        if options.record_dir is not None:
+            os.makedirs(options.record_dir, exist_ok=True)
+        run_matches(pairings, seeds, options.workers, write_result, max_ticks=options.max_ticks, cooperative=not options.threads, record_dir=options.record_dir, safe_mode=not options.unsafe, turn_budget_ms=options.turn_budget_ms)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
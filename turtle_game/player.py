@@ -1,5 +1,6 @@
+from inspect import iscoroutinefunction
 from random import random
-from typing import Union, Callable, Tuple
+from typing import Union, Callable, Tuple, List, Optional
 
 from turtle_game.competition_turtle import CompetitionTurtle
 from turtle_game.world import World
@@ -7,7 +8,7 @@ from turtle_game.world_dimensions import WorldDimensions
 
 
 class Player:
-    def __init__(self, team_name: str, prey_color: Union[str,Tuple[float,float,float]] , predator_color: Union[str,Tuple[float,float,float]], prey_placement_function: Callable[[World, int],Tuple[float, float]], predator_placement_function: Callable[[World, int],Tuple[float, float]], prey_movement_function: Callable[[CompetitionTurtle,World], None], predator_movement_function: Callable[[CompetitionTurtle,World], None]):
+    def __init__(self, team_name: str, prey_color: Union[str,Tuple[float,float,float]] , predator_color: Union[str,Tuple[float,float,float]], prey_placement_function: Callable[[World, int],Tuple[float, float]], predator_placement_function: Callable[[World, int],Tuple[float, float]], prey_movement_function: Callable[[CompetitionTurtle,World], None], predator_movement_function: Callable[[CompetitionTurtle,World], None], prey_batch_placement_function: Optional[Callable[[World, int], List[Tuple[float, float]]]]=None, predator_batch_placement_function: Optional[Callable[[World, int], List[Tuple[float, float]]]]=None, team_movement_function: Optional[Callable[[object, World], object]]=None, batched_team_movement_function: Optional[Callable[[object, World], object]]=None):
         self.team_name: str = team_name
         self.prey_color: Union[str,Tuple[float,float,float]] = self.safe_color(prey_color)
         self.predator_color: Union[str,Tuple[float,float,float]] = self.safe_color(predator_color)
@@ -15,6 +16,13 @@ class Player:
         self.predator_placement_function: Callable[[World, int],Tuple[float, float]] = predator_placement_function
         self.prey_movement_function: Callable[[CompetitionTurtle, World], None] = prey_movement_function
         self.predator_movement_function: Callable[[CompetitionTurtle, World], None]= predator_movement_function
+        self.prey_batch_placement_function: Optional[Callable[[World, int], List[Tuple[float, float]]]] = prey_batch_placement_function
+        self.predator_batch_placement_function: Optional[Callable[[World, int], List[Tuple[float, float]]]] = predator_batch_placement_function
+        self.team_movement_function: Optional[Callable[[object, World], object]] = team_movement_function
+        self.batched_team_movement_function: Optional[Callable[[object, World], object]] = batched_team_movement_function
+
+    def has_async_movement(self) -> bool:
+        return iscoroutinefunction(self.prey_movement_function) or iscoroutinefunction(self.predator_movement_function)
 
     def in_range(self, number: float, lower: float, upper: float):
         return number <= upper and number >= lower
@@ -1,14 +1,39 @@
-class RelativeLocation:
-    def __init__(self, angle: float, distance: float):
-        self.__angle: float = angle
-        self.__distance: float = distance
+from array import array
+from collections.abc import Sequence
+
+ALLY_PREY = 0
+ALLY_PREDATOR = 1
+ENEMY_PREY = 2
+ENEMY_PREDATOR = 3
+
+
+class RelativeLocation(tuple):
+    __slots__ = ()
+
+    def __new__(cls, angle: float, distance: float):
+        return tuple.__new__(cls, (angle, distance))
 
     def angle(self) -> float:
-        return self.__angle
+        return self[0]
 
     def distance(self) -> float:
-        return self.__distance
+        return self[1]
 
     def __str__(self):
-        return ("angle: "+str(self.angle)+" distance: "+str(self.distance))
+        return ("angle: "+str(self.angle())+" distance: "+str(self.distance()))
+
+
+class RelativeLocations(Sequence):
+    __slots__ = ("__angles", "__distances")
+
+    def __init__(self, angles: array, distances: array):
+        self.__angles: array = angles
+        self.__distances: array = distances
+
+    def __len__(self) -> int:
+        return len(self.__distances)
 
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RelativeLocation(angle, distance) for angle, distance in zip(self.__angles[index], self.__distances[index])]
+        return RelativeLocation(self.__angles[index], self.__distances[index])
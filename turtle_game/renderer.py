@@ -0,0 +1,54 @@
+from threading import Thread
+from time import monotonic, sleep
+from turtle import screensize, Screen, tracer, update
+from typing import Dict, List, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.frame_buffer import FrameBuffer, Snapshot
+from turtle_game.turtle_sprites import TurtleSprites
+from turtle_game.world import World
+
+
+class Renderer:
+    def __init__(self, world: World, fps: float=30, every_nth_tick: int=1):
+        self.world: World = world
+        self.fps: float = fps
+        self.every_nth_tick: int = max(every_nth_tick, 1)
+        self.frames: FrameBuffer = FrameBuffer()
+        screensize(int(world.world_dimensions.width()), int(world.world_dimensions.height()))
+        Screen().clear()
+        if world.background:
+            pass
+            # Screen().bgpic("background.png")
+        tracer(0, 0)
+        self.sprites: TurtleSprites = TurtleSprites(Screen().getcanvas())
+
+    def add_turtles(self, turtles: List[CompetitionTurtle]):
+        for turtle in turtles:
+            self.sprites.add(turtle.slot(), turtle.color(), turtle.is_prey())
+
+    def draw(self, snapshot: Snapshot):
+        self.sprites.draw(snapshot)
+        update()
+
+    def run(self, engine):
+        self.add_turtles(engine.world.turtles)
+        result: Dict[str, object] = {}
+        thread = Thread(target=lambda: result.setdefault("winner", engine.run()))
+        thread.daemon = True
+        thread.start()
+        interval = 1 / self.fps
+        while thread.is_alive():
+            started = monotonic()
+            snapshot: Optional[Snapshot] = self.frames.latest()
+            if snapshot is not None:
+                self.draw(snapshot)
+            else:
+                update()
+            if engine.instrumentation is not None:
+                engine.instrumentation.record_draw(monotonic() - started)
+            sleep(max(interval - (monotonic() - started), 0))
+        snapshot = self.frames.latest()
+        if snapshot is not None:
+            self.draw(snapshot)
+        return result.get("winner")
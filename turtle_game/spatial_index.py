@@ -0,0 +1,101 @@
+from __future__ import annotations
+from math import floor, sqrt
+from typing import Dict, List, Tuple, Callable, Optional, Iterable
+
+from turtle_game.competition_turtle import CompetitionTurtle
+
+
+class SpatialIndex:
+    def __init__(self, cell_size: float):
+        self.__cell_size: float = max(float(cell_size), 1.0)
+        self.__cells: Dict[Tuple[int, int], List[Tuple[float, float, CompetitionTurtle]]] = {}
+        self.__min_cell: Tuple[int, int] = (0, 0)
+        self.__max_cell: Tuple[int, int] = (0, 0)
+
+    def cell_size(self) -> float:
+        return self.__cell_size
+
+    def cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(floor(x / self.__cell_size)), int(floor(y / self.__cell_size)))
+
+    def rebuild(self, turtles: Iterable[CompetitionTurtle]):
+        cells: Dict[Tuple[int, int], List[Tuple[float, float, CompetitionTurtle]]] = {}
+        for turtle in turtles:
+            x, y = turtle.position()
+            key = self.cell(x, y)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(x, y, turtle)]
+            else:
+                bucket.append((x, y, turtle))
+        self.__cells = cells
+        if cells:
+            self.__min_cell = (min(key[0] for key in cells), min(key[1] for key in cells))
+            self.__max_cell = (max(key[0] for key in cells), max(key[1] for key in cells))
+
+    def within(self, x: float, y: float, radius: float, predicate: Optional[Callable[[CompetitionTurtle], bool]]=None) -> List[Tuple[float, CompetitionTurtle]]:
+        found: List[Tuple[float, CompetitionTurtle]] = []
+        min_cx, min_cy = self.cell(x - radius, y - radius)
+        max_cx, max_cy = self.cell(x + radius, y + radius)
+        min_cx = max(min_cx, self.__min_cell[0])
+        min_cy = max(min_cy, self.__min_cell[1])
+        max_cx = min(max_cx, self.__max_cell[0])
+        max_cy = min(max_cy, self.__max_cell[1])
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.__cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other_x, other_y, other in bucket:
+                    distance = sqrt((other_x - x) ** 2 + (other_y - y) ** 2)
+                    if distance < radius and (predicate is None or predicate(other)):
+                        found.append((distance, other))
+        return found
+
+    def count_in_rect(self, min_x: float, min_y: float, max_x: float, max_y: float, predicate: Optional[Callable[[CompetitionTurtle], bool]]=None) -> int:
+        count = 0
+        min_cx, min_cy = self.cell(min_x, min_y)
+        max_cx, max_cy = self.cell(max_x, max_y)
+        for cx in range(max(min_cx, self.__min_cell[0]), min(max_cx, self.__max_cell[0]) + 1):
+            for cy in range(max(min_cy, self.__min_cell[1]), min(max_cy, self.__max_cell[1]) + 1):
+                bucket = self.__cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other_x, other_y, other in bucket:
+                    if min_x <= other_x <= max_x and min_y <= other_y <= max_y and (predicate is None or predicate(other)):
+                        count += 1
+        return count
+
+    def k_nearest(self, x: float, y: float, k: int, predicate: Optional[Callable[[CompetitionTurtle], bool]]=None) -> List[Tuple[float, CompetitionTurtle]]:
+        if k <= 0 or not self.__cells:
+            return []
+        center_x, center_y = self.cell(x, y)
+        max_ring = max(abs(center_x - self.__min_cell[0]), abs(center_x - self.__max_cell[0]),
+                       abs(center_y - self.__min_cell[1]), abs(center_y - self.__max_cell[1]))
+        found: List[Tuple[float, CompetitionTurtle]] = []
+        for ring in range(max_ring + 1):
+            for cx, cy in self.__ring(center_x, center_y, ring):
+                bucket = self.__cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other_x, other_y, other in bucket:
+                    if predicate is None or predicate(other):
+                        found.append((sqrt((other_x - x) ** 2 + (other_y - y) ** 2), other))
+            # every cell outside this ring is at least ring * cell_size away
+            if len(found) >= k:
+                found.sort(key=lambda entry: entry[0])
+                if found[k - 1][0] <= ring * self.__cell_size:
+                    return found[:k]
+        found.sort(key=lambda entry: entry[0])
+        return found[:k]
+
+    def __ring(self, center_x: int, center_y: int, ring: int):
+        if ring == 0:
+            yield (center_x, center_y)
+            return
+        for cx in range(center_x - ring, center_x + ring + 1):
+            yield (cx, center_y - ring)
+            yield (cx, center_y + ring)
+        for cy in range(center_y - ring + 1, center_y + ring):
+            yield (center_x - ring, cy)
+            yield (center_x + ring, cy)
@@ -0,0 +1,25 @@
+from array import array
+
+
+class StateStore:
+    def __init__(self):
+        self.x: array = array('d')
+        self.y: array = array('d')
+        self.heading: array = array('d')
+        self.energy: array = array('d')
+        self.alive: array = array('b')
+        self.action: array = array('b')
+        self.action_value: array = array('d')
+
+    def add(self, x: float, y: float, heading: float, energy: float) -> int:
+        self.x.append(x)
+        self.y.append(y)
+        self.heading.append(heading)
+        self.energy.append(energy)
+        self.alive.append(1)
+        self.action.append(0)
+        self.action_value.append(0.0)
+        return len(self.x) - 1
+
+    def size(self) -> int:
+        return len(self.x)
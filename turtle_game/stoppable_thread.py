@@ -1,12 +0,0 @@
-from threading import Thread, Event
-
-class StoppableThread(Thread):
-    def __init__(self,  *args, **kwargs):
-        super(StoppableThread, self).__init__(*args, **kwargs)
-        self._stop_event = Event()
-
-    def stop(self):
-        self._stop_event.set()
-
-    def stopped(self):
-        return self._stop_event.is_set()
\ No newline at end of file
@@ -0,0 +1,115 @@
+from importlib import import_module
+import os
+from typing import Union, Tuple, Callable, Dict, List, Optional
+
+from turtle_game.competition_turtle import CompetitionTurtle
+import turtle_programs
+from turtle_game.player import Player
+from turtle_game.submission_validator import ValidationReport, validate_submissions
+from turtle_game.validation_cache import cached_validate_submissions
+from turtle_game.world import World
+
+
+def check_color_tuple(color_tuple):
+    valid = True
+    for val in color_tuple:
+        valid &= isinstance(val,float)
+    return valid
+def default_placement_function(world: World, prey_number: int) -> Tuple[float, float]:
+    return world.random_location()
+
+def default_movement_function(turtle: CompetitionTurtle, world: World):
+    turtle.forward(turtle.energy_level())
+
+
+
+
+def failsafes(person, report: Optional[ValidationReport]=None):
+    team_name: str
+    prey_color: Union[str,Tuple[float,float,float]]
+    predator_color: Union[str,Tuple[float,float,float]]
+    prey_placement_function: Callable[[World, int],Tuple[float, float]]
+    predator_placement_function: Callable[[World, int],Tuple[float, float]]
+    prey_movement_function: Callable[[CompetitionTurtle, World], None]
+    predator_movement_function: Callable[[CompetitionTurtle, World], None]
+    if not hasattr(person,"team_name") or not isinstance(person.team_name,str):
+        print("Team name falesafe triggered")
+        team_name = "Untitled Team"
+    else:
+        team_name = person.team_name
+    if not (hasattr(person,"prey_color")  and (isinstance(person.prey_color, str) or (isinstance(person.prey_color,Tuple) and len(person.prey_color) == 3 and check_color_tuple(person.prey_color)))):
+        print("Prey color falesafe triggered")
+        prey_color = "blue"
+    else:
+        prey_color = person.prey_color
+    if not(hasattr(person,"predator_color") and (isinstance(person.predator_color, str) or (isinstance(person.predator_color, Tuple) and len(person.predator_color) == 3 and check_color_tuple(person.predator_color)))):
+        print("Predator color falesafe triggered")
+        predator_color = "blue"
+    else:
+        predator_color = person.predator_color
+    if not hasattr(person,"prey_placement_function") or not isinstance(person.prey_placement_function,Callable) or (report is not None and not report.passed("prey_placement_function")):
+        print("Prey placement function failsafe 1 triggered")
+        prey_placement_function = default_placement_function
+    else:
+        prey_placement_function = person.prey_placement_function
+    if not hasattr(person,"predator_placement_function") or not isinstance(person.predator_placement_function,Callable) or (report is not None and not report.passed("predator_placement_function")):
+        print("Predator placement function failsafe 1 triggered")
+        predator_placement_function = default_placement_function
+    else:
+        predator_placement_function = person.predator_placement_function
+    if not hasattr(person,"prey_movement_function") or not isinstance(person.prey_movement_function,Callable) or (report is not None and not report.passed("prey_movement_function")):
+        print("Prey movement function failsafe 1 triggered")
+        prey_movement_function = default_movement_function
+    else:
+        prey_movement_function = person.prey_movement_function
+    if not hasattr(person,"predator_movement_function") or not isinstance(person.predator_movement_function,Callable) or (report is not None and not report.passed("predator_movement_function")):
+        print("Predator movement function failsafe 1 triggered")
+        predator_movement_function = default_movement_function
+    else:
+        predator_movement_function = person.predator_movement_function
+    batch_placement_functions = []
+    for function_name in ["prey_batch_placement_function", "predator_batch_placement_function"]:
+        batch_placement_function = getattr(person, function_name, None)
+        if batch_placement_function is not None and not isinstance(batch_placement_function, Callable):
+            print(("Prey" if function_name.startswith("prey") else "Predator"), "batch placement function failsafe 1 triggered")
+            batch_placement_function = None
+        batch_placement_functions.append(batch_placement_function)
+    team_movement_function = getattr(person, "team_movement_function", None)
+    if team_movement_function is not None and not isinstance(team_movement_function, Callable):
+        print("Team movement function failsafe 1 triggered")
+        team_movement_function = None
+    batched_team_movement_function = getattr(person, "batched_team_movement_function", None)
+    if batched_team_movement_function is not None and not isinstance(batched_team_movement_function, Callable):
+        print("Batched team movement function failsafe 1 triggered")
+        batched_team_movement_function = None
+    return Player(team_name,prey_color,predator_color,prey_placement_function,predator_placement_function,prey_movement_function,predator_movement_function,batch_placement_functions[0],batch_placement_functions[1],team_movement_function,batched_team_movement_function)
+
+
+def submission_names(package=turtle_programs):
+    names = []
+    for file in sorted(os.listdir(package.__path__[0])):
+        if file.endswith(".py") and file != "__init__.py":
+            names.append(file.replace(".py","").strip())
+    return names
+
+def loadable_submission_names(reports: Dict[str, ValidationReport]) -> List[str]:
+    return [name for name, report in reports.items() if report.import_error is None]
+
+def load_submissions(package=turtle_programs, validate: bool=True, workers: Optional[int]=None, reports: Optional[Dict[str, ValidationReport]]=None, use_cache: bool=True) -> Dict[str, Player]:
+    names = submission_names(package)
+    if reports is None:
+        if not validate:
+            reports = {}
+        elif use_cache:
+            reports = cached_validate_submissions(names, package.__name__, workers)
+        else:
+            reports = validate_submissions(names, package.__name__, workers)
+    people: Dict[str, Player] = {}
+    for name in names:
+        report = reports.get(name)
+        if report is not None and report.import_error is not None:
+            print("Submission failsafe triggered (", name, "could not be imported:", report.import_error, ")")
+            continue
+        person = import_module(package.__name__ + "." + name)
+        people[name] = failsafes(person, report)
+    return people
@@ -0,0 +1,275 @@
+import argparse
+import os
+from collections import deque
+from importlib import import_module
+from multiprocessing import Process, Pipe
+from multiprocessing.connection import wait
+from threading import Barrier
+from time import perf_counter, monotonic
+from types import GeneratorType, CoroutineType
+from typing import Dict, List, Optional, Tuple, Deque
+
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.cooperative_scheduler import TurnOverrun
+from turtle_game.world import World
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PLACEMENT_FUNCTIONS = ["prey_placement_function", "predator_placement_function"]
+MOVEMENT_FUNCTIONS = ["prey_movement_function", "predator_movement_function"]
+FUNCTIONS = PLACEMENT_FUNCTIONS + MOVEMENT_FUNCTIONS
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+class FunctionReport:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.passed: bool = False
+        self.error: Optional[str] = None
+        self.exceptions: int = 0
+        self.latencies: List[float] = []
+
+    def latency_ms(self, fraction: float) -> float:
+        return percentile(self.latencies, fraction) * 1000
+
+    def __str__(self):
+        text = self.name+" "+("pass" if self.passed else "FAIL")+" calls "+str(len(self.latencies))
+        text += " p50 %.3fms p90 %.3fms p99 %.3fms max %.3fms" % (self.latency_ms(.5), self.latency_ms(.9), self.latency_ms(.99), self.latency_ms(1))
+        if self.exceptions:
+            text += " exceptions "+str(self.exceptions)
+        if self.error is not None:
+            text += " ("+self.error+")"
+        return text
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "passed": self.passed, "error": self.error, "exceptions": self.exceptions, "latencies": self.latencies}
+
+
+class ValidationReport:
+    def __init__(self, submission: str):
+        self.submission: str = submission
+        self.import_error: Optional[str] = None
+        self.functions: Dict[str, FunctionReport] = {name: FunctionReport(name) for name in FUNCTIONS}
+
+    def passed(self, function_name: str) -> bool:
+        return self.functions[function_name].passed
+
+    def to_dict(self) -> dict:
+        return {"submission": self.submission, "import_error": self.import_error, "functions": [report.to_dict() for report in self.functions.values()]}
+
+    def __str__(self):
+        return self.submission+"\n"+"\n".join("    "+str(report) for report in self.functions.values())
+
+
+class ValidationDriver:
+    def __init__(self):
+        self.__acted: bool = False
+
+    def reset(self):
+        self.__acted = False
+
+    def begin_action(self):
+        if self.__acted:
+            raise TurnOverrun()
+
+    def end_turn(self):
+        self.begin_action()
+        self.__acted = True
+
+
+class ValidationEngine:
+    def __init__(self):
+        self.events = None
+        self.move_barrier: Barrier = Barrier(1)
+        self.check_barrier: Barrier = Barrier(1)
+
+    def can_move_without_wait(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def can_eat(self, predator: CompetitionTurtle, prey: CompetitionTurtle) -> bool:
+        return False
+
+    def game_over(self) -> bool:
+        return False
+
+    def is_turtle_on_left_edge(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_on_top_edge(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_on_right_edge(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_on_bottom_edge(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_in_top_left_corner(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_in_top_right_corner(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_in_bottom_right_corner(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+    def is_turtle_in_bottom_left_corner(self, turtle: CompetitionTurtle) -> bool:
+        return False
+
+
+def test_turtle(is_prey: bool, driver: ValidationDriver) -> CompetitionTurtle:
+    location = World().random_location()
+    turtle = CompetitionTurtle("validation", is_prey, "blue", location[0], location[1], ValidationEngine(), 9 if is_prey else 12)
+    turtle.set_turn_driver(driver)
+    turtle.start()
+    return turtle
+
+
+def call_once(person, function_name: str, call: int, driver: ValidationDriver):
+    function = getattr(person, function_name)
+    if function_name in PLACEMENT_FUNCTIONS:
+        function(World(), call)
+        return
+    turtle = test_turtle(function_name == "prey_movement_function", driver)
+    driver.reset()
+    try:
+        result = function(turtle, World())
+        if isinstance(result, GeneratorType):
+            next(result, None)
+        elif isinstance(result, CoroutineType):
+            try:
+                result.send(None)
+            except StopIteration:
+                pass
+    except TurnOverrun:
+        pass
+
+
+def validation_worker(module_name: str, function_names: List[str], calls: int, cpu_limit: float, connection):
+    if resource is not None:
+        limit = int(cpu_limit) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, limit + 1))
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+    try:
+        person = import_module(module_name)
+    except Exception as e:
+        connection.send(("import_error", repr(e)))
+        return
+    driver = ValidationDriver()
+    for function_name in function_names:
+        connection.send(("start", function_name))
+        if not callable(getattr(person, function_name, None)):
+            connection.send(("missing", function_name))
+            continue
+        for call in range(calls):
+            started = perf_counter()
+            error = None
+            try:
+                call_once(person, function_name, call, driver)
+            except Exception as e:
+                error = repr(e)
+            connection.send(("call", function_name, perf_counter() - started, error))
+        connection.send(("done", function_name))
+    connection.close()
+
+
+class RunningValidation:
+    def __init__(self, submission: str, module_name: str, function_names: List[str], calls: int, cpu_limit: float):
+        self.submission: str = submission
+        self.function_names: List[str] = function_names
+        self.current: Optional[str] = None
+        self.deadline: float = 0
+        self.connection, child_connection = Pipe(duplex=False)
+        self.process: Process = Process(target=validation_worker, args=(module_name, function_names, calls, cpu_limit, child_connection))
+        self.process.daemon = True
+        self.process.start()
+        child_connection.close()
+
+
+def validate_submissions(names: List[str], package_name: str="turtle_programs", workers: Optional[int]=None, time_limit: float=2, calls: int=100, cpu_limit: float=30) -> Dict[str, ValidationReport]:
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    reports: Dict[str, ValidationReport] = {name: ValidationReport(name) for name in names}
+    pending: Deque[Tuple[str, List[str]]] = deque((name, list(FUNCTIONS)) for name in names)
+    running: List[RunningValidation] = []
+    while pending or running:
+        while pending and len(running) < workers:
+            name, function_names = pending.popleft()
+            validation = RunningValidation(name, package_name + "." + name, function_names, calls, cpu_limit)
+            validation.deadline = monotonic() + time_limit
+            running.append(validation)
+        timeout = max(min(validation.deadline for validation in running) - monotonic(), 0)
+        wait([validation.connection for validation in running], timeout)
+        for validation in list(running):
+            report = reports[validation.submission]
+            finished = False
+            try:
+                while validation.connection.poll():
+                    message = validation.connection.recv()
+                    if message[0] == "import_error":
+                        report.import_error = message[1]
+                        for function_report in report.functions.values():
+                            function_report.error = "import failed: " + message[1]
+                    elif message[0] == "start":
+                        validation.current = message[1]
+                    elif message[0] == "missing":
+                        report.functions[message[1]].error = "missing or not callable"
+                        validation.current = None
+                    elif message[0] == "call":
+                        function_report = report.functions[message[1]]
+                        function_report.latencies.append(message[2])
+                        if message[3] is not None:
+                            function_report.exceptions += 1
+                            function_report.error = message[3]
+                    elif message[0] == "done":
+                        function_report = report.functions[message[1]]
+                        # the lone test turtle has no neighbours, so valid movement functions may raise on every call;
+                        # only a timeout or the cpu limit fails them and exceptions are just reported
+                        function_report.passed = message[1] in MOVEMENT_FUNCTIONS or function_report.exceptions < len(function_report.latencies)
+                        validation.current = None
+                    validation.deadline = monotonic() + time_limit
+            except (EOFError, OSError):
+                finished = True
+            if not finished and not validation.process.is_alive() and not validation.connection.poll():
+                finished = True
+            if not finished and monotonic() > validation.deadline:
+                validation.process.kill()
+                finished = True
+            if finished:
+                validation.process.join()
+                validation.connection.close()
+                running.remove(validation)
+                if validation.current is not None:
+                    report.functions[validation.current].error = "timed out or exceeded the cpu limit"
+                    remaining = validation.function_names[validation.function_names.index(validation.current) + 1:]
+                    if remaining:
+                        pending.append((validation.submission, remaining))
+    return reports
+
+
+def main(arguments: List[str]=None):
+    from turtle_game.submission_loader import submission_names
+
+    parser = argparse.ArgumentParser(description="Validate every submission in turtle_programs.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=2, help="seconds allowed for a single call")
+    parser.add_argument("--calls", type=int, default=100, help="calls per function")
+    options = parser.parse_args(arguments)
+    started = perf_counter()
+    reports = validate_submissions(submission_names(), workers=options.workers, time_limit=options.time_limit, calls=options.calls)
+    for report in reports.values():
+        print(report)
+    print("validated", len(reports), "submissions in %.2fs" % (perf_counter() - started))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from array import array
+from math import inf, isfinite
+from typing import List, Optional, Tuple
+
+from turtle_game.action_buffer import WAIT, FORWARD, BACKWARD, TEAM_ACTIONS
+from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.relative_location import ENEMY_PREY, ENEMY_PREDATOR
+
+
+class TeamView:
+    def __init__(self, team_name: str, turtles: List[CompetitionTurtle], neighbors):
+        self.team_name: str = team_name
+        self.__turtles: List[CompetitionTurtle] = turtles
+        self.__neighbors = neighbors
+        self.__nearest = {}
+        slot = array('i')
+        is_prey = array('b')
+        x = array('d')
+        y = array('d')
+        heading = array('d')
+        energy = array('d')
+        max_speed = array('d')
+        for turtle in turtles:
+            slot.append(turtle.slot())
+            is_prey.append(turtle.is_prey())
+            position = turtle.position()
+            x.append(position[0])
+            y.append(position[1])
+            heading.append(turtle.heading())
+            energy.append(turtle.energy_level())
+            max_speed.append(turtle.max_speed())
+        # rows follow world.turtles, which kills reorder, so strategies that remember turtles key them by slot
+        self.slot: memoryview = memoryview(slot).toreadonly()
+        self.is_prey: memoryview = memoryview(is_prey).toreadonly()
+        self.x: memoryview = memoryview(x).toreadonly()
+        self.y: memoryview = memoryview(y).toreadonly()
+        self.heading: memoryview = memoryview(heading).toreadonly()
+        self.energy: memoryview = memoryview(energy).toreadonly()
+        self.max_speed: memoryview = memoryview(max_speed).toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.__turtles)
+
+    def __nearest_enemies(self, category: int) -> Tuple[memoryview, memoryview]:
+        if category not in self.__nearest:
+            angles = array('d')
+            distances = array('d')
+            for turtle in self.__turtles:
+                closest = self.__neighbors.closest(turtle, category) if self.__neighbors is not None else None
+                angles.append(closest.angle() if closest is not None else 0.0)
+                distances.append(closest.distance() if closest is not None else inf)
+            self.__nearest[category] = (memoryview(angles).toreadonly(), memoryview(distances).toreadonly())
+        return self.__nearest[category]
+
+    def nearest_threats(self) -> Tuple[memoryview, memoryview]:
+        return self.__nearest_enemies(ENEMY_PREDATOR)
+
+    def nearest_enemy_prey(self) -> Tuple[memoryview, memoryview]:
+        return self.__nearest_enemies(ENEMY_PREY)
+
+
+def validated_team_actions(result, count: int) -> Optional[List[Tuple[int, float]]]:
+    try:
+        actions, values = result
+        if len(actions) != count or len(values) != count:
+            return None
+    except (TypeError, ValueError):
+        return None
+    validated: List[Tuple[int, float]] = []
+    for action, value in zip(actions, values):
+        try:
+            action = int(action)
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            action, value = WAIT, 0.0
+        if action not in TEAM_ACTIONS or not isfinite(value) or (action in (FORWARD, BACKWARD) and value < 0):
+            action, value = WAIT, 0.0
+        validated.append((action, value))
+    return validated
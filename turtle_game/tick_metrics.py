@@ -0,0 +1,21 @@
+from typing import Dict
+
+
+class TickMetrics:
+    def __init__(self, tick: int):
+        self.tick: int = tick
+        self.phases: Dict[str, float] = {}
+        self.team_cpu: Dict[str, float] = {}
+        self.commands: int = 0
+        self.kills: int = 0
+        self.turtles: int = 0
+
+    def total(self) -> float:
+        return sum(seconds for phase, seconds in self.phases.items() if phase != "draw")
+
+    def to_dict(self) -> dict:
+        return {"tick": self.tick, "phases": self.phases, "team_cpu": self.team_cpu, "commands": self.commands,
+                "kills": self.kills, "turtles": self.turtles}
+
+    def __str__(self):
+        return "tick "+str(self.tick)+" "+" ".join(phase+" %.3fms" % (seconds * 1000) for phase, seconds in self.phases.items())
@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import combinations
+from typing import List, Tuple, Dict, Optional, Callable
+
+from turtle_game.elo_ratings import EloRatings
+from turtle_game.match_result import MatchResult
+from turtle_game.parallel_matches import play_match, load_worker_submissions
+from turtle_game.submission_loader import loadable_submission_names, submission_names
+from turtle_game.validation_cache import cached_validate_submissions
+
+
+class Standing:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.wins: int = 0
+        self.losses: int = 0
+        self.draws: int = 0
+
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    def points(self) -> float:
+        return self.wins + self.draws / 2
+
+    def __str__(self):
+        return self.name+" "+str(self.wins)+"-"+str(self.losses)+"-"+str(self.draws)
+
+
+def round_robin_pairings(names: List[str]) -> List[Tuple[str, str]]:
+    return list(combinations(names, 2))
+
+
+class Tournament:
+    def __init__(self, names: List[str], seeds_per_pairing: int=1, k_factor: float=32):
+        self.names: List[str] = names
+        self.seeds_per_pairing: int = seeds_per_pairing
+        self.ratings: EloRatings = EloRatings(names, k_factor=k_factor)
+        self.standings: Dict[str, Standing] = {name: Standing(name) for name in names}
+        self.results: List[MatchResult] = []
+        self.games_played: Dict[Tuple[str, str], int] = {}
+
+    def record(self, result: MatchResult):
+        self.results.append(result)
+        for name, opponent in combinations(result.pairing, 2):
+            key = tuple(sorted((name, opponent)))
+            self.games_played[key] = self.games_played.get(key, 0) + 1
+            if result.winner == name:
+                score = 1.0
+            elif result.winner == opponent:
+                score = 0.0
+            else:
+                score = 0.5
+            self.ratings.update(name, opponent, score)
+        for name in result.pairing:
+            if result.winner is None:
+                self.standings[name].draws += 1
+            elif result.winner == name:
+                self.standings[name].wins += 1
+            else:
+                self.standings[name].losses += 1
+
+    def informativeness(self, pairing: Tuple[str, ...]) -> float:
+        # close ratings and few games so far mean the outcome tells us the most
+        value = 0.0
+        for name, opponent in combinations(pairing, 2):
+            expected = self.ratings.expected_score(name, opponent)
+            played = self.games_played.get(tuple(sorted((name, opponent))), 0)
+            value += expected * (1 - expected) / (1 + played)
+        return value
+
+    def swiss_pairings(self) -> List[Tuple[str, str]]:
+        order = sorted(self.names, key=lambda name: (self.standings[name].points(), self.ratings.ratings[name]), reverse=True)
+        pairings: List[Tuple[str, str]] = []
+        unpaired = list(order)
+        while len(unpaired) > 1:
+            name = unpaired.pop(0)
+            opponent_index = 0
+            for index, opponent in enumerate(unpaired):
+                if self.games_played.get(tuple(sorted((name, opponent))), 0) == 0:
+                    opponent_index = index
+                    break
+            pairings.append((name, unpaired.pop(opponent_index)))
+        return pairings
+
+    def ranking(self) -> List[Tuple[str, float]]:
+        return self.ratings.ranking()
+
+    def run(self, pairings: List[Tuple[str, ...]], workers: Optional[int]=None, on_result: Optional[Callable[[MatchResult], None]]=None, executor: Optional[ProcessPoolExecutor]=None, first_seed: int=0, **match_options):
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers, initializer=load_worker_submissions, initargs=(cached_validate_submissions(submission_names(), workers=workers),)) as executor:
+                self.run(pairings, workers, on_result, executor, first_seed, **match_options)
+            return
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        pending: List[Tuple[Tuple[str, ...], int]] = [(tuple(pairing), seed) for seed in range(first_seed, first_seed + self.seeds_per_pairing) for pairing in pairings]
+        running = set()
+        while pending or running:
+            while pending and len(running) < workers:
+                best = max(range(len(pending)), key=lambda index: self.informativeness(pending[index][0]))
+                pairing, seed = pending.pop(best)
+                running.add(executor.submit(play_match, pairing, seed, match_options))
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                self.record(result)
+                if on_result is not None:
+                    on_result(result)
+
+    def run_swiss(self, rounds: int, workers: Optional[int]=None, on_result: Optional[Callable[[MatchResult], None]]=None, **match_options):
+        with ProcessPoolExecutor(max_workers=workers, initializer=load_worker_submissions, initargs=(cached_validate_submissions(submission_names(), workers=workers),)) as executor:
+            for round_number in range(rounds):
+                self.run(self.swiss_pairings(), workers, on_result, executor, round_number * self.seeds_per_pairing, **match_options)
+
+
+def main(arguments: List[str]=None):
+    parser = argparse.ArgumentParser(description="Rank every submission in turtle_programs.")
+    parser.add_argument("--format", choices=["round-robin", "swiss"], default="round-robin")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds for the swiss format")
+    parser.add_argument("--seeds", type=int, default=1, help="seeds per pairing")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=5000)
+    parser.add_argument("--unsafe", action="store_true", help="turn off the per-turn time budget")
+    parser.add_argument("--turn-budget-ms", type=float, default=50, help="time a turtle may spend on one turn before it is skipped")
+    parser.add_argument("--results", default=None, help="JSON lines file for every match result")
+    options = parser.parse_args(arguments)
+
+    # submissions that fail to import never reach the worker roster, so they cannot enter the tournament
+    tournament = Tournament(loadable_submission_names(cached_validate_submissions(submission_names(), workers=options.workers)), options.seeds)
+    results_file = open(options.results, "w") if options.results else None
+
+    def report(result: MatchResult):
+        if results_file is not None:
+            results_file.write(json.dumps(result.to_dict()) + "\n")
+            results_file.flush()
+        print(result, file=sys.stderr)
+
+    try:
+        if options.format == "swiss":
+            tournament.run_swiss(options.rounds, options.workers, report, max_ticks=options.max_ticks, cooperative=True, safe_mode=not options.unsafe, turn_budget_ms=options.turn_budget_ms)
+        else:
+            tournament.run(round_robin_pairings(tournament.names), options.workers, report, max_ticks=options.max_ticks, cooperative=True, safe_mode=not options.unsafe, turn_budget_ms=options.turn_budget_ms)
+    finally:
+        if results_file is not None:
+            results_file.close()
+    for place, (name, rating) in enumerate(tournament.ranking(), 1):
+        standing = tournament.standings[name]
+        print(str(place)+". "+name+" "+str(round(rating))+" "+str(standing.wins)+"-"+str(standing.losses)+"-"+str(standing.draws))
+
+
+if __name__ == "__main__":
+    main()
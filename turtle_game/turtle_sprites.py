@@ -0,0 +1,79 @@
+from math import cos, sin, radians
+from tkinter import TclError
+from typing import Dict, List, Tuple, Union
+
+from turtle_game.frame_buffer import Snapshot
+
+# the polygon of turtle's built in "turtle" shape, nose along +y
+TURTLE_SHAPE: Tuple[Tuple[float, float], ...] = ((0, 16), (-2, 14), (-1, 10), (-4, 7), (-7, 9), (-9, 8), (-6, 5), (-7, 1), (-5, -3), (-8, -6),
+                                                 (-6, -8), (-4, -5), (0, -7), (4, -5), (6, -8), (8, -6), (5, -3), (7, 1), (6, 5), (9, 8),
+                                                 (7, 9), (4, 7), (1, 10), (2, 14))
+
+
+def rotated_shapes(size: float) -> List[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+    shapes: List[Tuple[Tuple[float, ...], Tuple[float, ...]]] = []
+    for degree in range(360):
+        e0 = cos(radians(degree))
+        e1 = sin(radians(degree))
+        # same transform as RawTurtle._polytrafo, with the canvas y axis pointing down
+        shapes.append((tuple((e1 * x + e0 * y) * size for x, y in TURTLE_SHAPE), tuple((e0 * x - e1 * y) * size for x, y in TURTLE_SHAPE)))
+    return shapes
+
+
+class TurtleSprites:
+    def __init__(self, canvas):
+        self.__canvas = canvas
+        self.__shapes: Dict[bool, List[Tuple[Tuple[float, ...], Tuple[float, ...]]]] = {True: rotated_shapes(1), False: rotated_shapes(2)}
+        self.__free: List[int] = []
+        self.__items: Dict[int, int] = {}
+        self.__is_prey: Dict[int, bool] = {}
+        self.__drawn: Dict[int, Tuple[float, float, int]] = {}
+        self.__coords: List[float] = [0.0] * (2 * len(TURTLE_SHAPE))
+
+    def __tk_color(self, color: Union[str, Tuple[float, float, float]]) -> str:
+        if isinstance(color, tuple):
+            return "#%02x%02x%02x" % tuple(int(round(channel * 255)) for channel in color)
+        return color
+
+    def add(self, slot: int, color: Union[str, Tuple[float, float, float]], is_prey: bool):
+        if slot in self.__items:
+            return
+        item = self.__free.pop() if self.__free else self.__canvas.create_polygon(0, 0, 0, 0, 0, 0, width=1)
+        try:
+            self.__canvas.itemconfigure(item, fill=self.__tk_color(color), outline=self.__tk_color(color), state="normal")
+        except (TclError, ValueError, TypeError):
+            print("Color fail safe activated")
+            self.__canvas.itemconfigure(item, fill="blue", outline="blue", state="normal")
+        self.__items[slot] = item
+        self.__is_prey[slot] = is_prey
+
+    def release(self, slot: int):
+        item = self.__items.pop(slot)
+        self.__canvas.itemconfigure(item, state="hidden")
+        self.__free.append(item)
+        del self.__is_prey[slot]
+        self.__drawn.pop(slot, None)
+
+    def draw(self, snapshot: Snapshot) -> int:
+        changed = 0
+        for slot, item in list(self.__items.items()):
+            if snapshot.alive[slot] != 1:
+                self.release(slot)
+                continue
+            x = snapshot.x[slot]
+            y = snapshot.y[slot]
+            degree = int(round(snapshot.heading[slot])) % 360
+            drawn = (x, y, degree)
+            if self.__drawn.get(slot) == drawn:
+                continue
+            self.__drawn[slot] = drawn
+            x_offsets, y_offsets = self.__shapes[self.__is_prey[slot]][degree]
+            coords = self.__coords
+            coords[0::2] = [offset + x for offset in x_offsets]
+            coords[1::2] = [offset - y for offset in y_offsets]
+            self.__canvas.coords(item, coords)
+            changed += 1
+        return changed
+
+    def __len__(self) -> int:
+        return len(self.__items)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+from importlib import import_module
+from typing import Dict, List, Optional
+
+from turtle_game.submission_validator import ValidationReport, FunctionReport, validate_submissions
+
+CACHE_FILE = "validation_cache.json"
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()
+
+
+def engine_version() -> str:
+    # any change to the engine package can change how a submission behaves under validation
+    digest = hashlib.sha256()
+    package_path = os.path.dirname(os.path.abspath(__file__))
+    for file in sorted(os.listdir(package_path)):
+        if file.endswith(".py"):
+            digest.update(file.encode("utf-8"))
+            with open(os.path.join(package_path, file), "rb") as source:
+                digest.update(source.read())
+    return digest.hexdigest()
+
+
+def report_from_dict(data: dict) -> ValidationReport:
+    report = ValidationReport(data["submission"])
+    report.import_error = data["import_error"]
+    for function_data in data["functions"]:
+        function_report = FunctionReport(function_data["name"])
+        function_report.passed = function_data["passed"]
+        function_report.error = function_data["error"]
+        function_report.exceptions = function_data["exceptions"]
+        function_report.latencies = function_data["latencies"]
+        report.functions[function_report.name] = function_report
+    return report
+
+
+class ValidationCache:
+    def __init__(self, path: str):
+        self.path: str = path
+        self.__entries: Dict[str, dict] = {}
+        try:
+            with open(path) as file:
+                self.__entries = json.load(file)
+        except (OSError, ValueError):
+            self.__entries = {}
+
+    def key(self, submission_path: str, version: str, calls: int, time_limit: float) -> dict:
+        return {"hash": file_hash(submission_path), "engine": version, "calls": calls, "time_limit": time_limit}
+
+    def get(self, name: str, key: dict) -> Optional[ValidationReport]:
+        entry = self.__entries.get(name)
+        if entry is None or entry["key"] != key:
+            return None
+        try:
+            return report_from_dict(entry["report"])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, name: str, key: dict, report: ValidationReport):
+        self.__entries[name] = {"key": key, "report": report.to_dict()}
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.__entries, file)
+        os.replace(temporary, self.path)
+
+
+def default_cache_path(package_name: str) -> str:
+    return os.path.join(import_module(package_name).__path__[0], "__pycache__", CACHE_FILE)
+
+
+def cached_validate_submissions(names: List[str], package_name: str="turtle_programs", workers: Optional[int]=None, time_limit: float=2, calls: int=100, cache_path: Optional[str]=None) -> Dict[str, ValidationReport]:
+    cache = ValidationCache(cache_path if cache_path is not None else default_cache_path(package_name))
+    package_path = import_module(package_name).__path__[0]
+    version = engine_version()
+    reports: Dict[str, ValidationReport] = {}
+    keys: Dict[str, dict] = {}
+    stale: List[str] = []
+    for name in names:
+        keys[name] = cache.key(os.path.join(package_path, name + ".py"), version, calls, time_limit)
+        report = cache.get(name, keys[name])
+        if report is None:
+            stale.append(name)
+        else:
+            reports[name] = report
+    if stale:
+        print("Validating", len(stale), "new or changed submissions (", len(reports), "cached )")
+        for name, report in validate_submissions(stale, package_name, workers, time_limit, calls).items():
+            reports[name] = report
+            cache.put(name, keys[name], report)
+        try:
+            cache.save()
+        except OSError as e:
+            print("Validation cache failsafe triggered (", e, ")")
+    return {name: reports[name] for name in names}
@@ -0,0 +1,147 @@
+from collections import deque
+from sys import getswitchinterval
+from threading import Thread, Event, Lock, get_ident
+from time import monotonic
+
+try:
+    from time import pthread_getcpuclockid, clock_gettime
+except ImportError:
+    pthread_getcpuclockid = None
+from typing import Dict, Deque, Optional
+
+try:
+    import ctypes
+    set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+except (ImportError, AttributeError):
+    set_async_exc = None
+
+
+# a turn that blocks without using cpu time is still interrupted after this many budgets of wall time,
+# plus one GIL switch interval for every other open turn it may have to wait behind
+WALL_BUDGETS = 20
+
+
+class TurnBudgetExceeded(BaseException):
+    pass
+
+
+def thread_clock(thread_id: int) -> Optional[int]:
+    if pthread_getcpuclockid is None:
+        return None
+    try:
+        return pthread_getcpuclockid(thread_id)
+    except OSError:
+        return None
+
+
+class TurnDeadline:
+    def __init__(self, turtle, thread_id: int, deadline: float):
+        self.turtle = turtle
+        self.thread_id: int = thread_id
+        self.deadline: float = deadline
+        self.started: float = monotonic()
+        self.finished: bool = False
+        self.expired: bool = False
+        # with hundreds of turtle threads a turn can spend most of its wall time waiting for the GIL,
+        # so where the platform allows it the budget is charged in cpu time of the turtle's own thread
+        self.clock: Optional[int] = thread_clock(thread_id)
+        self.cpu_started: float = clock_gettime(self.clock) if self.clock is not None else 0.0
+
+    def cpu_used(self) -> Optional[float]:
+        if self.clock is None:
+            return None
+        try:
+            return clock_gettime(self.clock) - self.cpu_started
+        except OSError:
+            return None
+
+
+class Watchdog:
+    def __init__(self, turn_budget_ms: float=50, max_skipped_turns: int=3):
+        self.turn_budget: float = turn_budget_ms / 1000
+        self.max_skipped_turns: int = max_skipped_turns
+        self.skipped_turns: Dict[object, int] = {}
+        self.__turns: Dict[object, TurnDeadline] = {}
+        self.__deadlines: Deque[TurnDeadline] = deque()
+        self.__lock: Lock = Lock()
+        self.__armed: Event = Event()
+        self.__idle: bool = False
+        self.__stop_event: Event = Event()
+        self.__thread: Thread = Thread(target=self.__run)
+        self.__thread.daemon = True
+        if set_async_exc is None:
+            print("ctypes.pythonapi is not available, watchdog failsafe triggered (slow turns are skipped but not interrupted)")
+
+    def start(self):
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+        self.__armed.set()
+
+    def begin_turn(self, turtle):
+        if turtle in self.__turns:
+            return
+        turn = TurnDeadline(turtle, get_ident(), monotonic() + self.turn_budget)
+        self.__turns[turtle] = turn
+        self.__deadlines.append(turn)
+        if self.__idle:
+            self.__armed.set()
+
+    def end_turn(self, turtle) -> bool:
+        with self.__lock:
+            turn = self.__turns.get(turtle)
+            if turn is None:
+                return True
+            # finished is set before the turn is removed, so __expire can never interrupt a turn nobody will end
+            turn.finished = True
+            del self.__turns[turtle]
+            if turn.expired and set_async_exc is not None:
+                # the turn ended on its own after all, drop the interrupt if it is still pending
+                set_async_exc(ctypes.c_ulong(turn.thread_id), None)
+        return not turn.expired
+
+    def wall_limit(self) -> float:
+        return WALL_BUDGETS * self.turn_budget + len(self.__turns) * getswitchinterval()
+
+    def exhausted(self, turtle) -> bool:
+        return self.skipped_turns.get(turtle, 0) >= self.max_skipped_turns
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            if not self.__deadlines:
+                self.__idle = True
+                if not self.__deadlines:
+                    self.__armed.wait()
+                self.__armed.clear()
+                self.__idle = False
+                continue
+            # deadlines are checked in batches, so an overrun is caught at most a quarter of the budget late
+            remaining = self.__deadlines[0].deadline - monotonic()
+            if remaining > 0:
+                self.__stop_event.wait(max(remaining, self.turn_budget / 4))
+                continue
+            turn = self.__deadlines.popleft()
+            if turn.finished:
+                continue
+            cpu_used = turn.cpu_used()
+            if cpu_used is None and turn.clock is not None:
+                # the turtle's thread is gone, there is nothing left to interrupt
+                continue
+            if cpu_used is not None and cpu_used < self.turn_budget and not turn.expired and monotonic() - turn.started < self.wall_limit():
+                turn.deadline = monotonic() + max(self.turn_budget - cpu_used, self.turn_budget / 4)
+                self.__deadlines.append(turn)
+                continue
+            self.__expire(turn)
+
+    def __expire(self, turn: TurnDeadline):
+        with self.__lock:
+            if turn.finished or self.__turns.get(turn.turtle) is not turn:
+                return
+            if not turn.expired:
+                turn.expired = True
+                self.skipped_turns[turn.turtle] = self.skipped_turns.get(turn.turtle, 0) + 1
+            if set_async_exc is not None:
+                set_async_exc(ctypes.c_ulong(turn.thread_id), ctypes.py_object(TurnBudgetExceeded))
+            turn.deadline = monotonic() + self.turn_budget
+            self.__deadlines.append(turn)
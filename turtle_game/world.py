@@ -1,8 +1,11 @@
+from array import array
 from random import random
-from turtle import screensize, Screen
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Optional
 
 from turtle_game.competition_turtle import CompetitionTurtle
+from turtle_game.neighbor_lists import category_of
+from turtle_game.relative_location import RelativeLocations
+from turtle_game.spatial_index import SpatialIndex
 from turtle_game.world_dimensions import WorldDimensions
 
 
@@ -13,11 +16,9 @@ class World:
         self.prey: List[CompetitionTurtle] = []
         self.predators: List[CompetitionTurtle] = []
         self.__predator_kill_radius: int = predator_kill_radius
-        screensize(int(self.world_dimensions.width()), int(self.world_dimensions.height()))
-        Screen().clear()
-        if background:
-            pass
-            # Screen().bgpic("background.png")
+        self.background: bool = background
+        self.__spatial_index: Optional[SpatialIndex] = None
+        self.__query_cache: Dict[tuple, object] = {}
 
     def is_in_bounds(self, turtle: CompetitionTurtle):
         x=turtle.position()[0]
@@ -32,9 +33,48 @@ class World:
     def predator_kill_radius(self) -> int:
         return self.__predator_kill_radius
 
+    def begin_tick(self, spatial_index: Optional[SpatialIndex]=None):
+        self.__spatial_index = spatial_index
+        self.__query_cache = {}
 
+    def __index(self) -> SpatialIndex:
+        if self.__spatial_index is None:
+            spatial_index = SpatialIndex(self.__predator_kill_radius)
+            spatial_index.rebuild(self.turtles)
+            self.__spatial_index = spatial_index
+        return self.__spatial_index
 
+    def __matches(self, turtle: CompetitionTurtle, kind: Optional[int]):
+        return lambda other: other is not turtle and other.is_alive() and (kind is None or category_of(turtle, other) == kind)
 
+    def __relative_locations(self, turtle: CompetitionTurtle, found: List[Tuple[float, CompetitionTurtle]]) -> RelativeLocations:
+        found.sort(key=lambda entry: entry[0])
+        return RelativeLocations(array('d', [turtle.angle(other) for distance, other in found]), array('d', [distance for distance, other in found]))
 
+    def nearby(self, turtle: CompetitionTurtle, radius: float, kind: Optional[int]=None) -> RelativeLocations:
+        key = ("nearby", turtle, radius, kind)
+        locations = self.__query_cache.get(key)
+        if locations is None:
+            x, y = turtle.position()
+            locations = self.__relative_locations(turtle, self.__index().within(x, y, radius, self.__matches(turtle, kind)))
+            self.__query_cache[key] = locations
+        return locations
 
+    def k_nearest(self, turtle: CompetitionTurtle, k: int, kind: Optional[int]=None) -> RelativeLocations:
+        key = ("k_nearest", turtle, k, kind)
+        locations = self.__query_cache.get(key)
+        if locations is None:
+            x, y = turtle.position()
+            locations = self.__relative_locations(turtle, self.__index().k_nearest(x, y, k, self.__matches(turtle, kind)))
+            self.__query_cache[key] = locations
+        return locations
 
+    def count_in_region(self, rect: Tuple[float, float, float, float], team_name: Optional[str]=None, is_prey: Optional[bool]=None) -> int:
+        key = ("count_in_region", tuple(rect), team_name, is_prey)
+        count = self.__query_cache.get(key)
+        if count is None:
+            min_x, min_y, max_x, max_y = rect
+            count = self.__index().count_in_rect(min(min_x, max_x), min(min_y, max_y), max(min_x, max_x), max(min_y, max_y),
+                                                 lambda other: other.is_alive() and (team_name is None or other.team_name() == team_name) and (is_prey is None or other.is_prey() == is_prey))
+            self.__query_cache[key] = count
+        return count